@@ -13,6 +13,12 @@ load_dotenv()
 SOLANA_RPC_URL = os.getenv('SOLANA_RPC_URL', 'https://api.mainnet-beta.solana.com')
 SOLANA_PRIVATE_KEY = os.getenv('SOLANA_PRIVATE_KEY')
 
+# RPC Endpoint Pool (kommagetrennt, Default: nur SOLANA_RPC_URL)
+# Reads gehen an den schnellsten gesunden Endpoint, bei Fehlern Failover auf den nächsten
+SOLANA_RPC_URLS = [url.strip() for url in os.getenv('SOLANA_RPC_URLS', SOLANA_RPC_URL).split(',') if url.strip()]
+RPC_HEALTH_CHECK_INTERVAL = float(os.getenv('RPC_HEALTH_CHECK_INTERVAL', '10'))
+RPC_HEDGE_READS = os.getenv('RPC_HEDGE_READS', 'false').lower() == 'true'
+
 # OpenRouter API Configuration
 OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
 OPENROUTER_BASE_URL = os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')
@@ -28,9 +34,65 @@ SCOUT_INTERVAL = int(os.getenv('SCOUT_INTERVAL', '300'))  # 5 Minuten
 # Watcher Configuration (in seconds)
 WATCHER_INTERVAL = int(os.getenv('WATCHER_INTERVAL', '3'))
 
+# Portfolio Mode: Watcher läuft parallel, Scout sucht weiter während Positionen offen sind
+PORTFOLIO_MODE = os.getenv('PORTFOLIO_MODE', 'false').lower() == 'true'
+MAX_OPEN_POSITIONS = int(os.getenv('MAX_OPEN_POSITIONS', '3'))
+
+# Positions-PnL wird im Speicher gehalten und max. alle N Sekunden gespeichert
+POSITION_FLUSH_INTERVAL = int(os.getenv('POSITION_FLUSH_INTERVAL', '30'))
+
 # Logging Configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
+# Storage Backend für Trades & Positionen: 'json' (Default) oder 'sqlite'
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'json').lower()
+
+# HTTP Transport (gemeinsamer Client mit Keep-Alive Pools, Timeouts in Sekunden)
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '3'))
+HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '15'))
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))
+HTTP2_ENABLED = os.getenv('HTTP2_ENABLED', 'false').lower() == 'true'
+
+# Mint Registry: Gültigkeit veränderlicher Mint-Daten (aktive Authorities, Supply) in Sekunden
+# Decimals und deaktivierte Authorities werden dauerhaft gecacht
+MINT_REGISTRY_TTL = int(os.getenv('MINT_REGISTRY_TTL', '600'))
+
+# Transaction Confirmation: Poll-Intervall für getSignatureStatuses und Fallback-Timeout (Sekunden)
+CONFIRMATION_POLL_INTERVAL = float(os.getenv('CONFIRMATION_POLL_INTERVAL', '0.5'))
+CONFIRMATION_TIMEOUT = int(os.getenv('CONFIRMATION_TIMEOUT', '90'))
+
+# Rebroadcast: gleiche signierte Transaction alle N Sekunden erneut senden bis Confirmation/Ablauf
+# BROADCAST_RPC_URLS: zusätzliche Endpoints (kommagetrennt), an die jeder Send ebenfalls geht
+REBROADCAST_INTERVAL = float(os.getenv('REBROADCAST_INTERVAL', '2'))
+BROADCAST_RPC_URLS = [url.strip() for url in os.getenv('BROADCAST_RPC_URLS', '').split(',') if url.strip()]
+
+# Quote Prefetch: Jupiter Quotes der Top-N Kandidaten während des LLM-Calls holen
+# und beim BUY wiederverwenden, solange sie jünger als QUOTE_TTL Sekunden sind
+QUOTE_PREFETCH_COUNT = int(os.getenv('QUOTE_PREFETCH_COUNT', '3'))
+QUOTE_TTL = float(os.getenv('QUOTE_TTL', '15'))
+
+# Exit Vorbereitung: Innerhalb von N Prozentpunkten vor SL/TP hält der Watcher Sell Quote
+# und unsignierte Swap Transaction bereit und baut sie alle EXIT_PREPARE_REFRESH Sekunden neu (0 = aus)
+EXIT_PREPARE_ZONE_PERCENT = float(os.getenv('EXIT_PREPARE_ZONE_PERCENT', '5'))
+EXIT_PREPARE_REFRESH = float(os.getenv('EXIT_PREPARE_REFRESH', '10'))
+
+# Priority Fees: Perzentil der getRecentPrioritizationFees-Kurve pro Dringlichkeit
+# (Stop-Loss Exits zahlen am meisten), Cache-Dauer der Kurve und Obergrenze in Micro-Lamports/CU
+PRIORITY_FEE_PERCENTILES = {
+    'buy': int(os.getenv('PRIORITY_FEE_PERCENTILE_BUY', '50')),
+    'sell': int(os.getenv('PRIORITY_FEE_PERCENTILE_SELL', '75')),
+    'stop_loss': int(os.getenv('PRIORITY_FEE_PERCENTILE_STOP_LOSS', '90'))
+}
+PRIORITY_FEE_CACHE_TTL = float(os.getenv('PRIORITY_FEE_CACHE_TTL', '10'))
+PRIORITY_FEE_MAX_MICRO_LAMPORTS = int(os.getenv('PRIORITY_FEE_MAX_MICRO_LAMPORTS', '5000000'))
+
+# Pair Change Cache: Pairs nach einem PASS erst erneut analysieren, wenn sich Liquidität,
+# Volumen oder Preis um mehr als X% bewegt haben - spätestens nach PAIR_CACHE_TTL Sekunden (0 = aus)
+PAIR_CACHE_LIQUIDITY_CHANGE = float(os.getenv('PAIR_CACHE_LIQUIDITY_CHANGE', '10'))
+PAIR_CACHE_VOLUME_CHANGE = float(os.getenv('PAIR_CACHE_VOLUME_CHANGE', '25'))
+PAIR_CACHE_PRICE_CHANGE = float(os.getenv('PAIR_CACHE_PRICE_CHANGE', '10'))
+PAIR_CACHE_TTL = float(os.getenv('PAIR_CACHE_TTL', '1800'))
+
 # Filter-Kriterien für Scout (Hard-Coded wie gefordert)
 MIN_LIQUIDITY_USD = 5000
 MIN_AGE_MINUTES = 15
@@ -41,7 +103,21 @@ JUPITER_API_KEY = os.getenv('JUPITER_API_KEY')
 JUPITER_API_URL = "https://api.jup.ag/swap/v1"
 
 # DexScreener API
-DEXSCREENER_API_URL = "https://api.dexscreener.com/latest"
+DEXSCREENER_BASE_URL = "https://api.dexscreener.com"
+DEXSCREENER_API_URL = f"{DEXSCREENER_BASE_URL}/latest"
+
+# Scout Discovery: Suchbegriffe (inkl. DEX-Namen) und Token-Feeds (Profile/Boosts) laufen parallel,
+# Quellen ohne Antwort innerhalb von SCOUT_TIME_BUDGET Sekunden werden für den Scan ignoriert
+SCOUT_SEARCH_TERMS = [
+    term.strip() for term in os.getenv('SCOUT_SEARCH_TERMS', 'SOL,raydium,pumpswap,meteora,orca').split(',')
+    if term.strip()
+]
+SCOUT_TOKEN_FEEDS = os.getenv('SCOUT_TOKEN_FEEDS', 'true').lower() == 'true'
+SCOUT_TIME_BUDGET = float(os.getenv('SCOUT_TIME_BUDGET', '8'))
+
+# Junge Pairs (< MIN_AGE_MINUTES) mit ausreichender Liquidität/Volumen werden vorgemerkt
+# und genau bei Erreichen des Mindestalters erneut geprüft (0 = aus)
+SCOUT_WATCHLIST_MAX = int(os.getenv('SCOUT_WATCHLIST_MAX', '100'))
 
 # Validierung der kritischen Konfigurationen
 def validate_config():
@@ -18,6 +18,7 @@ Flow: Scout → Analyst → Trader → Watcher (Loop)
 """
 
 import logging
+import signal
 import time
 import sys
 from datetime import datetime
@@ -27,6 +28,8 @@ from modules.scout import Scout
 from modules.analyst import Analyst
 from modules.trader import Trader
 from modules.watcher import Watcher
+from modules.trade_manager import trade_manager
+from modules.http_client import http_client
 
 
 # Logging Setup
@@ -70,6 +73,11 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
+def handle_sigterm(signum, frame):
+    """SIGTERM (z.B. Stop über Monitoring) wie Ctrl+C behandeln, damit Cleanup läuft"""
+    raise KeyboardInterrupt()
+
+
 def print_banner():
     """Zeigt den Startup Banner"""
     banner = """
@@ -88,6 +96,7 @@ def print_banner():
     🔍 Min Liquidität:     ${}
     📈 Min Volumen:        ${}
     ⏰ Min Alter:          {} Minuten
+    📂 Portfolio Mode:     {}
     """.format(
         config.SCOUT_INTERVAL,
         config.TRADE_AMOUNT_SOL,
@@ -95,11 +104,134 @@ def print_banner():
         config.TAKE_PROFIT_PERCENT,
         f"{config.MIN_LIQUIDITY_USD:,}",
         f"{config.MIN_VOLUME_USD:,}",
-        config.MIN_AGE_MINUTES
+        config.MIN_AGE_MINUTES,
+        f"AN (max {config.MAX_OPEN_POSITIONS} Positionen)" if config.PORTFOLIO_MODE else "AUS"
     )
     print(banner)
 
 
+def run_cycle(scout: Scout, analyst: Analyst, trader: Trader, watcher: Watcher, logger: logging.Logger):
+    """
+    Ein Durchlauf Scout -> Analyst -> Trader -> Watcher
+    
+    Kehrt bei jedem Abbruch (keine Pairs, PASS, Trade fehlgeschlagen) und nach
+    dem Trade zurück - Metriken und Wartezeit übernimmt der Main Loop.
+    """
+    # SCHRITT 1: SCOUT - Finde neue Opportunities
+    # Zwischen zwei Scans nur die gereiften Pairs der Watchlist erneut prüfen
+    if scout.scan_due(config.SCOUT_INTERVAL):
+        logger.info("📡 SCHRITT 1: Scout scannt nach neuen Pairs...")
+        pairs = scout.fetch_new_pairs()
+    else:
+        logger.info("📡 SCHRITT 1: Scout prüft gereifte Watchlist-Pairs...")
+        pairs = scout.fetch_matured_pairs()
+    
+    # Portfolio Mode: Tokens mit offener Position nicht erneut kaufen
+    if config.PORTFOLIO_MODE:
+        pairs = [p for p in pairs if not watcher.has_position(p.contract_address)]
+    
+    if not pairs:
+        logger.info("Keine Pairs gefunden die Filter erfüllen - warte bis nächster Scan")
+        return
+    
+    logger.info(f"Scout hat {len(pairs)} Pairs gefunden")
+    
+    # Security Checks für alle Kandidaten in einem Batch (vor dem LLM-Call)
+    logger.info("🛡️  Prüfe Mint/Freeze Authority aller Kandidaten...")
+    pairs = trader.security_checker.filter_safe_pairs(pairs)
+    
+    if not pairs:
+        logger.info("Kein Kandidat hat die Security Checks bestanden - warte bis nächster Scan")
+        return
+    
+    # Nur neue oder seit dem letzten PASS deutlich veränderte Pairs an das LLM
+    pairs = analyst.pair_cache.filter_changed(pairs)
+    
+    if not pairs:
+        logger.info("Keine neuen oder veränderten Pairs seit der letzten Analyse - warte bis nächster Scan")
+        return
+    
+    # Quotes der Top-Kandidaten laufen parallel zum LLM-Call
+    trader.prefetch_quotes(pairs)
+    
+    # SCHRITT 2: ANALYST - Analysiere mit KI
+    logger.info("🤖 SCHRITT 2: Analyst analysiert Pairs...")
+    decision = analyst.analyze_pairs(pairs)
+    
+    if not decision:
+        logger.info("Analyst empfiehlt: PASS - Keine Trading Opportunity")
+        return
+    
+    logger.info(f"Analyst empfiehlt: BUY {decision.pair.symbol}")
+    
+    # SCHRITT 3: TRADER - Führe Trade aus (mit Security Checks)
+    logger.info("💼 SCHRITT 3: Trader führt Trade aus...")
+    trade_result = trader.execute_trade(decision.pair, decision)
+    
+    if not trade_result:
+        logger.warning("Trade wurde nicht ausgeführt (Security Check oder Fehler)")
+        return
+    
+    logger.info(f"Trade erfolgreich für {trade_result['symbol']}\n")
+    
+    # SCHRITT 4: WATCHER - Überwache Position
+    logger.info("👁️  SCHRITT 4: Watcher überwacht Position...")
+    watcher.add_position(trade_result)
+    
+    if config.PORTFOLIO_MODE:
+        # Watcher-Thread übernimmt die Position, Scout läuft weiter
+        logger.info(
+            f"Position an Watcher übergeben "
+            f"({watcher.get_active_positions_count()}/{config.MAX_OPEN_POSITIONS} offen)\n"
+        )
+    else:
+        # Starte Position Monitoring (blockiert bis Exit)
+        logger.info("Starte kontinuierliches Monitoring...\n")
+        watcher.monitor_positions()
+        
+        logger.info("\nPosition geschlossen - Bereit für nächsten Trade\n")
+
+
+def log_metrics(analyst: Analyst, trader: Trader, logger: logging.Logger):
+    """Debug-Metriken (HTTP, RPC, Priority Fees, Pair Cache, Confirmations) am Ende jedes Loops"""
+    # API-Latenzen pro Host (gemeinsamer HTTP-Transport)
+    for host, metrics in http_client.get_metrics().items():
+        logger.debug(
+            f"HTTP {host}: p50 {metrics['p50_ms']}ms | p95 {metrics['p95_ms']}ms | "
+            f"{metrics['requests']} Requests, {metrics['errors']} Fehler"
+        )
+    
+    # RPC Endpoint Pool: Latenz, Fehlerquote und Gesundheit pro Endpoint
+    for endpoint in trader.rpc_client.get_stats():
+        logger.debug(
+            f"RPC {endpoint['url']}: {endpoint['latency_ms']}ms | "
+            f"Fehlerquote {endpoint['error_rate']:.1%} | "
+            f"{'gesund' if endpoint['healthy'] else 'UNGESUND'}"
+        )
+    
+    # Priority Fees: Landing Rate und Latenz pro Dringlichkeit
+    for urgency, fees in trader.fee_estimator.get_stats().items():
+        logger.debug(
+            f"Priority Fee {urgency}: Ø {fees['avg_micro_lamports']} µLamports/CU | "
+            f"Landing {fees['landing_rate']}% | Ø {fees['avg_latency_ms']}ms ({fees['count']} Trades)"
+        )
+    
+    # Pair Cache: Anteil unveränderter Pairs, die nicht erneut analysiert wurden
+    pair_cache = analyst.pair_cache.get_stats()
+    logger.debug(
+        f"Pair Cache: Skip-Rate {pair_cache['skip_rate']}% ({pair_cache['skipped']}/{pair_cache['seen']}) | "
+        f"{pair_cache['analyses_skipped']} LLM-Calls eingespart | {pair_cache['cached']} Snapshots"
+    )
+    
+    # Send-to-Confirm Latenz aller Buys/Sells
+    confirmations = trader.confirmation_tracker.get_stats()
+    logger.debug(
+        f"Confirmations: p50 {confirmations['p50_ms']}ms | p95 {confirmations['p95_ms']}ms | "
+        f"{confirmations['confirmed']} bestätigt, {confirmations['failed']} fehlgeschlagen, "
+        f"{confirmations['expired']} abgelaufen, {confirmations['pending']} ausstehend"
+    )
+
+
 def main():
     """
     Hauptloop des Trading Bots
@@ -110,8 +242,14 @@ def main():
     3. Trader führt Trade aus (mit Security Checks)
     4. Watcher überwacht Position bis Exit
     5. Loop wiederholt sich
+    
+    Im Portfolio Mode läuft der Watcher als eigener Thread und
+    Schritt 1-3 laufen weiter, bis MAX_OPEN_POSITIONS erreicht ist.
     """
     logger = setup_logging()
+    watcher = None
+    
+    signal.signal(signal.SIGTERM, handle_sigterm)
     
     try:
         print_banner()
@@ -121,6 +259,11 @@ def main():
         config.validate_config()
         logger.info("✓ Konfiguration OK")
         
+        # Trade-Speicher: Legacy-Migration + Statistik-Prüfung (nur im Bot, nie beim Import)
+        logger.info("Prüfe Trade-Speicher...")
+        trade_manager.prepare()
+        logger.info("✓ Trade-Speicher bereit")
+        
         # Initialisiere Module
         logger.info("Initialisiere Module...")
         scout = Scout()
@@ -129,6 +272,9 @@ def main():
         watcher = Watcher(trader)
         logger.info("✓ Alle Module initialisiert")
         
+        if config.PORTFOLIO_MODE:
+            watcher.start_background()
+        
         logger.info("=" * 70)
         logger.info("BOT GESTARTET - Bereit zum Trading")
         logger.info("=" * 70)
@@ -148,52 +294,26 @@ def main():
             logger.info("=" * 70)
             
             try:
-                # SCHRITT 1: SCOUT - Finde neue Opportunities
-                logger.info("📡 SCHRITT 1: Scout scannt nach neuen Pairs...")
-                pairs = scout.fetch_new_pairs()
+                # Portfolio Mode: Keine neuen Entries wenn Limit erreicht
+                if config.PORTFOLIO_MODE:
+                    open_positions = watcher.get_active_positions_count()
+                    
+                    if open_positions >= config.MAX_OPEN_POSITIONS:
+                        logger.info(
+                            f"Portfolio voll ({open_positions}/{config.MAX_OPEN_POSITIONS} Positionen) "
+                            f"- warte bis nächster Scan"
+                        )
+                        log_metrics(analyst, trader, logger)
+                        time.sleep(config.SCOUT_INTERVAL)
+                        continue
                 
-                if not pairs:
-                    logger.info("Keine Pairs gefunden die Filter erfüllen - warte bis nächster Scan")
-                    time.sleep(config.SCOUT_INTERVAL)
-                    continue
+                run_cycle(scout, analyst, trader, watcher, logger)
                 
-                logger.info(f"Scout hat {len(pairs)} Pairs gefunden")
+                # Metriken auf jedem Loop-Pfad (auch ohne Pairs, bei PASS oder fehlgeschlagenem Trade)
+                log_metrics(analyst, trader, logger)
                 
-                # SCHRITT 2: ANALYST - Analysiere mit KI
-                logger.info("🤖 SCHRITT 2: Analyst analysiert Pairs...")
-                recommended_pair = analyst.analyze_pairs(pairs)
-                
-                if not recommended_pair:
-                    logger.info("Analyst empfiehlt: PASS - Keine Trading Opportunity")
-                    time.sleep(config.SCOUT_INTERVAL)
-                    continue
-                
-                logger.info(f"Analyst empfiehlt: BUY {recommended_pair['symbol']}")
-                
-                # SCHRITT 3: TRADER - Führe Trade aus (mit Security Checks)
-                logger.info("💼 SCHRITT 3: Trader führt Trade aus...")
-                trade_result = trader.execute_trade(recommended_pair)
-                
-                if not trade_result:
-                    logger.warning("Trade wurde nicht ausgeführt (Security Check oder Fehler)")
-                    time.sleep(config.SCOUT_INTERVAL)
-                    continue
-                
-                logger.info(f"Trade erfolgreich für {trade_result['symbol']}\n")
-                
-                # SCHRITT 4: WATCHER - Überwache Position
-                logger.info("👁️  SCHRITT 4: Watcher überwacht Position...")
-                watcher.add_position(trade_result)
-                
-                # Starte Position Monitoring (blockiert bis Exit)
-                logger.info("Starte kontinuierliches Monitoring...\n")
-                watcher.monitor_positions()
-                
-                logger.info("\nPosition geschlossen - Bereit für nächsten Trade\n")
-                
-                # Kurze Pause vor nächstem Loop
-                logger.info(f"Warte {config.SCOUT_INTERVAL} Sekunden bis nächster Scout-Run...")
-                time.sleep(config.SCOUT_INTERVAL)
+                # Kurze Pause vor nächstem Loop (kürzer, wenn ein Watchlist-Pair vorher reif wird)
+                scout.wait_for_next_scan(config.SCOUT_INTERVAL)
                 
             except KeyboardInterrupt:
                 logger.info("\n⚠️  Bot wird gestoppt (Ctrl+C erkannt)...")
@@ -223,8 +343,19 @@ def main():
         # Cleanup
         logger.info("\nBot Shutdown abgeschlossen")
         
+        if watcher:
+            watcher.stop()
+            watcher.trader.broadcaster.stop()
+            watcher.trader.confirmation_tracker.stop()
+            watcher.trader.rpc_client.close()
+            watcher.trader.quote_cache.close()
+        
+        # Ausstehende Positions-Updates speichern (Write-Behind)
+        trade_manager.close()
+        http_client.close()
+        
         # Zeige noch offene Positionen
-        if watcher.get_active_positions_count() > 0:
+        if watcher and watcher.get_active_positions_count() > 0:
             logger.warning(
                 f"⚠️  ACHTUNG: {watcher.get_active_positions_count()} "
                 f"Position(en) noch offen!"
@@ -1,11 +1,26 @@
 """
 Modules Package
 Enthält alle 4 Trading-Bot Module
+
+Die Module werden erst beim Zugriff importiert: Leser wie das Monitoring
+importieren einzelne Submodule (rpc_pool, trade_manager), ohne dabei Trader
+und Watcher samt Trade-Speicher des Bots zu laden.
 """
 
-from modules.scout import Scout
-from modules.analyst import Analyst
-from modules.trader import Trader
-from modules.watcher import Watcher
+import importlib
+
+_LAZY_EXPORTS = {
+    'Scout': 'modules.scout',
+    'Analyst': 'modules.analyst',
+    'Trader': 'modules.trader',
+    'Watcher': 'modules.watcher'
+}
 
 __all__ = ['Scout', 'Analyst', 'Trader', 'Watcher']
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
@@ -5,12 +5,17 @@ Nutzt OpenRouter API für KI-basierte Trading-Entscheidungen
 
 import logging
 import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from openai import OpenAI
 import config
+from modules.pair import Decision, Pair
+from modules.pair_cache import PairChangeCache
 
 logger = logging.getLogger(__name__)
 
+# Max. Pairs pro LLM-Prompt
+MAX_PAIRS_PER_ANALYSIS = 10
+
 
 class Analyst:
     """
@@ -37,7 +42,17 @@ class Analyst:
         # Empfohlenes Modell für Trading-Analyse
         self.model = "anthropic/claude-3.5-sonnet"
         
-    def analyze_pairs(self, pairs: List[Dict]) -> Optional[Dict]:
+        # Letzter analysierter Snapshot + Urteil pro Pair (nur Veränderte erneut analysieren)
+        self.pair_cache = PairChangeCache(
+            thresholds={
+                'liquidity': config.PAIR_CACHE_LIQUIDITY_CHANGE,
+                'volume': config.PAIR_CACHE_VOLUME_CHANGE,
+                'price': config.PAIR_CACHE_PRICE_CHANGE
+            },
+            ttl=config.PAIR_CACHE_TTL
+        )
+        
+    def analyze_pairs(self, pairs: List[Pair]) -> Optional[Decision]:
         """
         Analysiert eine Liste von Pairs und gibt das beste zurück
         
@@ -45,7 +60,7 @@ class Analyst:
             pairs: Liste von Pairs vom Scout
             
         Returns:
-            Optional[Dict]: Das beste Pair mit BUY Signal oder None
+            Optional[Decision]: BUY-Entscheidung für das beste Pair oder None
         """
         if not pairs:
             logger.info("Analyst: Keine Pairs zur Analyse vorhanden")
@@ -79,17 +94,24 @@ class Analyst:
             logger.info(f"Analyst LLM Response: {decision[:200]}...")
             
             # Extrahiere Entscheidung
-            result = self._parse_decision(decision, pairs)
+            verdict, result = self._parse_decision(decision, pairs)
+            
+            # Nur ein ausdrückliches PASS darf unveränderte Pairs künftig überspringen
+            # (nicht bei Parse-Fehlern oder unbrauchbarem BUY)
+            if verdict == 'PASS':
+                self.pair_cache.record(pairs[:MAX_PAIRS_PER_ANALYSIS])
             
             if result:
                 logger.info(
-                    f"Analyst Empfehlung: BUY {result['symbol']} | "
-                    f"CA: {result['contract_address']} | "
-                    f"Confidence: {result['llm_decision']['confidence']}% | "
-                    f"Risk Score: {result['llm_decision']['risk_score']}/10"
+                    f"Analyst Empfehlung: BUY {result.pair.symbol} | "
+                    f"CA: {result.pair.contract_address} | "
+                    f"Confidence: {result.confidence}% | "
+                    f"Risk Score: {result.risk_score}/10"
                 )
-            else:
+            elif verdict == 'PASS':
                 logger.info("Analyst Empfehlung: PASS - Keine geeigneten Opportunities")
+            else:
+                logger.warning("Analyst Antwort nicht verwertbar - kein Trade")
             
             return result
             
@@ -122,7 +144,7 @@ Output Format (JSON only):
   "confidence": 1-100
 }"""
     
-    def _create_analysis_prompt(self, pairs: List[Dict]) -> str:
+    def _create_analysis_prompt(self, pairs: List[Pair]) -> str:
         """
         Erstellt den Analysis Prompt mit Pair-Daten im JSON-Format
         
@@ -133,21 +155,7 @@ Output Format (JSON only):
             str: Formatierter Prompt mit JSON-Daten
         """
         # Erstelle saubere JSON-Struktur für LLM
-        data_json = []
-        
-        for pair in pairs[:10]:  # Max 10 Pairs zur Analyse
-            data_json.append({
-                "token_address": pair['contract_address'],
-                "symbol": pair['symbol'],
-                "name": pair['name'],
-                "liquidity_usd": pair['liquidity_usd'],
-                "volume_24h": pair['volume_24h'],
-                "price_usd": pair['price_usd'],
-                "price_change_24h": pair['price_change_24h'],
-                "market_cap": pair['market_cap'],
-                "dex": pair['dex'],
-                "volume_to_liquidity_ratio": pair['volume_24h'] / pair['liquidity_usd'] if pair['liquidity_usd'] > 0 else 0
-            })
+        data_json = [pair.to_prompt() for pair in pairs[:MAX_PAIRS_PER_ANALYSIS]]
         
         # Konvertiere zu JSON String
         import json
@@ -158,7 +166,7 @@ Output Format (JSON only):
         
         return prompt
     
-    def _parse_decision(self, decision_text: str, pairs: List[Dict]) -> Optional[Dict]:
+    def _parse_decision(self, decision_text: str, pairs: List[Pair]) -> Tuple[Optional[str], Optional[Decision]]:
         """
         Parsed die LLM Entscheidung (neues Memero-Core Format)
         
@@ -167,7 +175,10 @@ Output Format (JSON only):
             pairs: Original Pairs Liste
             
         Returns:
-            Optional[Dict]: Pair mit Trading-Entscheidung oder None
+            Tuple[Optional[str], Optional[Decision]]:
+                ('BUY', Decision) bei gültigem BUY,
+                ('PASS', None) wenn das LLM ausdrücklich PASS geantwortet hat,
+                (None, None) bei Parse-Fehler oder BUY ohne/mit unbekannter Token Address
         """
         try:
             # Versuche JSON zu extrahieren
@@ -177,15 +188,20 @@ Output Format (JSON only):
             
             if start_idx == -1 or end_idx == 0:
                 logger.warning("Keine JSON Struktur in LLM Response gefunden")
-                return None
+                return None, None
             
             json_str = decision_text[start_idx:end_idx]
             decision_data = json.loads(json_str)
             
-            # Prüfe ob BUY Signal
-            if decision_data.get('decision', '').upper() != 'BUY':
+            verdict = str(decision_data.get('decision', '')).strip().upper()
+            
+            if verdict == 'PASS':
                 logger.info(f"LLM Entscheidung: PASS - {decision_data.get('reasoning', 'Keine Begründung')}")
-                return None
+                return 'PASS', None
+            
+            if verdict != 'BUY':
+                logger.warning(f"Unbekannte LLM Entscheidung: {decision_data.get('decision')!r}")
+                return None, None
             
             # Hole selected_token_address (neues Format)
             selected_token_address = decision_data.get('selected_token_address', '').strip()
@@ -196,32 +212,33 @@ Output Format (JSON only):
             
             if not selected_token_address:
                 logger.warning("LLM hat BUY signalisiert aber keine Token Address angegeben")
-                return None
+                return None, None
             
             # Suche das Pair in der Original Liste
             for pair in pairs:
-                if pair['contract_address'].lower() == selected_token_address.lower():
-                    # Füge LLM Analyse hinzu (neues Format)
-                    pair['llm_decision'] = {
-                        'confidence': decision_data.get('confidence', 50),  # 1-100
-                        'reasoning': decision_data.get('reasoning', ''),
-                        'risk_score': decision_data.get('risk_score', 5)  # 1-10
-                    }
+                if pair.contract_address.lower() == selected_token_address.lower():
+                    # LLM Analyse als eigener Record (das Pair bleibt unverändert)
+                    result = Decision(
+                        pair,
+                        confidence=decision_data.get('confidence', 50),  # 1-100
+                        reasoning=decision_data.get('reasoning', ''),
+                        risk_score=decision_data.get('risk_score', 5)  # 1-10
+                    )
                     
                     logger.info(
-                        f"LLM Analyse: Confidence={pair['llm_decision']['confidence']}%, "
-                        f"Risk={pair['llm_decision']['risk_score']}/10"
+                        f"LLM Analyse: Confidence={result.confidence}%, "
+                        f"Risk={result.risk_score}/10"
                     )
                     
-                    return pair
+                    return 'BUY', result
             
             logger.warning(f"LLM empfohlene Token Address {selected_token_address} nicht in Pair Liste gefunden")
-            return None
+            return None, None
             
         except json.JSONDecodeError as e:
             logger.error(f"Fehler beim Parsen der LLM JSON Response: {e}")
             logger.debug(f"Response Text: {decision_text}")
-            return None
+            return None, None
         except Exception as e:
             logger.error(f"Unerwarteter Fehler beim Parsen der Decision: {e}", exc_info=True)
-            return None
+            return None, None
@@ -0,0 +1,376 @@
+"""
+MEMERO Trading Bot - Transaction Broadcaster
+Sendet signierte Transactions wiederholt, bis sie landen oder ablaufen
+
+Unter Last verwerfen RPC-Nodes und Leader einen Teil der Transactions
+stillschweigend. Ein einzelner Send endet dann erst nach dem Blockhash-Ablauf
+als Fehlschlag. Der TransactionBroadcaster sendet dieselbe signierte
+Transaction (gleiche Signatur -> kein Doppel-Trade möglich) im Abstand von
+rebroadcast_interval erneut, optional an mehrere RPC-Endpoints gleichzeitig,
+bis der ConfirmationTracker sie als bestätigt, fehlgeschlagen oder abgelaufen meldet.
+
+Landing Rate gegen den bisherigen Single-Send messen (lokaler Stand-in RPC):
+    python -m modules.broadcaster --drop-rate 0.7 --count 50
+"""
+
+import argparse
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from solana.rpc.types import TxOpts
+from solders.signature import Signature
+from solders.transaction_status import TransactionConfirmationStatus
+
+from modules.confirmation import ConfirmationTracker
+
+logger = logging.getLogger(__name__)
+
+# Schlaf-Granularität des Rebroadcast-Threads relativ zum Intervall
+TICK_FRACTION = 0.25
+
+
+class InflightTransaction:
+    """
+    Gesendete Transaction, die bis zur Confirmation erneut gesendet wird
+    """
+    
+    def __init__(self, raw: bytes, signature: Signature, next_send_at: float):
+        self.raw = raw
+        self.signature = signature
+        self.next_send_at = next_send_at
+        self.attempts = 1
+        self.done = False
+
+
+class TransactionBroadcaster:
+    """
+    Sendet signierte Transactions an einen oder mehrere RPC-Endpoints und
+    wiederholt den Send in einem Hintergrund-Thread bis zur Confirmation
+    """
+    
+    def __init__(
+        self,
+        rpc_client,
+        confirmation_tracker: ConfirmationTracker,
+        extra_clients: Optional[List] = None,
+        rebroadcast_interval: float = 2.0,
+        max_attempts: Optional[int] = None
+    ):
+        """
+        Args:
+            rpc_client: Primärer RPC Client (solana.rpc.api.Client)
+            confirmation_tracker: Gemeinsamer ConfirmationTracker
+            extra_clients: Zusätzliche RPC Clients, an die jeder Send ebenfalls geht
+            rebroadcast_interval: Abstand zwischen zwei Sends derselben Transaction (Sekunden)
+            max_attempts: Obergrenze für Sends pro Transaction (None = bis zum Ablauf, 1 = Single-Send)
+        """
+        self.clients = [rpc_client] + list(extra_clients or [])
+        self.confirmation_tracker = confirmation_tracker
+        self.rebroadcast_interval = rebroadcast_interval
+        self.max_attempts = max_attempts
+        
+        # skip_preflight: Simulation kostet einen Round Trip pro Send
+        self.tx_opts = TxOpts(skip_preflight=True, preflight_commitment="confirmed")
+        
+        self._inflight: Dict[str, InflightTransaction] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        
+        # Mehrere Endpoints parallel bedienen: ein langsamer Endpoint verzögert die anderen nicht
+        self._executor = ThreadPoolExecutor(max_workers=len(self.clients), thread_name_prefix='tx-send') \
+            if len(self.clients) > 1 else None
+    
+    def send(self, signed_tx, last_valid_block_height: Optional[int] = None) -> Future:
+        """
+        Sendet eine signierte Transaction und meldet sie beim ConfirmationTracker an
+        
+        Args:
+            signed_tx: Signierte VersionedTransaction
+            last_valid_block_height: Ab dieser Block Height wird nicht mehr gesendet
+        
+        Returns:
+            Future: Ergebnis des ConfirmationTrackers, ergänzt um attempts
+                    (Anzahl Sends) - slot ist der Landing Slot
+        
+        Raises:
+            Exception: Wenn der erste Send an keinem Endpoint angenommen wurde
+        """
+        raw = bytes(signed_tx)
+        signature = signed_tx.signatures[0]
+        
+        sent_at = time.monotonic()
+        # Wirft den letzten Fehler, wenn kein Endpoint den ersten Send annimmt
+        self._broadcast(raw, first=True)
+        
+        inflight = InflightTransaction(raw, signature, sent_at + self.rebroadcast_interval)
+        result_future = Future()
+        
+        tracker_future = self.confirmation_tracker.track(
+            signature,
+            last_valid_block_height=last_valid_block_height,
+            sent_at=sent_at
+        )
+        
+        if self.max_attempts != 1:
+            with self._lock:
+                self._inflight[str(signature)] = inflight
+            
+            self._ensure_running()
+        
+        tracker_future.add_done_callback(lambda f: self._finish(inflight, f, result_future))
+        
+        return result_future
+    
+    def _finish(self, inflight: InflightTransaction, tracker_future: Future, result_future: Future):
+        with self._lock:
+            inflight.done = True
+            self._inflight.pop(str(inflight.signature), None)
+        
+        result = dict(tracker_future.result(), attempts=inflight.attempts)
+        
+        if result['confirmed'] and inflight.attempts > 1:
+            logger.info(
+                f"Transaction {result['signature']} nach {inflight.attempts} Sends "
+                f"in Slot {result['slot']} gelandet"
+            )
+        
+        result_future.set_result(result)
+    
+    def _broadcast(self, raw: bytes, first: bool = False) -> int:
+        """
+        Sendet die Transaction an alle Endpoints (bei mehreren parallel)
+        
+        Returns:
+            int: Anzahl Endpoints, die den Send angenommen haben
+        
+        Raises:
+            Exception: Letzter Send-Fehler, wenn first und kein Endpoint angenommen hat
+        """
+        if self._executor is None:
+            errors = [self._send_to(self.clients[0], raw)]
+        else:
+            futures = [self._executor.submit(self._send_to, client, raw) for client in self.clients]
+            errors = [future.result() for future in futures]
+        
+        accepted = sum(1 for error in errors if error is None)
+        
+        if first and not accepted:
+            raise errors[-1]
+        
+        return accepted
+    
+    def _send_to(self, client, raw: bytes) -> Optional[Exception]:
+        """
+        Returns:
+            Optional[Exception]: None wenn der Endpoint den Send angenommen hat
+        """
+        try:
+            client.send_raw_transaction(raw, opts=self.tx_opts)
+            return None
+        except Exception as e:
+            # Beim Rebroadcast normal (z.B. "already processed")
+            logger.debug(f"Send an RPC-Endpoint fehlgeschlagen: {e}")
+            return e
+    
+    def inflight_count(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+    
+    # ========================================================================
+    # REBROADCAST THREAD
+    # ========================================================================
+    
+    def _ensure_running(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='tx-broadcaster', daemon=True)
+            self._thread.start()
+        
+        self._wakeup.set()
+    
+    def stop(self, timeout: float = 5):
+        self._stop_event.set()
+        self._wakeup.set()
+        
+        if self._thread is not None:
+            self._thread.join(timeout)
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+    
+    def _run(self):
+        while not self._stop_event.is_set():
+            if not self.inflight_count():
+                # Nichts unterwegs -> schlafen bis send() aufgerufen wird
+                self._wakeup.clear()
+                if not self.inflight_count():
+                    self._wakeup.wait()
+                continue
+            
+            now = time.monotonic()
+            
+            with self._lock:
+                due = [
+                    t for t in self._inflight.values()
+                    if not t.done and now >= t.next_send_at
+                    and (self.max_attempts is None or t.attempts < self.max_attempts)
+                ]
+            
+            for inflight in due:
+                self._broadcast(inflight.raw)
+                
+                with self._lock:
+                    inflight.attempts += 1
+                    inflight.next_send_at = now + self.rebroadcast_interval
+            
+            self._stop_event.wait(self.rebroadcast_interval * TICK_FRACTION)
+
+
+# ============================================================================
+# STAND-IN RPC (Landing-Rate Messung)
+# ============================================================================
+
+class DroppingRpc:
+    """
+    Lokaler Stand-in für solana.rpc.api.Client, der einen Anteil der Sends verwirft
+    
+    Die Block Height läuft mit block_time Sekunden pro Block. Angenommene Sends
+    landen land_delay_blocks später. Unterstützt genau die Calls, die
+    TransactionBroadcaster und ConfirmationTracker verwenden.
+    """
+    
+    def __init__(
+        self,
+        drop_rate: float,
+        block_time: float = 0.02,
+        land_delay_blocks: int = 2,
+        seed: Optional[int] = None
+    ):
+        self.drop_rate = drop_rate
+        self.block_time = block_time
+        self.land_delay_blocks = land_delay_blocks
+        self.sends = 0
+        
+        self._random = random.Random(seed)
+        self._landed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+    
+    def block_height(self) -> int:
+        return int((time.monotonic() - self._started_at) / self.block_time)
+    
+    def send_raw_transaction(self, raw: bytes, opts=None):
+        # Wire-Format: Anzahl Signaturen (compact-u16) gefolgt von der ersten Signatur
+        signature = Signature.from_bytes(raw[1:65])
+        
+        with self._lock:
+            self.sends += 1
+            
+            if str(signature) not in self._landed and self._random.random() >= self.drop_rate:
+                self._landed[str(signature)] = self.block_height() + self.land_delay_blocks
+        
+        return SimpleNamespace(value=signature)
+    
+    def get_signature_statuses(self, signatures: List[Signature]):
+        height = self.block_height()
+        
+        with self._lock:
+            slots = [self._landed.get(str(s)) for s in signatures]
+        
+        return SimpleNamespace(value=[
+            SimpleNamespace(slot=slot, err=None, confirmation_status=TransactionConfirmationStatus.Confirmed)
+            if slot is not None and height >= slot else None
+            for slot in slots
+        ])
+    
+    def get_block_height(self):
+        return SimpleNamespace(value=self.block_height())
+
+
+class _StandInTransaction:
+    """Minimale signierte Transaction für den Stand-in RPC"""
+    
+    def __init__(self):
+        self.signatures = [Signature.new_unique()]
+    
+    def __bytes__(self) -> bytes:
+        return b'\x01' + bytes(self.signatures[0])
+
+
+def measure_landing_rate(
+    drop_rate: float,
+    count: int,
+    max_attempts: Optional[int],
+    block_time: float = 0.02,
+    expiry_blocks: int = 150,
+    seed: Optional[int] = None
+) -> Dict:
+    """
+    Sendet count Transactions über den Stand-in RPC und misst, wie viele landen
+    
+    Zeit ist gegenüber Mainnet komprimiert: Rebroadcast alle 5 Blöcke
+    (entspricht ~2s bei 400ms Slots), Ablauf nach expiry_blocks.
+    
+    Returns:
+        Dict: landed, expired, landing_rate, sends, avg_attempts, avg_latency_ms
+    """
+    rpc = DroppingRpc(drop_rate, block_time=block_time, seed=seed)
+    tracker = ConfirmationTracker(rpc, poll_interval=block_time * 2, timeout=expiry_blocks * block_time * 2)
+    broadcaster = TransactionBroadcaster(
+        rpc, tracker, rebroadcast_interval=block_time * 5, max_attempts=max_attempts
+    )
+    
+    try:
+        futures = [
+            broadcaster.send(_StandInTransaction(), last_valid_block_height=rpc.block_height() + expiry_blocks)
+            for _ in range(count)
+        ]
+        wait(futures)
+        results = [f.result() for f in futures]
+    finally:
+        broadcaster.stop()
+        tracker.stop()
+    
+    landed = [r for r in results if r['confirmed']]
+    
+    return {
+        'landed': len(landed),
+        'expired': sum(1 for r in results if r['status'] == 'expired'),
+        'landing_rate': round(len(landed) / count * 100, 1) if count else 0.0,
+        'sends': rpc.sends,
+        'avg_attempts': round(sum(r['attempts'] for r in results) / count, 1) if count else 0.0,
+        'avg_latency_ms': round(sum(r['latency_ms'] for r in landed) / len(landed), 1) if landed else 0.0
+    }
+
+
+def main():
+    """Vergleicht Single-Send und Rebroadcast gegen den Stand-in RPC"""
+    parser = argparse.ArgumentParser(description='Landing Rate: Single-Send vs. Rebroadcast')
+    parser.add_argument('--drop-rate', type=float, default=0.7, help='Anteil verworfener Sends (0-1)')
+    parser.add_argument('--count', type=int, default=50, help='Anzahl Transactions pro Modus')
+    parser.add_argument('--seed', type=int, default=None)
+    
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)-8s | %(message)s')
+    
+    for label, max_attempts in (('Single-Send', 1), ('Rebroadcast', None)):
+        result = measure_landing_rate(args.drop_rate, args.count, max_attempts, seed=args.seed)
+        print(
+            f"{label:<12} | gelandet {result['landed']}/{args.count} ({result['landing_rate']}%) | "
+            f"Sends: {result['sends']} (Ø {result['avg_attempts']}) | "
+            f"Ø Latenz: {result['avg_latency_ms']} ms"
+        )
+
+
+if __name__ == '__main__':
+    main()
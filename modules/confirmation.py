@@ -0,0 +1,288 @@
+"""
+MEMERO Trading Bot - Transaction Confirmation
+Nicht-blockierendes Warten auf Transaction Confirmations
+
+Statt rpc_client.confirm_transaction() pro Signatur (blockiert den Aufrufer
+und pollt jede Signatur einzeln) nimmt der ConfirmationTracker Signaturen
+entgegen und fragt ALLE ausstehenden mit einem getSignatureStatuses Call ab.
+Jede Signatur bekommt ein Future (optional mit Callback), das aufgelöst wird,
+sobald sie bestätigt ist, fehlschlägt oder ihr Blockhash abgelaufen ist.
+Buys und Sells können so gleichzeitig unterwegs sein.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+from solders.signature import Signature
+from solders.transaction_status import TransactionConfirmationStatus
+
+logger = logging.getLogger(__name__)
+
+# Limit des RPC-Calls getSignatureStatuses
+SIGNATURE_STATUSES_BATCH_SIZE = 256
+
+# Anzahl gemerkter Ergebnisse für Latenz-Statistik
+LATENCY_HISTORY_SIZE = 200
+
+# Platzhalter in _fetch_statuses: Status-Abfrage fehlgeschlagen (None = Signatur noch unbekannt)
+_STATUS_UNAVAILABLE = object()
+
+ACCEPTED_STATUSES = {
+    'confirmed': (TransactionConfirmationStatus.Confirmed, TransactionConfirmationStatus.Finalized),
+    'finalized': (TransactionConfirmationStatus.Finalized,)
+}
+
+
+class PendingSignature:
+    """
+    Gesendete, noch nicht bestätigte Transaction
+    """
+    
+    def __init__(
+        self,
+        signature: Signature,
+        sent_at: float,
+        last_valid_block_height: Optional[int],
+        future: Future
+    ):
+        self.signature = signature
+        self.sent_at = sent_at
+        self.last_valid_block_height = last_valid_block_height
+        self.future = future
+
+
+class ConfirmationTracker:
+    """
+    Pollt den Status aller ausstehenden Signaturen gebündelt in einem Hintergrund-Thread
+    """
+    
+    def __init__(
+        self,
+        rpc_client,
+        poll_interval: float = 0.5,
+        timeout: float = 90,
+        commitment: str = 'confirmed'
+    ):
+        """
+        Args:
+            rpc_client: solana.rpc.api.Client (wird mit dem Trader geteilt)
+            poll_interval: Abstand zwischen zwei getSignatureStatuses Calls (Sekunden)
+            timeout: Fallback-Ablauf ohne lastValidBlockHeight (Sekunden)
+            commitment: 'confirmed' oder 'finalized'
+        """
+        self.rpc_client = rpc_client
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.accepted_statuses = ACCEPTED_STATUSES[commitment]
+        
+        self._pending: Dict[str, PendingSignature] = {}
+        self._results = deque(maxlen=LATENCY_HISTORY_SIZE)
+        self._counts = {'confirmed': 0, 'failed': 0, 'expired': 0}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def track(
+        self,
+        signature,
+        last_valid_block_height: Optional[int] = None,
+        callback: Optional[Callable[[Dict], None]] = None,
+        sent_at: Optional[float] = None
+    ) -> Future:
+        """
+        Meldet eine gesendete Transaction zur Bestätigung an
+        
+        Args:
+            signature: Signature (solders) oder Base58 String
+            last_valid_block_height: Ab dieser Block Height ist die Transaction abgelaufen
+            callback: Wird mit dem Ergebnis aufgerufen (im Tracker-Thread)
+            sent_at: time.monotonic() beim Senden (Default: jetzt)
+            
+        Returns:
+            Future: Ergebnis-Dict mit signature, status ('confirmed', 'failed', 'expired'),
+                    confirmed, error, slot, latency_ms
+        """
+        if isinstance(signature, str):
+            signature = Signature.from_string(signature)
+            
+        future = Future()
+        
+        if callback is not None:
+            future.add_done_callback(lambda f: self._run_callback(callback, f))
+            
+        pending = PendingSignature(
+            signature,
+            sent_at if sent_at is not None else time.monotonic(),
+            last_valid_block_height,
+            future
+        )
+        
+        with self._lock:
+            self._pending[str(signature)] = pending
+            
+        self._ensure_running()
+        self._wakeup.set()
+        
+        return future
+    
+    @staticmethod
+    def _run_callback(callback: Callable[[Dict], None], future: Future):
+        try:
+            callback(future.result())
+        except Exception as e:
+            logger.error(f"Fehler im Confirmation Callback: {e}", exc_info=True)
+    
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+    
+    def get_stats(self) -> Dict:
+        """
+        Returns:
+            Dict: pending, confirmed, failed, expired, avg/p50/p95 Latenz (ms)
+                  und die letzten Ergebnisse pro Signatur (recent)
+        """
+        with self._lock:
+            results = list(self._results)
+            stats = dict(self._counts, pending=len(self._pending))
+            
+        latencies = sorted(r['latency_ms'] for r in results if r['confirmed'])
+        
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+            
+        stats.update({
+            'avg_ms': round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+            'p50_ms': round(percentile(0.50), 1),
+            'p95_ms': round(percentile(0.95), 1),
+            'recent': results[-20:]
+        })
+        
+        return stats
+        
+    # ========================================================================
+    # TRACKER THREAD
+    # ========================================================================
+    
+    def _ensure_running(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+                
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='confirmation-tracker', daemon=True)
+            self._thread.start()
+    
+    def stop(self, timeout: float = 5):
+        self._stop_event.set()
+        self._wakeup.set()
+        
+        if self._thread is not None:
+            self._thread.join(timeout)
+    
+    def _run(self):
+        while not self._stop_event.is_set():
+            if not self.pending_count():
+                # Nichts unterwegs -> schlafen bis track() aufgerufen wird
+                self._wakeup.clear()
+                if not self.pending_count():
+                    self._wakeup.wait()
+                continue
+                
+            try:
+                self._poll()
+            except Exception as e:
+                logger.error(f"Confirmation Tracker Fehler: {e}", exc_info=True)
+                
+            self._stop_event.wait(self.poll_interval)
+    
+    def _poll(self):
+        with self._lock:
+            pending = list(self._pending.values())
+            
+        # Block Height VOR den Statuses: eine danach bestätigte Signatur darf
+        # nicht als abgelaufen gelten, weil die Höhe erst später gemessen wurde
+        block_height = self._fetch_block_height(pending)
+        statuses = self._fetch_statuses([p.signature for p in pending])
+        now = time.monotonic()
+        
+        for p, status in zip(pending, statuses):
+            if status is _STATUS_UNAVAILABLE:
+                # Ohne Status kein Blockhash-Ablauf - nur das Wall-Clock Timeout greift,
+                # damit ein dauerhaft ausgefallener RPC keine Future ewig offen lässt
+                if now - p.sent_at > self.timeout:
+                    self._resolve(p, 'expired', now, error=f'Timeout nach {self.timeout}s (Status nicht abrufbar)')
+                continue
+                
+            if status is not None and status.err is not None:
+                self._resolve(p, 'failed', now, error=str(status.err), slot=status.slot)
+                
+            elif status is not None and status.confirmation_status in self.accepted_statuses:
+                self._resolve(p, 'confirmed', now, slot=status.slot)
+                
+            elif (
+                p.last_valid_block_height is not None
+                and block_height is not None
+                and block_height > p.last_valid_block_height
+            ):
+                self._resolve(p, 'expired', now, error='Blockhash abgelaufen')
+                
+            elif now - p.sent_at > self.timeout:
+                self._resolve(p, 'expired', now, error=f'Timeout nach {self.timeout}s')
+    
+    def _fetch_statuses(self, signatures: List[Signature]) -> List:
+        statuses = []
+        
+        for i in range(0, len(signatures), SIGNATURE_STATUSES_BATCH_SIZE):
+            batch = signatures[i:i + SIGNATURE_STATUSES_BATCH_SIZE]
+            
+            try:
+                statuses.extend(self.rpc_client.get_signature_statuses(batch).value)
+            except Exception as e:
+                # Kein Status -> bleibt in diesem Poll ausstehend (auch kein Ablauf)
+                logger.warning(f"getSignatureStatuses fehlgeschlagen ({len(batch)} Signaturen): {e}")
+                statuses.extend([_STATUS_UNAVAILABLE] * len(batch))
+                
+        return statuses
+    
+    def _fetch_block_height(self, pending: List[PendingSignature]) -> Optional[int]:
+        if all(p.last_valid_block_height is None for p in pending):
+            return None
+            
+        try:
+            return self.rpc_client.get_block_height().value
+        except Exception as e:
+            logger.warning(f"getBlockHeight fehlgeschlagen: {e}")
+            return None
+    
+    def _resolve(
+        self,
+        pending: PendingSignature,
+        status: str,
+        now: float,
+        error: Optional[str] = None,
+        slot: Optional[int] = None
+    ):
+        result = {
+            'signature': str(pending.signature),
+            'status': status,
+            'confirmed': status == 'confirmed',
+            'error': error,
+            'slot': slot,
+            'latency_ms': round((now - pending.sent_at) * 1000, 1)
+        }
+        
+        with self._lock:
+            self._pending.pop(result['signature'], None)
+            self._results.append(result)
+            self._counts[status] += 1
+            
+        # Future außerhalb des Locks auflösen (Callbacks dürfen track() aufrufen)
+        pending.future.set_result(result)
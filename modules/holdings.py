@@ -0,0 +1,110 @@
+"""
+MEMERO Trading Bot - Wallet Holdings
+In-Memory Index der Token-Bestände des Wallets, gepflegt aus bestätigten Fills
+
+Statt nach jedem Trade getTokenAccountsByOwner abzufragen (und mit dem
+gerundeten uiAmount zu rechnen), liest der Trader die tatsächlich gelandeten
+Mengen aus pre/postTokenBalances der bestätigten Transaction (ein
+getTransaction Call). Beträge sind immer raw (kleinste Einheit) + decimals.
+Der SOL-Erlös kommt aus pre/postBalances derselben Transaction.
+"""
+
+import threading
+from typing import Dict, Optional
+
+
+def token_fill_from_meta(meta, owner: str, mint: str) -> Optional[Dict]:
+    """
+    Berechnet die Token-Bewegung eines Wallets aus den Transaction-Metadaten
+
+    Args:
+        meta: UiTransactionStatusMeta der bestätigten Transaction
+        owner: Wallet Address (Owner der Token Accounts)
+        mint: Token Mint Address
+
+    Returns:
+        Optional[Dict]: amount (raw Delta, negativ bei Verkauf), decimals,
+                        post_amount (raw Bestand nach der Transaction) oder
+                        None wenn der Mint in der Transaction nicht vorkommt
+    """
+    def total(balances):
+        amount = 0
+        decimals = None
+
+        for balance in balances or []:
+            if str(balance.mint) == mint and str(balance.owner) == owner:
+                amount += int(balance.ui_token_amount.amount)
+                decimals = balance.ui_token_amount.decimals
+
+        return amount, decimals
+
+    pre_amount, pre_decimals = total(meta.pre_token_balances)
+    post_amount, post_decimals = total(meta.post_token_balances)
+    decimals = post_decimals if post_decimals is not None else pre_decimals
+
+    if decimals is None:
+        return None
+
+    return {
+        'amount': post_amount - pre_amount,
+        'decimals': decimals,
+        'post_amount': post_amount
+    }
+
+
+def sol_change_from_meta(meta, account_index: int = 0) -> Optional[int]:
+    """
+    Lamport-Änderung eines Accounts aus den Transaction-Metadaten
+
+    Args:
+        meta: UiTransactionStatusMeta der bestätigten Transaction
+        account_index: Index in den Account Keys (0 = Fee Payer = Wallet)
+
+    Returns:
+        Optional[int]: post - pre in Lamports (netto nach Fee, negativ beim Kauf)
+                       oder None wenn die Balances fehlen
+    """
+    pre_balances = meta.pre_balances or []
+    post_balances = meta.post_balances or []
+
+    if account_index >= min(len(pre_balances), len(post_balances)):
+        return None
+
+    return post_balances[account_index] - pre_balances[account_index]
+
+
+class WalletHoldings:
+    """
+    Thread-sicherer Token-Bestand pro Mint (raw + decimals)
+    """
+
+    def __init__(self):
+        self._holdings: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def get(self, mint: str) -> Optional[Dict]:
+        """
+        Returns:
+            Optional[Dict]: amount (raw), ui_amount, decimals oder None wenn unbekannt
+        """
+        with self._lock:
+            holding = self._holdings.get(mint)
+
+        if holding is None:
+            return None
+
+        return {
+            'amount': holding['amount'],
+            'ui_amount': holding['amount'] / 10 ** holding['decimals'],
+            'decimals': holding['decimals']
+        }
+
+    def set(self, mint: str, amount: int, decimals: int):
+        """
+        Setzt den Bestand (z.B. post_amount eines Fills oder ein RPC-Read)
+        """
+        with self._lock:
+            if amount > 0:
+                self._holdings[mint] = {'amount': amount, 'decimals': decimals}
+            else:
+                self._holdings.pop(mint, None)
@@ -0,0 +1,292 @@
+"""
+MEMERO Trading Bot - HTTP Transport
+Gemeinsamer HTTP-Client für alle ausgehenden API-Calls (DexScreener, Jupiter, RPC)
+
+- Keep-Alive Connection Pools pro Host: kein neuer TCP/TLS Handshake pro Request
+- Einheitliche Timeouts (HTTP_CONNECT_TIMEOUT / HTTP_READ_TIMEOUT)
+- Optional HTTP/2 über httpx (HTTP2_ENABLED=true, benötigt das Paket 'h2')
+- Latenz-Metriken pro Host (get_metrics())
+
+Fehler werden immer als requests.exceptions.* geworfen, unabhängig vom
+Transport - bestehende except-Blöcke der Module funktionieren unverändert.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Anzahl Latenz-Messwerte pro Host für Perzentile
+LATENCY_WINDOW = 200
+
+DEFAULT_HEADERS = {'User-Agent': 'Memero Bot/1.0'}
+
+
+class HttpxResponse:
+    """
+    Dünner Adapter: httpx.Response mit requests-kompatiblem raise_for_status()
+    """
+    
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+    
+    @property
+    def text(self) -> str:
+        return self._response.text
+    
+    @property
+    def content(self) -> bytes:
+        return self._response.content
+    
+    def json(self):
+        return self._response.json()
+    
+    def raise_for_status(self):
+        if 400 <= self.status_code < 600:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}",
+                response=self
+            )
+
+
+class HostMetrics:
+    """
+    Latenz-Statistik eines Hosts
+    """
+    
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.last_ms = 0.0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+    
+    def record(self, elapsed_ms: float, error: bool):
+        self.requests += 1
+        self.last_ms = elapsed_ms
+        self.latencies.append(elapsed_ms)
+        
+        if error:
+            self.errors += 1
+    
+    def summary(self) -> Dict:
+        latencies = sorted(self.latencies)
+        
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+            
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'last_ms': round(self.last_ms, 1),
+            'avg_ms': round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+            'p50_ms': round(percentile(0.50), 1),
+            'p95_ms': round(percentile(0.95), 1)
+        }
+
+
+class HttpClient:
+    """
+    Geteilter, thread-sicherer HTTP-Client mit Connection Pooling
+    """
+    
+    def __init__(
+        self,
+        connect_timeout: float = 3,
+        read_timeout: float = 15,
+        pool_size: int = 10,
+        http2: bool = False
+    ):
+        """
+        Args:
+            connect_timeout: Timeout für den Verbindungsaufbau (Sekunden)
+            read_timeout: Timeout für die Antwort (Sekunden)
+            pool_size: Max. offene Verbindungen pro Host
+            http2: HTTP/2 über httpx verwenden (Fallback auf requests wenn 'h2' fehlt)
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.pool_size = pool_size
+        
+        self._metrics: Dict[str, HostMetrics] = {}
+        self._metrics_lock = threading.Lock()
+        self._insecure_warning_disabled = False
+        
+        self._session = requests.Session()
+        self._session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # httpx Clients je verify-Einstellung (verify ist bei httpx pro Client fix)
+        self._httpx_clients = {}
+        self._httpx_lock = threading.Lock()
+        self.http2 = http2 and self._http2_available()
+    
+    @staticmethod
+    def _http2_available() -> bool:
+        try:
+            import httpx  # noqa: F401
+            import h2  # noqa: F401
+            return True
+        except ImportError:
+            logger.warning("HTTP2_ENABLED gesetzt, aber 'h2' ist nicht installiert - nutze HTTP/1.1 Keep-Alive")
+            return False
+            
+    # ========================================================================
+    # REQUESTS
+    # ========================================================================
+    
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+    
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+    
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json=None,
+        headers: Optional[Dict] = None,
+        timeout=None,
+        verify: bool = True
+    ):
+        """
+        Führt einen Request über den gepoolten Transport aus
+        
+        Args:
+            method: HTTP Methode
+            url: Ziel-URL
+            params: Query Parameter
+            json: JSON Body
+            headers: Zusätzliche Header
+            timeout: Abweichender Timeout (Default: einheitliche Timeouts)
+            verify: SSL Zertifikat prüfen
+            
+        Returns:
+            Response (requests.Response oder kompatibler httpx Adapter)
+            
+        Raises:
+            requests.exceptions.RequestException: Bei Netzwerk-/Timeout-Fehlern
+        """
+        timeout = timeout or self.timeout
+        
+        if not verify:
+            self._disable_insecure_warning()
+            
+        host = urlsplit(url).netloc
+        start = time.perf_counter()
+        error = True
+        
+        try:
+            if self.http2:
+                response = self._httpx_request(method, url, params, json, headers, timeout, verify)
+            else:
+                response = self._session.request(
+                    method, url, params=params, json=json, headers=headers,
+                    timeout=timeout, verify=verify
+                )
+                
+            error = response.status_code >= 500
+            return response
+            
+        finally:
+            self._record(host, (time.perf_counter() - start) * 1000, error)
+    
+    def _httpx_request(self, method, url, params, json, headers, timeout, verify):
+        import httpx
+        
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+        else:
+            connect_timeout = read_timeout = timeout
+            
+        try:
+            response = self._httpx_client(verify).request(
+                method, url, params=params, json=json, headers=headers,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+            
+        return HttpxResponse(response)
+    
+    def _httpx_client(self, verify: bool):
+        with self._httpx_lock:
+            client = self._httpx_clients.get(verify)
+            
+            if client is None:
+                import httpx
+                client = httpx.Client(
+                    http2=True,
+                    verify=verify,
+                    headers=DEFAULT_HEADERS,
+                    limits=httpx.Limits(
+                        max_connections=self.pool_size * 4,
+                        max_keepalive_connections=self.pool_size
+                    )
+                )
+                self._httpx_clients[verify] = client
+                
+            return client
+    
+    def _disable_insecure_warning(self):
+        # verify=False nur für Jupiter (siehe trader.py) - Warnung nicht bei jedem Call loggen
+        if not self._insecure_warning_disabled:
+            import urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            self._insecure_warning_disabled = True
+            
+    # ========================================================================
+    # METRIKEN
+    # ========================================================================
+    
+    def _record(self, host: str, elapsed_ms: float, error: bool):
+        with self._metrics_lock:
+            metrics = self._metrics.get(host)
+            
+            if metrics is None:
+                metrics = self._metrics[host] = HostMetrics()
+                
+            metrics.record(elapsed_ms, error)
+    
+    def get_metrics(self) -> Dict[str, Dict]:
+        """
+        Returns:
+            Dict: host -> requests, errors, last_ms, avg_ms, p50_ms, p95_ms
+        """
+        with self._metrics_lock:
+            return {host: metrics.summary() for host, metrics in self._metrics.items()}
+    
+    def close(self):
+        self._session.close()
+        
+        with self._httpx_lock:
+            for client in self._httpx_clients.values():
+                client.close()
+            self._httpx_clients.clear()
+
+
+# Singleton Instance
+http_client = HttpClient(
+    connect_timeout=config.HTTP_CONNECT_TIMEOUT,
+    read_timeout=config.HTTP_READ_TIMEOUT,
+    pool_size=config.HTTP_POOL_SIZE,
+    http2=config.HTTP2_ENABLED
+)
@@ -0,0 +1,53 @@
+"""
+MEMERO Trading Bot - Wartungs-Kommandos
+Werden manuell aufgerufen, NICHT vom laufenden Bot
+
+Beispiele:
+    python -m modules.maintenance compact
+    python -m modules.maintenance migrate-sqlite
+    python -m modules.maintenance rebuild-stats
+"""
+
+import argparse
+import logging
+
+from modules.storage import migrate_json_to_sqlite
+from modules.trade_manager import DATA_DIR, trade_manager
+
+
+def main():
+    """Wartungs-Kommandos für den Trade-Speicher"""
+    parser = argparse.ArgumentParser(description='MEMERO Trade-Speicher Wartung')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('compact', help='Versiegelte Journal-Segmente zusammenfassen')
+    subparsers.add_parser('migrate-sqlite', help='JSON-Daten einmalig nach memero.db übernehmen')
+    subparsers.add_parser('rebuild-stats', help='Trade-Statistiken komplett neu berechnen und vergleichen')
+    
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(levelname)-8s | %(message)s')
+    
+    if args.command == 'compact':
+        merged = trade_manager.compact_trades()
+        print(f"{merged} Segmente zusammengefasst")
+    
+    elif args.command == 'migrate-sqlite':
+        result = migrate_json_to_sqlite(DATA_DIR)
+        print(f"{result['trades']} Trades und {result['positions']} Positionen migriert")
+        print("Setze STORAGE_BACKEND=sqlite in .env und starte Bot & Monitoring neu")
+    
+    elif args.command == 'rebuild-stats':
+        result = trade_manager.rebuild_stats()
+        previous, rebuilt = result['previous'], result['rebuilt']
+        
+        differences = [key for key in rebuilt if previous.get(key) != rebuilt[key]]
+        
+        if differences:
+            print("Abweichungen gefunden (gespeichert -> neu berechnet):")
+            for key in differences:
+                print(f"  {key}: {previous.get(key)} -> {rebuilt[key]}")
+        else:
+            print("Trade-Statistiken stimmen mit der Historie überein")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""
+MEMERO Trading Bot - Mint Registry
+Persistenter Cache für Mint-Metadaten und Security-Verdicts (mint_registry.json)
+
+Was sich on-chain nie mehr ändert, wird dauerhaft gecacht:
+- decimals
+- deaktivierte (revoked) Mint- und Freeze-Authority - kann nie wieder gesetzt werden
+
+Veränderliche Fakten haben eine TTL (MINT_REGISTRY_TTL):
+- aktive Authorities (können noch deaktiviert werden)
+- Supply Snapshot
+
+Ein Token mit beiden Authorities deaktiviert ist damit dauerhaft "sicher" und
+Trader/Watcher sparen sich den RPC-Roundtrip im Buy- und Sell-Pfad.
+"""
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import config
+from modules.storage import atomic_write_json
+from modules.trade_manager import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+MINT_REGISTRY_FILE = DATA_DIR / 'mint_registry.json'
+
+
+class MintRegistry:
+    """
+    On-Disk Registry pro Mint Address
+    """
+    
+    def __init__(self, path: Path, ttl: float):
+        """
+        Args:
+            path: JSON-Datei der Registry
+            ttl: Gültigkeit veränderlicher Fakten in Sekunden
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._load()
+    
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"{self.path.name} nicht lesbar ({e}) - starte mit leerer Registry")
+            return {}
+    
+    def _save(self):
+        atomic_write_json(self.path, self._entries)
+        
+    # ========================================================================
+    # LESEN
+    # ========================================================================
+    
+    def get(self, mint: str) -> Optional[Dict]:
+        """
+        Returns:
+            Optional[Dict]: Kopie des gespeicherten Eintrags
+        """
+        with self._lock:
+            entry = self._entries.get(mint)
+            return dict(entry) if entry else None
+    
+    def get_decimals(self, mint: str) -> Optional[int]:
+        """
+        Returns:
+            Optional[int]: Decimals (dauerhaft gültig) oder None wenn unbekannt
+        """
+        with self._lock:
+            entry = self._entries.get(mint)
+            return entry.get('decimals') if entry else None
+    
+    def get_verdict(self, mint: str) -> Optional[Dict]:
+        """
+        Liefert das gecachte Security-Verdict, solange es gültig ist
+        
+        Returns:
+            Optional[Dict]: safe, reason, mint (wie modules.security.evaluate_mint)
+                            oder None wenn neu geprüft werden muss
+        """
+        with self._lock:
+            entry = self._entries.get(mint)
+            
+            if not entry or 'verdict' not in entry:
+                return None
+                
+            if not self._is_permanent(entry) and time.time() - entry['checked_at'] > self.ttl:
+                return None
+                
+            return {
+                'safe': entry['verdict']['safe'],
+                'reason': entry['verdict']['reason'],
+                'mint': {
+                    'mint_authority': entry['mint_authority'],
+                    'freeze_authority': entry['freeze_authority'],
+                    'supply': entry.get('supply'),
+                    'decimals': entry.get('decimals'),
+                    'is_initialized': True
+                }
+            }
+    
+    @staticmethod
+    def _is_permanent(entry: Dict) -> bool:
+        """Beide Authorities deaktiviert -> Verdict ändert sich nie mehr"""
+        return entry.get('mint_authority') is None and entry.get('freeze_authority') is None
+        
+    # ========================================================================
+    # SCHREIBEN
+    # ========================================================================
+    
+    def record_checks(self, results: Dict[str, Dict]):
+        """
+        Übernimmt Ergebnisse von SecurityChecker.check_tokens() (ein Schreibvorgang)
+        
+        Args:
+            results: mint -> {'safe', 'reason', 'mint'}
+        """
+        now = time.time()
+        changed = False
+        
+        with self._lock:
+            for address, result in results.items():
+                mint = result.get('mint')
+                
+                # Ohne Mint-Daten (RPC Fehler, ungültige Adresse) nichts cachen
+                if mint is None:
+                    continue
+                    
+                entry = self._entries.setdefault(address, {})
+                entry.update({
+                    'decimals': mint['decimals'],
+                    'supply': mint['supply'],
+                    'mint_authority': mint['mint_authority'],
+                    'freeze_authority': mint['freeze_authority'],
+                    'verdict': {'safe': result['safe'], 'reason': result['reason']},
+                    'checked_at': now
+                })
+                changed = True
+                
+            if changed:
+                self._save()
+    
+    def record_decimals(self, mint: str, decimals: int):
+        """
+        Speichert Decimals (z.B. aus einer Token-Balance Abfrage)
+        """
+        with self._lock:
+            entry = self._entries.setdefault(mint, {})
+            
+            if entry.get('decimals') == decimals:
+                return
+                
+            entry['decimals'] = decimals
+            self._save()
+
+
+# Singleton Instance
+mint_registry = MintRegistry(MINT_REGISTRY_FILE, ttl=config.MINT_REGISTRY_TTL)
@@ -0,0 +1,81 @@
+"""
+MEMERO Trading Bot - Pair Model
+Kompakte, unveränderliche Records für Pairs und Analyst-Entscheidungen
+
+Pairs liefen als lose Dicts (wiederholte String-Keys, pro Stufe erneut
+geparst) durch Scout, Analyst, Trader und Watcher und wurden unterwegs
+verändert (pair['llm_decision']). Der Scout erzeugt jetzt einmal einen
+typisierten Pair, die Entscheidung des Analysts ist ein eigener Decision Record.
+
+Beide sind NamedTuples: __slots__ = () und Tuple-Storage - kein __dict__ pro
+Instanz (~136 statt ~460 Bytes für das bisherige Dict), unveränderlich und
+so schnell erzeugt wie ein Dict, auch wenn der Scout tausende Pairs filtert.
+"""
+
+from typing import Dict, NamedTuple, Optional
+
+
+class Pair(NamedTuple):
+    """
+    Gefiltertes Solana Pair vom Scout (Zahlen bereits als float geparst)
+    """
+    
+    contract_address: str
+    symbol: Optional[str]
+    name: Optional[str]
+    liquidity_usd: float
+    volume_24h: float
+    price_usd: float
+    price_change_24h: float
+    market_cap: float
+    pair_address: Optional[str]
+    dex: Optional[str]
+    created_at: Optional[int]
+    url: str = ''
+    
+    @property
+    def volume_to_liquidity_ratio(self) -> float:
+        return self.volume_24h / self.liquidity_usd if self.liquidity_usd > 0 else 0
+    
+    def to_dict(self) -> Dict:
+        return self._asdict()
+    
+    def to_prompt(self) -> Dict:
+        """
+        Returns:
+            Dict: Eintrag für den Analyst-Prompt (JSON)
+        """
+        return {
+            "token_address": self.contract_address,
+            "symbol": self.symbol,
+            "name": self.name,
+            "liquidity_usd": self.liquidity_usd,
+            "volume_24h": self.volume_24h,
+            "price_usd": self.price_usd,
+            "price_change_24h": self.price_change_24h,
+            "market_cap": self.market_cap,
+            "dex": self.dex,
+            "volume_to_liquidity_ratio": self.volume_to_liquidity_ratio
+        }
+
+
+class Decision(NamedTuple):
+    """
+    BUY-Entscheidung des Analysts für ein Pair
+    """
+    
+    pair: Pair
+    confidence: int = 50  # 1-100
+    reasoning: str = ''
+    risk_score: int = 5  # 1-10 (10 = sehr riskant)
+    
+    def to_trade_fields(self) -> Dict:
+        """
+        Returns:
+            Dict: confidence, risk_score, reasoning für den Trade Store
+        """
+        return {
+            'confidence': self.confidence,
+            'risk_score': self.risk_score,
+            'reasoning': self.reasoning
+        }
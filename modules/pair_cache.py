@@ -0,0 +1,128 @@
+"""
+MEMERO Trading Bot - Pair Change Cache
+Schickt nur neue oder deutlich veränderte Pairs an den Analyst
+
+Jeder Scan lieferte dem LLM bis zu 10 Pairs - meist dieselben wie im
+vorherigen Scan mit fast identischen Metriken, die der Analyst bereits mit
+PASS bewertet hatte. Der Cache merkt sich pro Contract Address den Snapshot
+(Liquidität, Volumen, Preis) des letzten PASS. Ein Pair
+wird erst wieder analysiert, wenn sich eine Metrik um mehr als die
+konfigurierte Schwelle bewegt hat oder der Snapshot älter als ttl ist.
+LLM-Calls skalieren so mit der Marktbewegung statt mit der Scan-Frequenz.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List
+
+from modules.pair import Pair
+
+logger = logging.getLogger(__name__)
+
+# Snapshot-Metrik -> Schwellen-Schlüssel
+TRACKED_METRICS = {
+    'liquidity_usd': 'liquidity',
+    'volume_24h': 'volume',
+    'price_usd': 'price'
+}
+
+
+class PairChangeCache:
+    """
+    Snapshot des letzten PASS pro Contract Address
+    """
+    
+    def __init__(self, thresholds: Dict[str, float], ttl: float = 1800):
+        """
+        Args:
+            thresholds: Relative Änderung in Prozent, ab der erneut analysiert wird,
+                        z.B. {'liquidity': 10, 'volume': 25, 'price': 10}
+            ttl: Spätestens nach ttl Sekunden wird ein Pair erneut analysiert (0 = Cache aus)
+        """
+        self.thresholds = thresholds
+        self.ttl = ttl
+        
+        self._entries: Dict[str, Dict] = {}
+        self._counts = {'seen': 0, 'forwarded': 0, 'skipped': 0, 'analyses_skipped': 0}
+        self._lock = threading.Lock()
+    
+    def filter_changed(self, pairs: List[Pair]) -> List[Pair]:
+        """
+        Returns:
+            List[Pair]: Pairs, die neu sind (auch nach BUY oder Parse-Fehler nie gespeichert)
+                        oder sich seit dem letzten PASS über eine Schwelle bewegt haben
+        """
+        if self.ttl <= 0:
+            return pairs
+        
+        now = time.monotonic()
+        changed = []
+        
+        with self._lock:
+            # Abgelaufene Snapshots verwerfen
+            for address in [a for a, e in self._entries.items() if now - e['analyzed_at'] >= self.ttl]:
+                del self._entries[address]
+            
+            for pair in pairs:
+                entry = self._entries.get(pair.contract_address)
+                
+                if entry is None or self._moved(entry['snapshot'], pair):
+                    changed.append(pair)
+            
+            skipped = len(pairs) - len(changed)
+            self._counts['seen'] += len(pairs)
+            self._counts['forwarded'] += len(changed)
+            self._counts['skipped'] += skipped
+            
+            if pairs and not changed:
+                self._counts['analyses_skipped'] += 1
+        
+        if skipped:
+            logger.info(f"Pair Cache: {skipped}/{len(pairs)} Pairs unverändert seit letztem PASS - übersprungen")
+        
+        return changed
+    
+    def record(self, analyzed_pairs: List[Pair]):
+        """
+        Speichert den Snapshot der an das LLM gesendeten Pairs nach einem PASS
+        
+        Nur PASS wird gecacht - nach einem BUY hält der Watcher die Position bzw.
+        der Portfolio Mode filtert das Pair, ein Snapshot wäre nutzlos.
+        
+        Args:
+            analyzed_pairs: Pairs im Prompt
+        """
+        now = time.monotonic()
+        
+        with self._lock:
+            for pair in analyzed_pairs:
+                self._entries[pair.contract_address] = {
+                    'snapshot': {metric: getattr(pair, metric) for metric in TRACKED_METRICS},
+                    'analyzed_at': now
+                }
+    
+    def _moved(self, snapshot: Dict, pair: Pair) -> bool:
+        for metric, threshold_key in TRACKED_METRICS.items():
+            previous = snapshot.get(metric)
+            current = getattr(pair, metric)
+            
+            if not previous or current is None:
+                return True
+            
+            if abs(current - previous) / abs(previous) * 100 >= self.thresholds[threshold_key]:
+                return True
+        
+        return False
+    
+    def get_stats(self) -> Dict:
+        """
+        Returns:
+            Dict: seen, forwarded, skipped, skip_rate (%), analyses_skipped (eingesparte LLM-Calls), cached
+        """
+        with self._lock:
+            stats = dict(self._counts, cached=len(self._entries))
+        
+        stats['skip_rate'] = round(stats['skipped'] / stats['seen'] * 100, 1) if stats['seen'] else 0.0
+        
+        return stats
@@ -0,0 +1,212 @@
+"""
+MEMERO Trading Bot - Priority Fee Estimator
+Compute Unit Price aus getRecentPrioritizationFees statt Jupiter 'auto'
+
+- Sampelt die Fees der letzten ~150 Slots für die beschriebenen Pool Accounts
+  der Jupiter Route und cached die Perzentil-Kurve kurz (PRIORITY_FEE_CACHE_TTL).
+  Der Token Mint eignet sich nicht: er wird kaum write-gelockt, die Kurve wäre
+  dann das globale Minimum (meist 0)
+- Dringlichkeit pro Trade-Art: Buys zahlen weniger als Sells,
+  Stop-Loss Exits am meisten (PRIORITY_FEE_PERCENTILES)
+- Jede gewählte Fee wird mit dem Confirmation-Ergebnis in
+  priority_fees.jsonl protokolliert, um die Perzentile aus Daten zu tunen
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from modules.trade_manager import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_FEE_LOG_FILE = DATA_DIR / 'priority_fees.jsonl'
+
+# Perzentile der Kurve, die gecacht werden
+CURVE_PERCENTILES = (25, 50, 75, 90, 95)
+
+# Anzahl gemerkter Fee-Ergebnisse für get_stats()
+FEE_HISTORY_SIZE = 200
+
+
+def route_accounts(quote_data: Dict) -> List[str]:
+    """
+    Returns:
+        List[str]: Pool Accounts (ammKey) der Jupiter Route - werden vom Swap write-gelockt
+    """
+    accounts = []
+    
+    for step in quote_data.get('routePlan') or []:
+        amm_key = (step.get('swapInfo') or {}).get('ammKey')
+        
+        if amm_key and amm_key not in accounts:
+            accounts.append(amm_key)
+    
+    return accounts
+
+
+class PriorityFeeEstimator:
+    """
+    Schätzt den Compute Unit Price (Micro-Lamports) pro Swap und Dringlichkeit
+    """
+    
+    def __init__(
+        self,
+        rpc_client,
+        percentiles: Dict[str, int],
+        cache_ttl: float = 10,
+        max_micro_lamports: int = 5_000_000,
+        log_path: Path = PRIORITY_FEE_LOG_FILE
+    ):
+        """
+        Args:
+            rpc_client: RpcPool (braucht request() für getRecentPrioritizationFees)
+            percentiles: Dringlichkeit -> Perzentil, z.B. {'buy': 50, 'sell': 75, 'stop_loss': 90}
+            cache_ttl: Gültigkeit einer Perzentil-Kurve (Sekunden)
+            max_micro_lamports: Obergrenze des Compute Unit Price
+            log_path: JSONL-Protokoll der gewählten Fees
+        """
+        self.rpc_client = rpc_client
+        self.percentiles = percentiles
+        self.cache_ttl = cache_ttl
+        self.max_micro_lamports = max_micro_lamports
+        self.log_path = Path(log_path)
+        
+        self._curves: Dict[tuple, tuple] = {}
+        self._results = deque(maxlen=FEE_HISTORY_SIZE)
+        self._lock = threading.Lock()
+    
+    def estimate(self, accounts: List[str], urgency: str) -> Optional[int]:
+        """
+        Args:
+            accounts: Writable Accounts des Swaps (Pool Accounts, siehe route_accounts)
+            urgency: Schlüssel aus percentiles ('buy', 'sell', 'stop_loss')
+        
+        Returns:
+            Optional[int]: Compute Unit Price in Micro-Lamports oder None (dann Jupiter 'auto')
+        """
+        curve = self.get_curve(accounts)
+        
+        if curve is None:
+            return None
+        
+        percentile = self.percentiles.get(urgency, 50)
+        nearest = min(curve, key=lambda p: abs(p - percentile))
+        
+        # 0 heißt nur "kein Wettbewerb in den Samples" - keine verlässliche Fee
+        if curve[nearest] <= 0:
+            return None
+        
+        return min(curve[nearest], self.max_micro_lamports)
+    
+    def swap_fee_params(self, accounts: List[str], urgency: str) -> Dict:
+        """
+        Returns:
+            Dict: Parameter für den Jupiter /swap Payload
+        """
+        fee = self.estimate(accounts, urgency)
+        
+        if fee is None:
+            return {'prioritizationFeeLamports': 'auto'}
+        
+        logger.info(f"Priority Fee ({urgency}): {fee:,} Micro-Lamports/CU")
+        return {'computeUnitPriceMicroLamports': fee}
+    
+    def get_curve(self, accounts: List[str]) -> Optional[Dict[int, int]]:
+        """
+        Returns:
+            Optional[Dict[int, int]]: Perzentil -> Micro-Lamports (gecacht für cache_ttl)
+                                      oder None ohne Accounts bzw. ohne Fee-Daten
+        """
+        if not accounts:
+            return None
+        
+        key = tuple(sorted(set(accounts)))
+        now = time.monotonic()
+        
+        with self._lock:
+            cached = self._curves.get(key)
+        
+        if cached and now - cached[1] < self.cache_ttl:
+            return cached[0]
+        
+        try:
+            samples = self.rpc_client.request('getRecentPrioritizationFees', [list(key)])
+        except Exception as e:
+            logger.warning(f"getRecentPrioritizationFees fehlgeschlagen: {e} - nutze Jupiter 'auto'")
+            return None
+        
+        fees = sorted(sample['prioritizationFee'] for sample in samples or [])
+        
+        # Nur Nullen = keine Daten (z.B. Account in keinem Slot write-gelockt)
+        if not fees or fees[-1] <= 0:
+            return None
+        
+        curve = {p: fees[min(len(fees) - 1, int(len(fees) * p / 100))] for p in CURVE_PERCENTILES}
+        
+        with self._lock:
+            # Abgelaufene Kurven verwerfen
+            for stale in [k for k, (_, fetched_at) in self._curves.items() if now - fetched_at >= self.cache_ttl]:
+                del self._curves[stale]
+            
+            self._curves[key] = (curve, now)
+        
+        return curve
+    
+    def record(self, urgency: str, swap_params: Dict, confirmation: Dict):
+        """
+        Protokolliert gewählte Fee und Confirmation-Ergebnis
+        
+        Args:
+            urgency: Dringlichkeit des Trades
+            swap_params: Ergebnis von swap_fee_params()
+            confirmation: Ergebnis des Broadcasters (confirmed, latency_ms, attempts, slot)
+        """
+        entry = {
+            'timestamp': time.time(),
+            'urgency': urgency,
+            'percentile': self.percentiles.get(urgency),
+            'micro_lamports': swap_params.get('computeUnitPriceMicroLamports'),
+            'status': confirmation['status'],
+            'latency_ms': confirmation['latency_ms'],
+            'attempts': confirmation.get('attempts'),
+            'slot': confirmation.get('slot')
+        }
+        
+        with self._lock:
+            self._results.append(entry)
+            
+            try:
+                with open(self.log_path, 'a') as f:
+                    f.write(json.dumps(entry) + '\n')
+            except OSError as e:
+                logger.warning(f"{self.log_path.name} nicht schreibbar: {e}")
+    
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Returns:
+            Dict: Pro Dringlichkeit Anzahl, Landing Rate, Ø Fee und Ø Latenz (ms)
+        """
+        with self._lock:
+            results = list(self._results)
+        
+        stats = {}
+        
+        for urgency in {r['urgency'] for r in results}:
+            entries = [r for r in results if r['urgency'] == urgency]
+            confirmed = [r for r in entries if r['status'] == 'confirmed']
+            fees = [r['micro_lamports'] for r in entries if r['micro_lamports'] is not None]
+            
+            stats[urgency] = {
+                'count': len(entries),
+                'landing_rate': round(len(confirmed) / len(entries) * 100, 1),
+                'avg_micro_lamports': round(sum(fees) / len(fees)) if fees else None,
+                'avg_latency_ms': round(sum(r['latency_ms'] for r in confirmed) / len(confirmed), 1)
+                if confirmed else 0.0
+            }
+        
+        return stats
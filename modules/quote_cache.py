@@ -0,0 +1,117 @@
+"""
+MEMERO Trading Bot - Quote Cache
+Spekulative Jupiter Quotes für die Top-Kandidaten, während der Analyst läuft
+
+Der Buy-Pfad war strikt sequentiell: LLM-Call -> /quote -> /swap -> Send.
+Der Trader fordert die Quotes der Top-Kandidaten jetzt schon parallel zum
+LLM-Call an. Empfiehlt der Analyst einen davon und ist der Quote noch frisch
+(QUOTE_TTL), spart der Buy einen kompletten Quote Round Trip.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class QuoteCache:
+    """
+    Holt Quotes im Hintergrund und hält sie für ttl Sekunden bereit
+    """
+    
+    def __init__(self, fetch_quote: Callable[[str], Optional[Dict]], ttl: float = 15, max_workers: int = 4):
+        """
+        Args:
+            fetch_quote: Holt einen Quote für eine Token Address (None bei Fehler)
+            ttl: Maximales Alter eines Quotes, der noch verwendet wird (Sekunden)
+            max_workers: Parallele Quote Requests
+        """
+        self.fetch_quote = fetch_quote
+        self.ttl = ttl
+        
+        self._quotes: Dict[str, tuple] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._counts = {'prefetched': 0, 'hits': 0, 'stale': 0, 'misses': 0}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='quote-prefetch')
+    
+    def prefetch(self, token_addresses: List[str]):
+        """
+        Startet Quote Requests für alle Tokens ohne frischen oder laufenden Quote (blockiert nicht)
+        """
+        now = time.monotonic()
+        
+        with self._lock:
+            # Abgelaufene Quotes verwerfen
+            for token_address in [t for t, (_, fetched_at) in self._quotes.items() if now - fetched_at > self.ttl]:
+                del self._quotes[token_address]
+            
+            todo = [t for t in token_addresses if t not in self._quotes and t not in self._inflight]
+            
+            for token_address in todo:
+                self._inflight[token_address] = self._executor.submit(self._fetch, token_address)
+        
+        if todo:
+            logger.debug(f"Prefetch Jupiter Quotes für {len(todo)} Kandidaten")
+    
+    def _fetch(self, token_address: str) -> Optional[Dict]:
+        try:
+            quote = self.fetch_quote(token_address)
+        except Exception as e:
+            logger.debug(f"Quote Prefetch für {token_address} fehlgeschlagen: {e}")
+            quote = None
+        
+        with self._lock:
+            self._inflight.pop(token_address, None)
+            
+            if quote is not None:
+                self._quotes[token_address] = (quote, time.monotonic())
+                self._counts['prefetched'] += 1
+        
+        return quote
+    
+    def take(self, token_address: str) -> Optional[Dict]:
+        """
+        Liefert den vorab geholten Quote, wenn er noch frisch ist (einmalig)
+        
+        Läuft der Prefetch noch, wird auf ihn gewartet - er ist dem Start
+        eines neuen Requests immer voraus.
+        
+        Returns:
+            Optional[Dict]: Jupiter Quote oder None (dann normal quoten)
+        """
+        with self._lock:
+            inflight = self._inflight.get(token_address)
+        
+        if inflight is not None:
+            inflight.result()
+        
+        with self._lock:
+            entry = self._quotes.pop(token_address, None)
+            
+            if entry is None:
+                self._counts['misses'] += 1
+                return None
+            
+            quote, fetched_at = entry
+            age = time.monotonic() - fetched_at
+            
+            if age > self.ttl:
+                self._counts['stale'] += 1
+                logger.info(f"Prefetched Quote zu alt ({age:.1f}s > {self.ttl}s) - hole neuen Quote")
+                return None
+            
+            self._counts['hits'] += 1
+        
+        logger.info(f"Verwende prefetched Jupiter Quote (Alter {age * 1000:.0f} ms)")
+        return quote
+    
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return dict(self._counts, cached=len(self._quotes), inflight=len(self._inflight))
+    
+    def close(self):
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,311 @@
+"""
+MEMERO Trading Bot - RPC Endpoint Pool
+Verteilt Solana RPC-Calls auf mehrere Endpoints (SOLANA_RPC_URLS)
+
+- Gleiches Interface wie solana.rpc.api.Client: jeder Client-Call (get_account_info,
+  get_multiple_accounts, send_raw_transaction, ...) wird an den Pool weitergereicht
+- Routing an den schnellsten gesunden Endpoint (gleitende Latenz + Fehlerquote)
+- Failover: schlägt ein Endpoint fehl, übernimmt der nächstbeste
+- Health Check im Hintergrund (getBlockHeight), Endpoints mit Fehler oder
+  zurückhängender Block Height werden bis zum nächsten erfolgreichen Check gemieden
+- Optional Hedging: kritische Reads gehen parallel an zwei Endpoints, die erste
+  Antwort gewinnt (RPC_HEDGE_READS=true)
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+from solana.rpc.api import Client
+
+from modules.http_client import http_client
+
+logger = logging.getLogger(__name__)
+
+# Gewicht neuer Messwerte in der gleitenden Latenz / Fehlerquote
+EWMA_ALPHA = 0.2
+
+# Fehlerquote 1.0 verdoppelt die effektive Latenz eines Endpoints
+ERROR_PENALTY = 1.0
+
+# Endpoints, deren Block Height mehr als N Blöcke hinter dem besten liegt, gelten als ungesund
+MAX_BLOCK_LAG = 50
+
+# Reads, auf die der Bot aktiv wartet (Security Checks, Confirmations, Exit Balance)
+HEDGED_METHODS = {
+    'get_account_info',
+    'get_multiple_accounts',
+    'get_signature_statuses',
+    'get_token_accounts_by_owner'
+}
+
+
+class RpcEndpoint:
+    """
+    Ein RPC-Endpoint mit gleitender Latenz und Fehlerquote
+    """
+    
+    def __init__(self, url: str, client):
+        self.url = url
+        self.client = client
+        self.healthy = True
+        self.latency_ms: Optional[float] = None
+        self.error_rate = 0.0
+        self.block_height: Optional[int] = None
+        self.requests = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+    
+    def record(self, elapsed_ms: float, error: Optional[Exception] = None):
+        self.requests += 1
+        self.error_rate += EWMA_ALPHA * ((1.0 if error else 0.0) - self.error_rate)
+        
+        if error:
+            self.errors += 1
+            self.last_error = str(error)
+            return
+        
+        if self.latency_ms is None:
+            self.latency_ms = elapsed_ms
+        else:
+            self.latency_ms += EWMA_ALPHA * (elapsed_ms - self.latency_ms)
+    
+    def score(self) -> float:
+        # Noch ungemessene Endpoints zuerst ausprobieren - außer sie haben bisher nur Fehler geliefert
+        if self.latency_ms is None:
+            return float('inf') if self.errors else 0.0
+            
+        return self.latency_ms * (1 + ERROR_PENALTY * self.error_rate)
+    
+    def summary(self) -> Dict:
+        return {
+            'url': self.url,
+            'healthy': self.healthy,
+            'latency_ms': round(self.latency_ms, 1) if self.latency_ms is not None else None,
+            'error_rate': round(self.error_rate, 3),
+            'block_height': self.block_height,
+            'requests': self.requests,
+            'errors': self.errors,
+            'last_error': self.last_error
+        }
+
+
+class RpcPool:
+    """
+    Drop-in Ersatz für solana.rpc.api.Client über mehrere Endpoints
+    """
+    
+    def __init__(
+        self,
+        urls: List[str],
+        health_check_interval: float = 10,
+        hedge_reads: bool = False,
+        client_factory=Client
+    ):
+        """
+        Args:
+            urls: RPC-Endpoints (der erste ist bis zur ersten Messung bevorzugt)
+            health_check_interval: Abstand der Health Checks (Sekunden, 0 = aus)
+            hedge_reads: HEDGED_METHODS parallel an zwei Endpoints senden
+            client_factory: Erzeugt den Client pro URL (Default: solana.rpc.api.Client)
+        """
+        if not urls:
+            raise ValueError("RpcPool benötigt mindestens einen Endpoint")
+        
+        self.endpoints = [RpcEndpoint(url, client_factory(url)) for url in urls]
+        self.hedge_reads = hedge_reads and len(self.endpoints) > 1
+        self.health_check_interval = health_check_interval
+        
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor = ThreadPoolExecutor(max_workers=2 * len(self.endpoints), thread_name_prefix='rpc-hedge') \
+            if self.hedge_reads else None
+        
+        # Mit nur einem Endpoint gibt es nichts zu routen -> kein zusätzlicher RPC-Traffic
+        if len(self.endpoints) > 1 and health_check_interval > 0:
+            self._thread = threading.Thread(target=self._run_health_checks, name='rpc-health', daemon=True)
+            self._thread.start()
+    
+    def __getattr__(self, name: str):
+        # Nur für Attribute, die der Pool selbst nicht hat -> Client-Methoden
+        if name.startswith('_') or 'endpoints' not in self.__dict__:
+            raise AttributeError(name)
+            
+        attribute = getattr(self.endpoints[0].client, name)
+        
+        if not callable(attribute):
+            return attribute
+        
+        def call(*args, **kwargs):
+            return self._call(name, args, kwargs)
+        
+        call.__name__ = name
+        return call
+    
+    def ranked_endpoints(self) -> List[RpcEndpoint]:
+        """
+        Returns:
+            List[RpcEndpoint]: Gesunde Endpoints nach Score, ungesunde als letzter Ausweg dahinter
+        """
+        with self._lock:
+            return sorted(self.endpoints, key=lambda e: (not e.healthy, e.score()))
+    
+    def get_stats(self) -> List[Dict]:
+        with self._lock:
+            return [endpoint.summary() for endpoint in self.endpoints]
+    
+    def close(self, timeout: float = 5):
+        self._stop_event.set()
+        
+        if self._thread is not None:
+            self._thread.join(timeout)
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+    
+    # ========================================================================
+    # ROUTING
+    # ========================================================================
+    
+    def _call(self, method: str, args: tuple, kwargs: dict):
+        endpoints = self.ranked_endpoints()
+        
+        if self.hedge_reads and method in HEDGED_METHODS:
+            return self._hedged_call(endpoints, method, args, kwargs)
+        
+        last_error = None
+        
+        for endpoint in endpoints:
+            try:
+                return self._call_endpoint(endpoint, method, args, kwargs)
+            except Exception as e:
+                last_error = e
+                logger.warning(f"RPC {method} an {endpoint.url} fehlgeschlagen: {e}")
+        
+        raise last_error
+    
+    def _hedged_call(self, endpoints: List[RpcEndpoint], method: str, args: tuple, kwargs: dict):
+        """
+        Sendet den Call an die zwei besten Endpoints und nimmt die erste erfolgreiche Antwort
+        """
+        pending = {
+            self._executor.submit(self._call_endpoint, endpoint, method, args, kwargs)
+            for endpoint in endpoints[:2]
+        }
+        last_error = None
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                try:
+                    return future.result()
+                except Exception as e:
+                    last_error = e
+        
+        # Beide gehedgten Endpoints fehlgeschlagen -> restliche der Reihe nach
+        for endpoint in endpoints[2:]:
+            try:
+                return self._call_endpoint(endpoint, method, args, kwargs)
+            except Exception as e:
+                last_error = e
+        
+        raise last_error
+    
+    def request(self, method: str, params: Optional[list] = None):
+        """
+        JSON-RPC Call für Methoden, die solana.rpc.api.Client nicht anbietet
+        (z.B. getRecentPrioritizationFees) - gleiches Routing und Failover
+        
+        Args:
+            method: JSON-RPC Methode (camelCase)
+            params: JSON-RPC Parameter
+            
+        Returns:
+            'result' der JSON-RPC Response
+        """
+        payload = {'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params or []}
+        last_error = None
+        
+        for endpoint in self.ranked_endpoints():
+            try:
+                return self._timed(endpoint, lambda: self._post_json_rpc(endpoint.url, payload))
+            except Exception as e:
+                last_error = e
+                logger.warning(f"RPC {method} an {endpoint.url} fehlgeschlagen: {e}")
+                
+        raise last_error
+    
+    @staticmethod
+    def _post_json_rpc(url: str, payload: Dict):
+        response = http_client.post(url, json=payload)
+        response.raise_for_status()
+        data = response.json()
+        
+        if 'error' in data:
+            raise RuntimeError(f"RPC Error: {data['error']}")
+            
+        return data['result']
+    
+    def _call_endpoint(self, endpoint: RpcEndpoint, method: str, args: tuple, kwargs: dict):
+        return self._timed(endpoint, lambda: getattr(endpoint.client, method)(*args, **kwargs))
+    
+    def _timed(self, endpoint: RpcEndpoint, call):
+        start = time.perf_counter()
+        
+        try:
+            result = call()
+        except Exception as e:
+            with self._lock:
+                endpoint.record((time.perf_counter() - start) * 1000, error=e)
+            raise
+        
+        with self._lock:
+            endpoint.record((time.perf_counter() - start) * 1000)
+        
+        return result
+    
+    # ========================================================================
+    # HEALTH CHECKS
+    # ========================================================================
+    
+    def _run_health_checks(self):
+        while not self._stop_event.is_set():
+            try:
+                self.check_health()
+            except Exception as e:
+                logger.error(f"RPC Health Check Fehler: {e}", exc_info=True)
+            
+            self._stop_event.wait(self.health_check_interval)
+    
+    def check_health(self):
+        """
+        Fragt die Block Height aller Endpoints ab und markiert ausgefallene
+        oder zurückhängende Endpoints als ungesund
+        """
+        for endpoint in self.endpoints:
+            try:
+                height = self._call_endpoint(endpoint, 'get_block_height', (), {}).value
+            except Exception:
+                height = None
+            
+            with self._lock:
+                endpoint.block_height = height
+        
+        with self._lock:
+            heights = [e.block_height for e in self.endpoints if e.block_height is not None]
+            best = max(heights) if heights else None
+            
+            for endpoint in self.endpoints:
+                healthy = endpoint.block_height is not None and best - endpoint.block_height <= MAX_BLOCK_LAG
+                
+                if healthy != endpoint.healthy:
+                    logger.warning(
+                        f"RPC Endpoint {endpoint.url} ist jetzt {'gesund' if healthy else 'UNGESUND'} "
+                        f"(Block Height {endpoint.block_height}, bester {best})"
+                    )
+                
+                endpoint.healthy = healthy
@@ -4,13 +4,26 @@ Scannt DexScreener API nach neuen Solana-Pairs mit definierten Filtern
 """
 
 import logging
+import time
 import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import List, Dict, Optional, Tuple
 import config
+from modules.http_client import http_client
+from modules.pair import Pair
 
 logger = logging.getLogger(__name__)
 
+# DexScreener erlaubt max. 30 Token Addresses pro /dex/tokens Request
+DEXSCREENER_BATCH_SIZE = 30
+
+# Token-Feeds ohne Pair-Daten - die Pairs werden über /dex/tokens nachgeladen
+TOKEN_FEED_PATHS = (
+    'token-profiles/latest/v1',
+    'token-boosts/latest/v1',
+    'token-boosts/top/v1'
+)
+
 
 class Scout:
     """
@@ -27,42 +40,72 @@ class Scout:
         self.min_age_minutes = config.MIN_AGE_MINUTES
         self.min_volume = config.MIN_VOLUME_USD
         
-    def fetch_new_pairs(self) -> List[Dict]:
+        # Parallele Discovery-Quellen innerhalb eines Zeitbudgets pro Scan
+        self.base_url = config.DEXSCREENER_BASE_URL
+        self.time_budget = config.SCOUT_TIME_BUDGET
+        self.sources = self._build_sources()
+        self._executor = ThreadPoolExecutor(max_workers=len(self.sources) or 1, thread_name_prefix='scout')
+        
+        # Watchlist junger Pairs, die Liquidität/Volumen schon erfüllen:
+        # pair_address -> pairCreatedAt (ms), erneut geprüft sobald MIN_AGE_MINUTES erreicht ist
+        self.watchlist: Dict[str, int] = {}
+        self.watchlist_max = config.SCOUT_WATCHLIST_MAX
+        self._last_scan_at = 0.0
+    
+    def fetch_new_pairs(self) -> List[Pair]:
         """
         Fetcht neue Solana-Pairs von DexScreener
         
+        Alle Discovery-Quellen (Suchbegriffe, Token-Profile, Boosts) laufen
+        parallel innerhalb von SCOUT_TIME_BUDGET. Quellen, die bis dahin nicht
+        geantwortet haben, fließen in diesen Scan nicht ein.
+        
         Returns:
-            List[Dict]: Liste von gefilterten Pairs
+            List[Pair]: Liste von gefilterten Pairs
         """
+        self._last_scan_at = time.time()
+        
         try:
-            logger.info("Scout startet DexScreener API Scan...")
+            logger.info(f"Scout startet DexScreener API Scan ({len(self.sources)} Quellen)...")
             
-            # DexScreener API - Latest Pairs für Solana
-            # Wir nutzen den "search" Endpoint mit Solana Chain Filter
-            url = f"{self.api_url}/dex/search?q=SOL"
+            futures = {self._executor.submit(fetch, arg): name for name, fetch, arg in self.sources}
+            done, not_done = wait(futures, timeout=self.time_budget)
             
-            response = requests.get(
-                url,
-                timeout=30,
-                headers={'User-Agent': 'Memero Bot/1.0'}
-            )
-            response.raise_for_status()
+            results = []
             
-            data = response.json()
+            for future in done:
+                name = futures[future]
+                
+                try:
+                    fetched_at, source_pairs = future.result()
+                    results.append((fetched_at, source_pairs))
+                    logger.debug(f"Quelle {name}: {len(source_pairs)} Pairs")
+                
+                except requests.exceptions.Timeout:
+                    logger.warning(f"Quelle {name}: DexScreener API Timeout")
+                except requests.exceptions.RequestException as e:
+                    logger.warning(f"Quelle {name}: DexScreener API Request Fehler: {e}")
+                except Exception as e:
+                    logger.warning(f"Quelle {name}: Fehler beim Abruf: {e}")
             
-            if 'pairs' not in data or data['pairs'] is None:
-                logger.warning("Keine Pairs in API Response gefunden")
-                return []
+            if not_done:
+                logger.warning(
+                    f"{len(not_done)} Quellen nicht innerhalb von {self.time_budget:.0f}s fertig: "
+                    f"{', '.join(sorted(futures[f] for f in not_done))}"
+                )
             
-            pairs = data['pairs']
+            pairs = self._merge_pairs(results)
             
-            if pairs is None:
-                logger.warning("Pairs ist None - API hat keine Daten zurückgegeben")
+            if not pairs:
+                logger.warning("Keine Pairs in API Response gefunden")
                 return []
             
             # Filtere nur Solana Pairs
             solana_pairs = [p for p in pairs if p.get('chainId') == 'solana']
-            logger.info(f"Scout hat {len(solana_pairs)} Solana Pairs gefunden (von {len(pairs)} total)")
+            logger.info(
+                f"Scout hat {len(solana_pairs)} Solana Pairs gefunden "
+                f"(von {len(pairs)} eindeutigen aus {len(results)}/{len(self.sources)} Quellen)"
+            )
             
             # Filtere Pairs nach Kriterien
             filtered_pairs = self._filter_pairs(solana_pairs)
@@ -70,105 +113,243 @@ class Scout:
             logger.info(f"Scout hat {len(filtered_pairs)} Pairs nach Filterung übrig")
             
             return filtered_pairs
-            
-        except requests.exceptions.Timeout:
-            logger.error("DexScreener API Timeout - keine Antwort innerhalb 30s")
-            return []
-        except requests.exceptions.RequestException as e:
-            logger.error(f"DexScreener API Request Fehler: {e}")
-            return []
+        
         except Exception as e:
             logger.error(f"Unerwarteter Fehler beim Scout: {e}", exc_info=True)
             return []
     
-    def _filter_pairs(self, pairs: List[Dict]) -> List[Dict]:
+    # ========================================================================
+    # WATCHLIST (junge Pairs)
+    # ========================================================================
+    
+    def scan_due(self, interval: float) -> bool:
+        """
+        Returns:
+            bool: True wenn ein voller Scan fällig ist, False wenn nur reife Watchlist-Pairs anstehen
+        """
+        return time.time() - self._last_scan_at >= interval or not self._matured_addresses()
+    
+    def wait_for_next_scan(self, interval: float):
+        """
+        Wartet bis zum nächsten vollen Scan - oder kürzer, wenn vorher ein Pair
+        der Watchlist MIN_AGE_MINUTES erreicht
+        """
+        now = time.time()
+        wake_at = self._last_scan_at + interval
+        
+        if self.watchlist:
+            wake_at = min(wake_at, min(self._matures_at(created_at) for created_at in self.watchlist.values()))
+        
+        delay = max(0.0, wake_at - now)
+        
+        if wake_at < self._last_scan_at + interval:
+            logger.info(f"Warte {delay:.0f} Sekunden bis ein Watchlist-Pair reif ist...")
+        else:
+            logger.info(f"Warte {delay:.0f} Sekunden bis nächster Scout-Run...")
+        
+        time.sleep(delay)
+    
+    def fetch_matured_pairs(self) -> List[Pair]:
+        """
+        Lädt die Watchlist-Pairs, die MIN_AGE_MINUTES erreicht haben, gebündelt
+        über /dex/pairs (bis zu 30 Adressen pro Request) und filtert sie erneut
+        
+        Returns:
+            List[Pair]: Gefilterte Pairs (gleiches Format wie fetch_new_pairs)
+        """
+        matured = self._matured_addresses()
+        
+        for pair_address in matured:
+            del self.watchlist[pair_address]
+        
+        if not matured:
+            return []
+        
+        logger.info(f"Scout prüft {len(matured)} gereifte Watchlist-Pairs erneut...")
+        pairs = []
+        
+        for i in range(0, len(matured), DEXSCREENER_BATCH_SIZE):
+            batch = matured[i:i + DEXSCREENER_BATCH_SIZE]
+            
+            try:
+                response = http_client.get(f"{self.api_url}/dex/pairs/solana/{','.join(batch)}")
+                response.raise_for_status()
+                pairs.extend(response.json().get('pairs') or [])
+            
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Watchlist-Pairs konnten nicht geladen werden: {e}")
+        
+        filtered_pairs = self._filter_pairs(pairs)
+        
+        logger.info(f"Scout hat {len(filtered_pairs)}/{len(matured)} gereifte Pairs nach Filterung übrig")
+        
+        return filtered_pairs
+    
+    def _matures_at(self, pair_created_at: int) -> float:
+        # +1s, damit das Pair beim erneuten Filtern sicher alt genug ist
+        return pair_created_at / 1000 + self.min_age_minutes * 60 + 1
+    
+    def _matured_addresses(self) -> List[str]:
+        now = time.time()
+        return [address for address, created_at in self.watchlist.items() if self._matures_at(created_at) <= now]
+    
+    def _watch(self, pair: Dict, pair_created_at: int):
+        """
+        Merkt ein junges Pair vor, das Liquidität und Volumen bereits erfüllt
+        """
+        pair_address = pair.get('pairAddress')
+        
+        if not pair_address or pair_address in self.watchlist:
+            return
+        
+        if len(self.watchlist) >= self.watchlist_max:
+            return
+        
+        self.watchlist[pair_address] = pair_created_at
+        
+        logger.debug(
+            f"Watchlist: {pair.get('baseToken', {}).get('symbol')} reift in "
+            f"{(self._matures_at(pair_created_at) - time.time()) / 60:.1f} Minuten"
+        )
+    
+    # ========================================================================
+    # DISCOVERY QUELLEN
+    # ========================================================================
+    
+    def _build_sources(self) -> List[Tuple[str, object, str]]:
+        """
+        Returns:
+            List[Tuple]: (Name, Fetch-Funktion, Argument) pro Discovery-Quelle
+        """
+        sources = [(f"search:{term}", self._fetch_search, term) for term in config.SCOUT_SEARCH_TERMS]
+        
+        if config.SCOUT_TOKEN_FEEDS:
+            sources += [(path, self._fetch_token_feed, path) for path in TOKEN_FEED_PATHS]
+        
+        return sources
+    
+    def _fetch_search(self, term: str) -> Tuple[float, List[Dict]]:
+        """
+        DexScreener Suche (/dex/search)
+        
+        Returns:
+            Tuple[float, List[Dict]]: Zeitpunkt der Antwort (monotonic) und rohe Pairs
+        """
+        response = http_client.get(f"{self.api_url}/dex/search", params={'q': term})
+        response.raise_for_status()
+        
+        return time.monotonic(), response.json().get('pairs') or []
+    
+    def _fetch_token_feed(self, path: str) -> Tuple[float, List[Dict]]:
+        """
+        Token-Feed (Profile/Boosts) laden und die Pairs der Solana-Tokens über
+        /dex/tokens nachladen (bis zu 30 Adressen pro Request)
+        
+        Returns:
+            Tuple[float, List[Dict]]: Zeitpunkt der Antwort (monotonic) und rohe Pairs
+        """
+        response = http_client.get(f"{self.base_url}/{path}")
+        response.raise_for_status()
+        
+        addresses = list(dict.fromkeys(
+            token['tokenAddress'] for token in response.json() or []
+            if token.get('chainId') == 'solana' and token.get('tokenAddress')
+        ))
+        
+        pairs = []
+        
+        for i in range(0, len(addresses), DEXSCREENER_BATCH_SIZE):
+            batch = addresses[i:i + DEXSCREENER_BATCH_SIZE]
+            
+            response = http_client.get(f"{self.api_url}/dex/tokens/{','.join(batch)}")
+            response.raise_for_status()
+            pairs.extend(response.json().get('pairs') or [])
+        
+        return time.monotonic(), pairs
+    
+    @staticmethod
+    def _merge_pairs(results: List[Tuple[float, List[Dict]]]) -> List[Dict]:
+        """
+        Führt die Ergebnisse aller Quellen zusammen
+        
+        - Gleiches Pair aus mehreren Quellen: der zuletzt abgerufene (frischeste) Datensatz gewinnt
+        - Mehrere Pairs desselben Base Tokens: das liquideste Pair gewinnt
+          (wie beim Preis-Lookup des Wächters)
+        
+        Args:
+            results: (Zeitpunkt der Antwort, rohe Pairs) pro Quelle
+        
+        Returns:
+            List[Dict]: Ein Pair pro Base Token
+        """
+        by_pair: Dict[str, Dict] = {}
+        
+        for _, pairs in sorted(results, key=lambda result: result[0]):
+            for pair in pairs:
+                if pair and pair.get('pairAddress'):
+                    by_pair[pair['pairAddress']] = pair
+        
+        by_token: Dict[str, Dict] = {}
+        
+        for pair in by_pair.values():
+            token_address = (pair.get('baseToken') or {}).get('address')
+            
+            if not token_address:
+                continue
+            
+            current = by_token.get(token_address)
+            
+            if current is None or _liquidity(pair) > _liquidity(current):
+                by_token[token_address] = pair
+        
+        return list(by_token.values())
+    
+    def _filter_pairs(self, pairs: List[Dict]) -> List[Pair]:
         """
         Filtert Pairs nach Hard-Coded Kriterien
         
         Args:
             pairs: Liste von Pairs aus DexScreener
-            
+        
         Returns:
-            List[Dict]: Gefilterte Pairs die alle Kriterien erfüllen
+            List[Pair]: Gefilterte Pairs die alle Kriterien erfüllen
         """
-        filtered = []
+        filtered, young = filter_pairs(pairs, self.min_liquidity, self.min_volume, self.min_age_minutes)
         
-        for pair in pairs:
-            try:
-                # Extrahiere relevante Daten
-                liquidity_usd = float(pair.get('liquidity', {}).get('usd', 0))
-                volume_24h = float(pair.get('volume', {}).get('h24', 0))
-                pair_created_at = pair.get('pairCreatedAt')
-                
-                # Prüfe Liquidität
-                if liquidity_usd < self.min_liquidity:
-                    continue
-                
-                # Prüfe Volumen
-                if volume_24h < self.min_volume:
-                    continue
-                
-                # Prüfe Alter (mindestens 15 Minuten alt)
-                if pair_created_at:
-                    created_time = datetime.fromtimestamp(pair_created_at / 1000)
-                    age_minutes = (datetime.now() - created_time).total_seconds() / 60
-                    
-                    if age_minutes < self.min_age_minutes:
-                        continue
-                
-                # Extrahiere relevante Informationen
-                filtered_pair = {
-                    'contract_address': pair.get('baseToken', {}).get('address'),
-                    'symbol': pair.get('baseToken', {}).get('symbol'),
-                    'name': pair.get('baseToken', {}).get('name'),
-                    'liquidity_usd': liquidity_usd,
-                    'volume_24h': volume_24h,
-                    'price_usd': float(pair.get('priceUsd', 0)),
-                    'price_change_24h': float(pair.get('priceChange', {}).get('h24', 0)),
-                    'market_cap': float(pair.get('fdv', 0)),
-                    'pair_address': pair.get('pairAddress'),
-                    'dex': pair.get('dexId'),
-                    'created_at': pair_created_at,
-                    'url': pair.get('url', '')
-                }
-                
-                # Validierung: Contract Address muss existieren
-                if not filtered_pair['contract_address']:
-                    logger.warning(f"Pair {filtered_pair.get('symbol')} hat keine Contract Address - überspringe")
-                    continue
-                
-                filtered.append(filtered_pair)
-                
+        # Junge Pairs, die Liquidität und Volumen schon erfüllen, beim Mindestalter erneut prüfen
+        if self.watchlist_max:
+            for pair in young:
+                self._watch(pair, pair['pairCreatedAt'])
+        
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        for filtered_pair in filtered:
+            # Pair hat den Filter bestanden - nicht mehr auf der Watchlist
+            self.watchlist.pop(filtered_pair.pair_address, None)
+            
+            if debug:
                 logger.debug(
-                    f"Pair gefunden: {filtered_pair['symbol']} | "
-                    f"Liq: ${liquidity_usd:,.0f} | "
-                    f"Vol: ${volume_24h:,.0f} | "
-                    f"CA: {filtered_pair['contract_address']}"
+                    f"Pair gefunden: {filtered_pair.symbol} | "
+                    f"Liq: ${filtered_pair.liquidity_usd:,.0f} | "
+                    f"Vol: ${filtered_pair.volume_24h:,.0f} | "
+                    f"CA: {filtered_pair.contract_address}"
                 )
-                
-            except (KeyError, ValueError, TypeError) as e:
-                logger.warning(f"Fehler beim Parsen eines Pairs: {e}")
-                continue
         
         return filtered
     
-    def get_trending_pairs(self) -> List[Dict]:
+    def get_trending_pairs(self) -> List[Pair]:
         """
         Alternative Methode: Holt trending Pairs (falls neue Pairs nicht verfügbar)
         
         Returns:
-            List[Dict]: Liste von trending Pairs
+            List[Pair]: Liste von trending Pairs
         """
         try:
             logger.info("Scout fetcht trending Solana Pairs...")
             
             url = f"{self.api_url}/dex/search?q=SOL"
             
-            response = requests.get(
-                url,
-                timeout=30,
-                headers={'User-Agent': 'Memero Bot/1.0'}
-            )
+            response = http_client.get(url)
             response.raise_for_status()
             
             data = response.json()
@@ -180,7 +361,98 @@ class Scout:
                 return self._filter_pairs(solana_pairs)
             
             return []
-            
+        
         except Exception as e:
             logger.error(f"Fehler beim Fetchen von Trending Pairs: {e}")
             return []
+
+
+# Gemeinsamer Default für fehlende Unter-Objekte (nur gelesen) - spart ein {} pro Pair und Feld
+_MISSING: Dict = {}
+
+
+def filter_pairs(
+    pairs: List[Dict],
+    min_liquidity: float,
+    min_volume: float,
+    min_age_minutes: float,
+    now_ms: Optional[float] = None
+) -> Tuple[List[Pair], List[Dict]]:
+    """
+    Scout-Filter in einem Durchlauf über die rohen DexScreener Pairs
+    
+    Das Mindestalter wird einmal in einen pairCreatedAt-Grenzwert (ms)
+    umgerechnet statt pro Pair datetime.now() zu rufen. Die billigen Prüfungen
+    (Liquidität, Volumen, Alter) laufen zuerst, Preis/FDV werden nur für
+    Kandidaten geparst und Pair-Dicts nur für Überlebende gebaut.
+    
+    Args:
+        pairs: Rohe Pairs aus der DexScreener API
+        min_liquidity: Mindest-Liquidität (USD)
+        min_volume: Mindest-Volumen 24h (USD)
+        min_age_minutes: Mindestalter (Minuten)
+        now_ms: Referenzzeitpunkt (Default: jetzt)
+    
+    Returns:
+        Tuple[List[Pair], List[Dict]]: (gefilterte Pairs,
+                                        rohe Pairs die nur am Mindestalter scheitern)
+    """
+    if now_ms is None:
+        now_ms = time.time() * 1000
+    
+    created_cutoff = now_ms - min_age_minutes * 60_000
+    filtered = []
+    young = []
+    
+    for pair in pairs:
+        try:
+            liquidity_usd = float(pair.get('liquidity', _MISSING).get('usd', 0))
+            
+            if liquidity_usd < min_liquidity:
+                continue
+            
+            volume_24h = float(pair.get('volume', _MISSING).get('h24', 0))
+            
+            if volume_24h < min_volume:
+                continue
+            
+            pair_created_at = pair.get('pairCreatedAt')
+            
+            if pair_created_at and pair_created_at > created_cutoff:
+                young.append(pair)
+                continue
+            
+            base_token = pair.get('baseToken', _MISSING)
+            contract_address = base_token.get('address')
+            
+            if not contract_address:
+                logger.warning(f"Pair {base_token.get('symbol')} hat keine Contract Address - überspringe")
+                continue
+            
+            filtered.append(Pair(
+                contract_address=contract_address,
+                symbol=base_token.get('symbol'),
+                name=base_token.get('name'),
+                liquidity_usd=liquidity_usd,
+                volume_24h=volume_24h,
+                price_usd=float(pair.get('priceUsd', 0)),
+                price_change_24h=float(pair.get('priceChange', _MISSING).get('h24', 0)),
+                market_cap=float(pair.get('fdv', 0)),
+                pair_address=pair.get('pairAddress'),
+                dex=pair.get('dexId'),
+                created_at=pair_created_at,
+                url=pair.get('url', '')
+            ))
+        
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Fehler beim Parsen eines Pairs: {e}")
+            continue
+    
+    return filtered, young
+
+
+def _liquidity(pair: Dict) -> float:
+    try:
+        return float((pair.get('liquidity') or {}).get('usd') or 0)
+    except (ValueError, TypeError):
+        return 0.0
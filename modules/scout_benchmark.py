@@ -0,0 +1,160 @@
+"""
+MEMERO Trading Bot - Scout Filter Benchmark
+Vergleicht die bisherige Einzel-Prüfung mit scout.filter_pairs
+
+Die alte Variante rief pro Pair datetime.now()/fromtimestamp() auf und
+parste alle Felder, bevor das Alter geprüft wurde. filter_pairs rechnet das
+Mindestalter einmal in einen Grenzwert um und parst Preis/FDV nur für
+Kandidaten. Beide Varianten laufen auf denselben synthetischen Pairs und
+müssen dieselben Pairs liefern.
+
+    python -m modules.scout_benchmark --count 10000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+from typing import Dict, List
+
+from modules.scout import filter_pairs
+
+# Filter-Kriterien wie in config.py (MIN_LIQUIDITY_USD, MIN_VOLUME_USD, MIN_AGE_MINUTES)
+CRITERIA = (5000, 10000, 15)
+
+
+def filter_pairs_legacy(pairs: List[Dict], min_liquidity: float, min_volume: float, min_age_minutes: float) -> List[Dict]:
+    """Bisherige Einzel-Prüfung aus Scout._filter_pairs (ohne Logging)"""
+    filtered = []
+    
+    for pair in pairs:
+        try:
+            liquidity_usd = float(pair.get('liquidity', {}).get('usd', 0))
+            volume_24h = float(pair.get('volume', {}).get('h24', 0))
+            pair_created_at = pair.get('pairCreatedAt')
+            
+            if liquidity_usd < min_liquidity:
+                continue
+            
+            if volume_24h < min_volume:
+                continue
+            
+            if pair_created_at:
+                created_time = datetime.fromtimestamp(pair_created_at / 1000)
+                age_minutes = (datetime.now() - created_time).total_seconds() / 60
+                
+                if age_minutes < min_age_minutes:
+                    continue
+            
+            filtered_pair = {
+                'contract_address': pair.get('baseToken', {}).get('address'),
+                'symbol': pair.get('baseToken', {}).get('symbol'),
+                'name': pair.get('baseToken', {}).get('name'),
+                'liquidity_usd': liquidity_usd,
+                'volume_24h': volume_24h,
+                'price_usd': float(pair.get('priceUsd', 0)),
+                'price_change_24h': float(pair.get('priceChange', {}).get('h24', 0)),
+                'market_cap': float(pair.get('fdv', 0)),
+                'pair_address': pair.get('pairAddress'),
+                'dex': pair.get('dexId'),
+                'created_at': pair_created_at,
+                'url': pair.get('url', '')
+            }
+            
+            if not filtered_pair['contract_address']:
+                continue
+            
+            filtered.append(filtered_pair)
+        
+        except (KeyError, ValueError, TypeError):
+            continue
+    
+    return filtered
+
+
+def synthetic_pairs(count: int, seed: int = 42) -> List[Dict]:
+    """
+    Zufällige Pairs im DexScreener Format (priceUsd als String wie in der API)
+    
+    Returns:
+        List[Dict]: count rohe Pairs, bis zu 7 Tage alt
+    """
+    rng = random.Random(seed)
+    now_ms = time.time() * 1000
+    
+    return [
+        {
+            'chainId': 'solana',
+            'dexId': rng.choice(['raydium', 'orca', 'meteora', 'pumpswap']),
+            'url': f'https://dexscreener.com/solana/pair{i}',
+            'pairAddress': f'pair{i}',
+            'baseToken': {'address': f'mint{i}', 'name': f'Token {i}', 'symbol': f'T{i}'},
+            'priceUsd': f'{rng.lognormvariate(-8, 3):.10f}',
+            'priceChange': {'h24': round(rng.uniform(-90, 500), 2)},
+            'liquidity': {'usd': round(rng.lognormvariate(8.5, 1.5), 2)},
+            'volume': {'h24': round(rng.lognormvariate(9, 2), 2)},
+            'fdv': round(rng.lognormvariate(12, 2)),
+            'pairCreatedAt': int(now_ms - rng.uniform(0, 7 * 24 * 3600 * 1000))
+        }
+        for i in range(count)
+    ]
+
+
+def benchmark(count: int = 10_000, repeat: int = 5, seed: int = 42) -> Dict:
+    """
+    Returns:
+        Dict: survivors, legacy_ms, current_ms, speedup (jeweils bester von repeat Läufen)
+    
+    Raises:
+        AssertionError: Wenn beide Varianten unterschiedliche Pairs liefern
+    """
+    pairs = synthetic_pairs(count, seed)
+    
+    variants = {
+        'legacy': lambda: filter_pairs_legacy(pairs, *CRITERIA),
+        'current': lambda: filter_pairs(pairs, *CRITERIA)[0]
+    }
+    timings = {}
+    survivors = {}
+    
+    for label, run in variants.items():
+        best = float('inf')
+        
+        for _ in range(repeat):
+            start = time.perf_counter()
+            survivors[label] = run()
+            best = min(best, time.perf_counter() - start)
+        
+        timings[label] = best * 1000
+    
+    if survivors['legacy'] != [pair.to_dict() for pair in survivors['current']]:
+        raise AssertionError("Alte und neue Filter-Variante liefern unterschiedliche Pairs")
+    
+    return {
+        'survivors': len(survivors['current']),
+        'legacy_ms': round(timings['legacy'], 2),
+        'current_ms': round(timings['current'], 2),
+        'speedup': round(timings['legacy'] / timings['current'], 1) if timings['current'] else None
+    }
+
+
+def main():
+    """Benchmark: bisherige Einzel-Prüfung vs. filter_pairs"""
+    parser = argparse.ArgumentParser(description='Scout Filter: bisherige Einzel-Prüfung vs. filter_pairs')
+    parser.add_argument('--count', type=int, default=10_000, help='Anzahl synthetischer Pairs')
+    parser.add_argument('--repeat', type=int, default=5, help='Läufe pro Variante (bester zählt)')
+    parser.add_argument('--seed', type=int, default=42)
+    
+    args = parser.parse_args()
+    result = benchmark(args.count, args.repeat, args.seed)
+    
+    print(
+        f"{args.count} Pairs -> {result['survivors']} nach Filter | "
+        f"Bisher: {result['legacy_ms']} ms | "
+        f"filter_pairs: {result['current_ms']} ms | "
+        f"Speedup: {result['speedup']}x"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+"""
+MEMERO Trading Bot - Security Checks
+Batch-Prüfung von Mint Authority und Freeze Authority für alle Scout-Kandidaten
+
+Statt einem get_account_info pro Token (und nur für den einen Token, den der
+Analyst gewählt hat) werden die Mint Accounts aller gefilterten Kandidaten
+mit getMultipleAccounts geladen (max. 100 pro Request). Unsichere Tokens
+werden verworfen, bevor das LLM sie zu sehen bekommt.
+
+Gültige Verdicts aus der MintRegistry (modules/mint_registry.py) brauchen
+keinen RPC-Call.
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+import base58
+from solana.rpc.types import DataSliceOpts
+from solders.pubkey import Pubkey
+
+from modules.pair import Pair
+
+logger = logging.getLogger(__name__)
+
+# SPL Token Mint Layout (Token-2022 Mints beginnen mit demselben Layout)
+MINT_ACCOUNT_SIZE = 82
+
+# Limit des RPC-Calls getMultipleAccounts
+MULTIPLE_ACCOUNTS_BATCH_SIZE = 100
+
+
+def decode_mint_account(data: bytes) -> Optional[Dict]:
+    """
+    Dekodiert die Rohdaten eines SPL Token Mint Accounts
+    
+    Solana Mint Account Structure:
+    Bytes 0-3: mint_authority_option (0 = None, 1 = Some)
+    Bytes 4-35: mint_authority (wenn vorhanden)
+    Bytes 36-43: supply
+    Bytes 44: decimals
+    Bytes 45: is_initialized
+    Bytes 46-49: freeze_authority_option (0 = None, 1 = Some)
+    Bytes 50-81: freeze_authority (wenn vorhanden)
+    
+    Args:
+        data: Account Daten (mind. 82 Bytes)
+        
+    Returns:
+        Optional[Dict]: mint_authority, freeze_authority, supply, decimals, is_initialized
+                        oder None bei ungültigen Daten
+    """
+    if data is None or len(data) < MINT_ACCOUNT_SIZE:
+        return None
+        
+    mint_authority_option = int.from_bytes(data[0:4], 'little')
+    freeze_authority_option = int.from_bytes(data[46:50], 'little')
+    
+    return {
+        'mint_authority': (
+            base58.b58encode(bytes(data[4:36])).decode('ascii') if mint_authority_option else None
+        ),
+        'supply': int.from_bytes(data[36:44], 'little'),
+        'decimals': data[44],
+        'is_initialized': bool(data[45]),
+        'freeze_authority': (
+            base58.b58encode(bytes(data[50:82])).decode('ascii') if freeze_authority_option else None
+        )
+    }
+
+
+def evaluate_mint(mint: Optional[Dict]) -> Dict:
+    """
+    Bewertet einen dekodierten Mint Account
+    
+    Args:
+        mint: Ergebnis von decode_mint_account() oder None
+        
+    Returns:
+        Dict: safe (bool), reason (str oder None), mint (Dict oder None)
+    """
+    if mint is None:
+        return {'safe': False, 'reason': 'Kein gültiger Mint Account', 'mint': None}
+        
+    if mint['mint_authority']:
+        return {'safe': False, 'reason': f"Mint Authority aktiv ({mint['mint_authority']})", 'mint': mint}
+        
+    if mint['freeze_authority']:
+        return {'safe': False, 'reason': f"Freeze Authority aktiv ({mint['freeze_authority']})", 'mint': mint}
+        
+    return {'safe': True, 'reason': None, 'mint': mint}
+
+
+class SecurityChecker:
+    """
+    Prüft Mint- und Freeze-Authority vieler Tokens mit wenigen RPC-Calls
+    """
+    
+    def __init__(self, rpc_client, registry=None):
+        """
+        Args:
+            rpc_client: solana.rpc.api.Client (wird mit dem Trader geteilt)
+            registry: Optionale MintRegistry - gültige Verdicts kommen ohne RPC-Call aus dem Cache
+        """
+        self.rpc_client = rpc_client
+        self.registry = registry
+    
+    def check_tokens(self, token_addresses: List[str]) -> Dict[str, Dict]:
+        """
+        Prüft alle Tokens gebündelt via getMultipleAccounts
+        
+        Args:
+            token_addresses: Mint Addresses
+            
+        Returns:
+            Dict[str, Dict]: token_address -> Ergebnis von evaluate_mint()
+        """
+        results = {}
+        pubkeys = {}
+        
+        for address in dict.fromkeys(token_addresses):
+            cached = self.registry.get_verdict(address) if self.registry else None
+            
+            if cached is not None:
+                results[address] = cached
+                continue
+                
+            try:
+                pubkeys[address] = Pubkey.from_string(address)
+            except (ValueError, TypeError):
+                results[address] = {'safe': False, 'reason': 'Ungültige Adresse', 'mint': None}
+                
+        addresses = list(pubkeys)
+        fetched = {}
+        
+        for i in range(0, len(addresses), MULTIPLE_ACCOUNTS_BATCH_SIZE):
+            batch = addresses[i:i + MULTIPLE_ACCOUNTS_BATCH_SIZE]
+            
+            try:
+                # Nur die ersten 82 Bytes laden - Extensions (Token-2022) werden nicht gebraucht
+                response = self.rpc_client.get_multiple_accounts(
+                    [pubkeys[address] for address in batch],
+                    data_slice=DataSliceOpts(offset=0, length=MINT_ACCOUNT_SIZE)
+                )
+                accounts = response.value
+                
+            except Exception as e:
+                # Fail-Closed: ohne Daten gilt ein Token als unsicher
+                logger.error(f"getMultipleAccounts fehlgeschlagen ({len(batch)} Tokens): {e}")
+                for address in batch:
+                    results[address] = {'safe': False, 'reason': f'RPC Fehler: {e}', 'mint': None}
+                continue
+                
+            for address, account in zip(batch, accounts):
+                data = bytes(account.data) if account is not None else None
+                fetched[address] = evaluate_mint(decode_mint_account(data))
+                
+        if fetched and self.registry:
+            self.registry.record_checks(fetched)
+            
+        results.update(fetched)
+        return results
+    
+    def check_token(self, token_address: str) -> Dict:
+        """
+        Prüft einen einzelnen Token
+        
+        Returns:
+            Dict: safe (bool), reason (str oder None), mint (Dict oder None)
+        """
+        return self.check_tokens([token_address])[token_address]
+    
+    def filter_safe_pairs(self, pairs: List[Pair]) -> List[Pair]:
+        """
+        Verwirft alle Pairs, deren Token die Security Checks nicht besteht
+        
+        Args:
+            pairs: Gefilterte Pairs vom Scout
+            
+        Returns:
+            List[Pair]: Nur Pairs mit deaktivierter Mint- und Freeze-Authority
+        """
+        if not pairs:
+            return []
+            
+        results = self.check_tokens([pair.contract_address for pair in pairs])
+        safe_pairs = []
+        
+        for pair in pairs:
+            result = results[pair.contract_address]
+            
+            if result['safe']:
+                safe_pairs.append(pair)
+            else:
+                logger.info(f"🛡️  {pair.symbol} verworfen: {result['reason']}")
+                
+        logger.info(f"Security Checks: {len(safe_pairs)}/{len(pairs)} Pairs sicher")
+        
+        return safe_pairs
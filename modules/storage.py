@@ -0,0 +1,411 @@
+"""
+MEMERO Trading Bot - Storage Backends
+Austauschbarer Speicher für Trades und offene Positionen
+
+Backends (Auswahl über STORAGE_BACKEND in .env):
+- json:   trades.jsonl (Append-Only Journal) + positions.json  [Default]
+- sqlite: memero.db im WAL-Modus mit Indizes, Bot schreibt während
+          das Monitoring parallel liest
+
+Einmalige Migration JSON -> SQLite:
+    python -m modules.maintenance migrate-sqlite
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from modules.trade_journal import TradeJournal
+
+logger = logging.getLogger(__name__)
+
+
+def atomic_write_json(path: Path, data, indent: int = None):
+    """
+    Schreibt JSON atomar: Temp-Datei + fsync + Rename
+    Leser sehen immer entweder die alte oder die neue vollständige Datei.
+    
+    Args:
+        path: Zieldatei
+        data: JSON-serialisierbare Daten
+        indent: Optionale Einrückung
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    
+    os.replace(tmp_path, path)
+
+
+class TradeStorage(ABC):
+    """
+    Schnittstelle aller Storage Backends
+    """
+    
+    name = 'base'
+    
+    # Trades
+    @abstractmethod
+    def append_trade(self, entry: Dict) -> Dict:
+        """Speichert einen Trade und gibt ihn inkl. vergebener 'id' zurück"""
+        ...
+    
+    @abstractmethod
+    def import_trades(self, entries: List[Dict]) -> int:
+        """Übernimmt bestehende Trades inkl. 'id' (Migration)"""
+        ...
+    
+    @abstractmethod
+    def iter_trades(self) -> Iterator[Dict]:
+        """Streamt alle Trades in Schreibreihenfolge"""
+        ...
+    
+    @abstractmethod
+    def recent_trades(self, limit: int) -> List[Dict]:
+        """Liefert die letzten N Trades (älteste zuerst)"""
+        ...
+    
+    @abstractmethod
+    def has_trades(self) -> bool:
+        ...
+    
+    @abstractmethod
+    def last_trade_id(self) -> int:
+        """Höchste vergebene Trade-ID (0 wenn leer)"""
+        ...
+    
+    def compact(self) -> int:
+        """Optionale Wartung, Rückgabe: Anzahl zusammengefasster Einheiten"""
+        return 0
+        
+    # Positions
+    @abstractmethod
+    def load_positions(self) -> Dict:
+        """Liefert {token_address: position_data}"""
+        ...
+    
+    @abstractmethod
+    def save_position(self, position: Dict):
+        ...
+    
+    @abstractmethod
+    def delete_position(self, token_address: str) -> bool:
+        ...
+    
+    @abstractmethod
+    def save_positions(self, positions: Dict):
+        """Ersetzt alle offenen Positionen (Write-Behind Flush)"""
+        ...
+
+
+class JsonStorage(TradeStorage):
+    """
+    Default Backend: Trade-Journal (JSON Lines) + positions.json
+    """
+    
+    name = 'json'
+    
+    def __init__(self, trades_file: Path, positions_file: Path):
+        self.positions_file = Path(positions_file)
+        self.journal = TradeJournal(trades_file)
+        
+    def append_trade(self, entry: Dict) -> Dict:
+        return self.journal.append(entry)
+    
+    def import_trades(self, entries: List[Dict]) -> int:
+        return self.journal.import_entries(entries)
+    
+    def iter_trades(self) -> Iterator[Dict]:
+        return self.journal.iter_entries()
+    
+    def recent_trades(self, limit: int) -> List[Dict]:
+        return list(deque(self.iter_trades(), maxlen=limit)) if limit > 0 else []
+    
+    def has_trades(self) -> bool:
+        return not self.journal.is_empty()
+    
+    def last_trade_id(self) -> int:
+        return self.journal.last_id
+    
+    def compact(self) -> int:
+        return self.journal.compact()
+    
+    def load_positions(self) -> Dict:
+        try:
+            with open(self.positions_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+    
+    def save_position(self, position: Dict):
+        positions = self.load_positions()
+        positions[position['token_address']] = position
+        self._save_positions(positions)
+    
+    def delete_position(self, token_address: str) -> bool:
+        positions = self.load_positions()
+        
+        if token_address not in positions:
+            return False
+            
+        del positions[token_address]
+        self._save_positions(positions)
+        return True
+    
+    def save_positions(self, positions: Dict):
+        self._save_positions(positions)
+    
+    def _save_positions(self, positions: Dict):
+        """Speichert Positionen atomar in Datei"""
+        atomic_write_json(self.positions_file, positions, indent=2)
+
+
+class SqliteStorage(TradeStorage):
+    """
+    SQLite Backend im WAL-Modus
+    
+    Indiziert: trades.timestamp, trades.token_address, trades.type, trades.status
+    Die komplette Zeile liegt zusätzlich als JSON in 'data', neue Felder
+    brauchen daher keine Schema-Migration.
+    """
+    
+    name = 'sqlite'
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS trades (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT NOT NULL,
+            type TEXT,
+            status TEXT,
+            token_address TEXT,
+            symbol TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp);
+        CREATE INDEX IF NOT EXISTS idx_trades_token_address ON trades(token_address);
+        CREATE INDEX IF NOT EXISTS idx_trades_type ON trades(type);
+        CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status);
+        
+        CREATE TABLE IF NOT EXISTS positions (
+            token_address TEXT PRIMARY KEY,
+            status TEXT NOT NULL DEFAULT 'active',
+            entry_timestamp TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_positions_status ON positions(status);
+    """
+    
+    def __init__(self, db_file: Path, read_only: bool = False):
+        """
+        Args:
+            db_file: Pfad zu memero.db
+            read_only: Datenbank nur lesend öffnen (Monitoring), kein Schema anlegen
+        """
+        self.db_file = Path(db_file)
+        self.read_only = read_only
+        
+        # sqlite3 Connections dürfen nicht zwischen Threads geteilt werden
+        self._local = threading.local()
+        
+        # Schema wird erst mit der ersten Connection angelegt (kein Schreibzugriff beim Import)
+        self._schema_ready = read_only
+        self._schema_lock = threading.Lock()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Liefert die Connection des aktuellen Threads"""
+        conn = getattr(self._local, 'conn', None)
+        
+        if conn is None:
+            if self.read_only:
+                conn = sqlite3.connect(f"{self.db_file.resolve().as_uri()}?mode=ro", uri=True, timeout=10)
+            else:
+                conn = sqlite3.connect(str(self.db_file), timeout=10)
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    with conn:
+                        conn.executescript(self.SCHEMA)
+                    self._schema_ready = True
+            
+        return conn
+    
+    @staticmethod
+    def _row_to_trade(row) -> Dict:
+        return {'id': row[0], **json.loads(row[1])}
+    
+    def append_trade(self, entry: Dict) -> Dict:
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO trades (timestamp, type, status, token_address, symbol, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    entry.get('timestamp'),
+                    entry.get('type'),
+                    entry.get('status'),
+                    entry.get('token_address'),
+                    entry.get('symbol'),
+                    json.dumps(entry, ensure_ascii=False)
+                )
+            )
+            
+        return {'id': cursor.lastrowid, **entry}
+    
+    def import_trades(self, entries: List[Dict]) -> int:
+        rows = [
+            (
+                entry.get('id'),
+                entry.get('timestamp') or '',
+                entry.get('type'),
+                entry.get('status'),
+                entry.get('token_address'),
+                entry.get('symbol'),
+                json.dumps({k: v for k, v in entry.items() if k != 'id'}, ensure_ascii=False)
+            )
+            for entry in entries
+        ]
+        
+        conn = self._connection()
+        changes_before = conn.total_changes
+        
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO trades (id, timestamp, type, status, token_address, symbol, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            
+        # INSERT OR IGNORE: bereits vorhandene IDs zählen nicht als importiert
+        return conn.total_changes - changes_before
+    
+    def iter_trades(self) -> Iterator[Dict]:
+        cursor = self._connection().execute("SELECT id, data FROM trades ORDER BY id")
+        
+        for row in cursor:
+            yield self._row_to_trade(row)
+    
+    def recent_trades(self, limit: int) -> List[Dict]:
+        rows = self._connection().execute(
+            "SELECT id, data FROM trades ORDER BY id DESC LIMIT ?", (max(limit, 0),)
+        ).fetchall()
+        
+        return [self._row_to_trade(row) for row in reversed(rows)]
+    
+    def has_trades(self) -> bool:
+        return self._connection().execute("SELECT 1 FROM trades LIMIT 1").fetchone() is not None
+    
+    def last_trade_id(self) -> int:
+        return self._connection().execute("SELECT COALESCE(MAX(id), 0) FROM trades").fetchone()[0]
+    
+    def load_positions(self) -> Dict:
+        rows = self._connection().execute(
+            "SELECT token_address, data FROM positions WHERE status = 'active'"
+        ).fetchall()
+        
+        return {token_address: json.loads(data) for token_address, data in rows}
+    
+    def save_position(self, position: Dict):
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO positions (token_address, status, entry_timestamp, data) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    position['token_address'],
+                    position.get('status', 'active'),
+                    position.get('entry_timestamp'),
+                    json.dumps(position, ensure_ascii=False)
+                )
+            )
+    
+    def delete_position(self, token_address: str) -> bool:
+        with self._connection() as conn:
+            cursor = conn.execute("DELETE FROM positions WHERE token_address = ?", (token_address,))
+            
+        return cursor.rowcount > 0
+    
+    def save_positions(self, positions: Dict):
+        with self._connection() as conn:
+            conn.execute("DELETE FROM positions")
+            conn.executemany(
+                "INSERT INTO positions (token_address, status, entry_timestamp, data) VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        position['token_address'],
+                        position.get('status', 'active'),
+                        position.get('entry_timestamp'),
+                        json.dumps(position, ensure_ascii=False)
+                    )
+                    for position in positions.values()
+                ]
+            )
+
+
+def create_storage(backend: str, base_dir: Path, read_only: bool = False) -> TradeStorage:
+    """
+    Erstellt das konfigurierte Storage Backend
+    
+    Args:
+        backend: 'json' oder 'sqlite'
+        base_dir: Verzeichnis der Datendateien
+        read_only: Nur lesender Zugriff (Monitoring)
+        
+    Returns:
+        TradeStorage: Backend Instanz
+    """
+    base_dir = Path(base_dir)
+    
+    if backend == 'sqlite':
+        return SqliteStorage(base_dir / 'memero.db', read_only=read_only)
+        
+    if backend != 'json':
+        logger.warning(f"Unbekanntes STORAGE_BACKEND '{backend}' - nutze json")
+        
+    return JsonStorage(base_dir / 'trades.jsonl', base_dir / 'positions.json')
+
+
+def migrate_json_to_sqlite(base_dir: Path) -> Dict:
+    """
+    Einmalige Migration der JSON-Daten (trades.jsonl/trades.json, positions.json) nach SQLite
+    
+    Args:
+        base_dir: Verzeichnis der Datendateien
+        
+    Returns:
+        Dict: Anzahl migrierter Trades und Positionen
+    """
+    base_dir = Path(base_dir)
+    source = JsonStorage(base_dir / 'trades.jsonl', base_dir / 'positions.json')
+    target = SqliteStorage(base_dir / 'memero.db')
+    
+    if target.has_trades():
+        raise RuntimeError(f"{target.db_file.name} enthält bereits Trades - Migration abgebrochen")
+        
+    trades = list(source.iter_trades())
+    
+    # Noch nicht ins Journal übernommene Alt-Daten direkt aus trades.json lesen
+    legacy_file = base_dir / 'trades.json'
+    if not trades and legacy_file.exists():
+        with open(legacy_file, 'r') as f:
+            trades = json.load(f)
+            
+    migrated_trades = target.import_trades(trades)
+    
+    positions = source.load_positions()
+    for position in positions.values():
+        target.save_position(position)
+        
+    logger.info(f"Migration abgeschlossen: {migrated_trades} Trades, {len(positions)} Positionen")
+    return {'trades': migrated_trades, 'positions': len(positions)}
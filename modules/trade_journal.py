@@ -0,0 +1,226 @@
+"""
+MEMERO Trading Bot - Trade Journal
+Append-Only Speicher für die Trade-Historie (JSON Lines)
+
+Jeder Trade ist eine Zeile in trades.jsonl:
+- Append ist O(1), es wird nie die ganze Historie neu geschrieben
+- Leser sehen nie eine halb geschriebene Datei (unvollständige Zeilen werden übersprungen)
+- Die ID-Sequenz wird in trades.seq persistiert
+- Volle Segmente werden versiegelt (trades-000001.jsonl, ...) und können kompaktiert werden
+"""
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Aktives Segment wird ab dieser Größe versiegelt
+DEFAULT_SEGMENT_MAX_BYTES = 5 * 1024 * 1024
+
+
+class TradeJournal:
+    """
+    Append-Only Journal für Trades im JSON Lines Format
+    """
+    
+    def __init__(self, path: Path, segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES):
+        self.path = Path(path)
+        self.seq_file = self.path.with_suffix('.seq')
+        self.segment_max_bytes = segment_max_bytes
+        self._segment_pattern = re.compile(
+            rf'^{re.escape(self.path.stem)}-(\d+){re.escape(self.path.suffix)}$'
+        )
+        
+        # Nur lesen: trades.jsonl/trades.seq entstehen erst beim ersten Schreiben
+        self._last_id = self._load_sequence()
+        
+    # ========================================================================
+    # SCHREIBEN
+    # ========================================================================
+    
+    def append(self, entry: Dict) -> Dict:
+        """
+        Hängt einen Eintrag an das Journal an und vergibt die nächste ID
+        
+        Args:
+            entry: Trade-Eintrag (ohne 'id')
+            
+        Returns:
+            Dict: Eintrag inkl. vergebener 'id'
+        """
+        # ID zuerst reservieren: Crash nach diesem Schritt erzeugt eine Lücke, nie ein Duplikat
+        self._last_id += 1
+        self._save_sequence(self._last_id)
+        
+        entry = {'id': self._last_id, **entry}
+        self._write_lines([entry])
+        
+        if self.path.stat().st_size >= self.segment_max_bytes:
+            self._seal_active_segment()
+            
+        return entry
+    
+    def import_entries(self, entries: List[Dict]) -> int:
+        """
+        Übernimmt bestehende Einträge (inkl. ID), z.B. aus dem alten trades.json
+        
+        Args:
+            entries: Liste von Trade-Einträgen
+            
+        Returns:
+            int: Anzahl importierter Einträge
+        """
+        if not entries:
+            return 0
+            
+        self._write_lines(entries)
+        
+        max_id = max(int(e.get('id') or 0) for e in entries)
+        if max_id > self._last_id:
+            self._last_id = max_id
+            self._save_sequence(self._last_id)
+            
+        return len(entries)
+    
+    def _write_lines(self, entries: List[Dict]):
+        """Schreibt Einträge als vollständige Zeilen in einem write() Aufruf"""
+        data = ''.join(json.dumps(e, ensure_ascii=False) + '\n' for e in entries)
+        
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            
+    # ========================================================================
+    # LESEN
+    # ========================================================================
+    
+    def iter_entries(self) -> Iterator[Dict]:
+        """
+        Streamt alle Einträge in Schreibreihenfolge (versiegelte Segmente, dann aktives)
+        
+        Yields:
+            Dict: Trade-Eintrag
+        """
+        for segment in [path for _, path in self._sealed_segments()] + [self.path]:
+            yield from self._iter_file(segment)
+    
+    @property
+    def last_id(self) -> int:
+        """Zuletzt vergebene ID"""
+        return self._last_id
+    
+    def is_empty(self) -> bool:
+        """
+        Returns:
+            bool: True wenn das Journal keine Einträge enthält
+        """
+        return not self._sealed_segments() and (not self.path.exists() or self.path.stat().st_size == 0)
+    
+    def _iter_file(self, path: Path) -> Iterator[Dict]:
+        """Liest eine Segment-Datei zeilenweise"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    # Zeile ohne Newline = gerade in Arbeit -> überspringen
+                    if not line.endswith('\n'):
+                        continue
+                        
+                    line = line.strip()
+                    if not line:
+                        continue
+                        
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Ungültige Journal-Zeile in {path.name} übersprungen")
+        except FileNotFoundError:
+            # Segment wurde zwischenzeitlich kompaktiert
+            return
+            
+    # ========================================================================
+    # SEGMENTE & KOMPAKTIERUNG
+    # ========================================================================
+    
+    def _sealed_segments(self) -> List[Tuple[int, Path]]:
+        """
+        Returns:
+            List[Tuple[int, Path]]: Versiegelte Segmente sortiert nach Nummer
+        """
+        segments = []
+        
+        for path in self.path.parent.iterdir():
+            match = self._segment_pattern.match(path.name)
+            if match:
+                segments.append((int(match.group(1)), path))
+                
+        return sorted(segments)
+    
+    def _segment_path(self, number: int) -> Path:
+        return self.path.with_name(f"{self.path.stem}-{number:06d}{self.path.suffix}")
+    
+    def _seal_active_segment(self):
+        """Versiegelt das aktive Segment und beginnt ein neues"""
+        segments = self._sealed_segments()
+        number = segments[-1][0] + 1 if segments else 1
+        
+        os.replace(self.path, self._segment_path(number))
+        self.path.touch()
+        
+        logger.info(f"Trade Journal Segment #{number} versiegelt")
+    
+    def compact(self) -> int:
+        """
+        Fasst alle versiegelten Segmente zu einem einzigen Segment zusammen
+        
+        Returns:
+            int: Anzahl zusammengefasster Segmente
+        """
+        segments = self._sealed_segments()
+        
+        if len(segments) < 2:
+            return 0
+            
+        target_number, target_path = segments[0]
+        tmp_path = target_path.with_name(target_path.name + '.tmp')
+        
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            for _, path in segments:
+                for entry in self._iter_file(path):
+                    out.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            out.flush()
+            os.fsync(out.fileno())
+            
+        os.replace(tmp_path, target_path)
+        
+        for _, path in segments[1:]:
+            path.unlink()
+            
+        logger.info(f"Trade Journal kompaktiert: {len(segments)} Segmente -> Segment #{target_number}")
+        return len(segments)
+        
+    # ========================================================================
+    # ID-SEQUENZ
+    # ========================================================================
+    
+    def _load_sequence(self) -> int:
+        """
+        Lädt die letzte vergebene ID (Fallback: Scan des Journals)
+        
+        Die Sequenz wird hier nicht geschrieben - append() persistiert sie
+        ohnehin vor jedem neuen Eintrag.
+        """
+        try:
+            return int(self.seq_file.read_text().strip())
+        except (FileNotFoundError, ValueError):
+            return max((int(e.get('id') or 0) for e in self.iter_entries()), default=0)
+    
+    def _save_sequence(self, last_id: int):
+        """Schreibt die ID-Sequenz atomar (Temp-Datei + Rename)"""
+        tmp_path = self.seq_file.with_name(self.seq_file.name + '.tmp')
+        tmp_path.write_text(str(last_id))
+        os.replace(tmp_path, self.seq_file)
@@ -2,25 +2,37 @@
 MEMERO Trading Bot - Trade Manager
 Persistente Trade-Datenbank für Monitoring
 
-Speichert alle Trades in trades.json:
+Speichert alle Trades über ein austauschbares Storage Backend (siehe storage.py):
 - Entry Trades (BUY)
 - Exit Trades (SELL)
 - Trade Status
 - Performance Metrics
+
+Default ist das Append-Only Journal trades.jsonl, alternativ SQLite (STORAGE_BACKEND=sqlite).
+
+Wartung (Kompaktierung etc.): python -m modules.maintenance --help
 """
 
+import atexit
 import json
 import logging
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from enum import Enum
 
+import config
+from modules.storage import TradeStorage, create_storage
+from modules.trade_stats import TradeStats, TradeStatsFile
+
 logger = logging.getLogger(__name__)
 
 # Pfade
-TRADES_FILE = Path(__file__).parent.parent / 'trades.json'
-POSITIONS_FILE = Path(__file__).parent.parent / 'positions.json'
+DATA_DIR = Path(__file__).parent.parent
+LEGACY_TRADES_FILE = DATA_DIR / 'trades.json'
+STATS_FILE = DATA_DIR / 'trade_stats.json'
 
 
 class TradeType(Enum):
@@ -47,19 +59,68 @@ class ExitReason(Enum):
 class TradeManager:
     """
     Verwaltet Trade-Historie und offene Positionen
+    
+    Der Konstruktor öffnet kein Storage (keine Datei, keine DB-Connection).
+    Migration, Prüfung der Statistiken und Laden der Positionen laufen erst
+    mit prepare() beim Bot-Start.
     """
     
-    def __init__(self):
-        self.trades_file = TRADES_FILE
-        self.positions_file = POSITIONS_FILE
-        self._ensure_files_exist()
+    def __init__(self, storage: Optional[TradeStorage] = None, read_only: bool = False):
+        """
+        Args:
+            storage: Storage Backend (Default: STORAGE_BACKEND aus config)
+            read_only: Nur lesender Zugriff (Monitoring) - kein Flush beim Shutdown
+        """
+        self.read_only = read_only
+        self.storage = storage or create_storage(config.STORAGE_BACKEND, DATA_DIR, read_only=read_only)
+        
+        # Bot schreibt aus Main-Loop und Watcher-Thread (Portfolio Mode)
+        self._lock = threading.RLock()
+        
+        # Laufende Aggregate (O(1) pro Trade statt Scan der Historie)
+        self.stats_file = TradeStatsFile(STATS_FILE)
+        self.stats = self.stats_file.load() or TradeStats()
+        
+        # In-Memory Positions-Tabelle mit Write-Behind (geladen in prepare()):
+        # PnL-Updates landen nur im Speicher und werden gebündelt geschrieben
+        self._positions: Dict = {}
+        self._positions_dirty = False
+        self._last_positions_flush = time.monotonic()
+        self.position_flush_interval = config.POSITION_FLUSH_INTERVAL
+        
+        if not read_only:
+            atexit.register(self.close)
     
-    def _ensure_files_exist(self):
-        """Erstellt Dateien falls nicht vorhanden"""
-        if not self.trades_file.exists():
-            self._save_trades([])
-        if not self.positions_file.exists():
-            self._save_positions({})
+    def prepare(self):
+        """
+        Startschritte des Bots: Legacy-Migration, Prüfung der Statistiken
+        und Laden der offenen Positionen
+        
+        Wird einmal aus main.py aufgerufen, bevor Trades geschrieben werden.
+        """
+        if self.read_only:
+            raise RuntimeError("TradeManager ist read-only (Monitoring)")
+        
+        with self._lock:
+            self._migrate_legacy_trades()
+            self.stats = self._load_stats()
+            self._positions = self.load_positions()
+    
+    def _migrate_legacy_trades(self):
+        """Übernimmt einmalig die Trades aus dem alten trades.json ins Journal"""
+        if self.storage.name != 'json' or not LEGACY_TRADES_FILE.exists() or self.storage.has_trades():
+            return
+        
+        try:
+            with open(LEGACY_TRADES_FILE, 'r') as f:
+                legacy_trades = json.load(f)
+            
+            imported = self.storage.import_trades(legacy_trades)
+            if imported:
+                logger.info(f"{imported} Trades aus {LEGACY_TRADES_FILE.name} ins Journal übernommen")
+                
+        except Exception as e:
+            logger.error(f"Fehler bei der Migration von {LEGACY_TRADES_FILE.name}: {e}")
     
     # ========================================================================
     # TRADES
@@ -67,7 +128,7 @@ class TradeManager:
     
     def save_trade(self, trade_data: Dict) -> bool:
         """
-        Speichert einen Trade in trades.json
+        Speichert einen Trade im Storage Backend
         
         Args:
             trade_data: Trade-Informationen mit allen Details
@@ -75,112 +136,159 @@ class TradeManager:
         Returns:
             bool: True wenn erfolgreich
         """
-        try:
-            trades = self.load_trades()
-            
-            # Erstelle Trade-Eintrag
-            trade_entry = {
-                'id': len(trades) + 1,
-                'timestamp': datetime.now().isoformat(),
-                'type': trade_data.get('type', 'BUY'),
-                'status': trade_data.get('status', 'PENDING'),
-                'token_address': trade_data.get('token_address'),
-                'symbol': trade_data.get('symbol'),
-                'signature': trade_data.get('signature'),
-                
-                # Trade-Details
-                'amount_sol': trade_data.get('amount_sol', 0),
-                'amount_tokens': trade_data.get('amount_tokens', 0),
-                'entry_price': trade_data.get('entry_price'),
-                'exit_price': trade_data.get('exit_price'),
+        with self._lock:
+            try:
+                # Erstelle Trade-Eintrag (ID vergibt das Storage Backend)
+                trade_entry = {
+                    'timestamp': datetime.now().isoformat(),
+                    'type': trade_data.get('type', 'BUY'),
+                    'status': trade_data.get('status', 'PENDING'),
+                    'token_address': trade_data.get('token_address'),
+                    'symbol': trade_data.get('symbol'),
+                    'signature': trade_data.get('signature'),
+                    
+                    # Trade-Details
+                    'amount_sol': trade_data.get('amount_sol', 0),
+                    'amount_tokens': trade_data.get('amount_tokens', 0),  # raw (kleinste Einheit)
+                    'token_decimals': trade_data.get('token_decimals'),
+                    'entry_price': trade_data.get('entry_price'),
+                    'exit_price': trade_data.get('exit_price'),
+                    
+                    # Performance
+                    'profit_sol': trade_data.get('profit_sol'),
+                    'profit_percent': trade_data.get('profit_percent'),
+                    
+                    # Exit Info
+                    'exit_reason': trade_data.get('exit_reason'),
+                    'error_message': trade_data.get('error_message'),
+                    
+                    # Analyst Info
+                    'confidence': trade_data.get('confidence'),
+                    'risk_score': trade_data.get('risk_score'),
+                    'reasoning': trade_data.get('reasoning')
+                }
                 
-                # Performance
-                'profit_sol': trade_data.get('profit_sol'),
-                'profit_percent': trade_data.get('profit_percent'),
+                trade_entry = self.storage.append_trade(trade_entry)
+                self._update_stats(trade_entry)
                 
-                # Exit Info
-                'exit_reason': trade_data.get('exit_reason'),
-                'error_message': trade_data.get('error_message'),
+                logger.info(f"Trade #{trade_entry['id']} gespeichert: {trade_entry['type']} {trade_entry['symbol']}")
+                return True
                 
-                # Analyst Info
-                'confidence': trade_data.get('confidence'),
-                'risk_score': trade_data.get('risk_score'),
-                'reasoning': trade_data.get('reasoning')
-            }
-            
-            trades.append(trade_entry)
-            self._save_trades(trades)
-            
-            logger.info(f"Trade #{trade_entry['id']} gespeichert: {trade_entry['type']} {trade_entry['symbol']}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Fehler beim Speichern des Trades: {e}")
-            return False
+            except Exception as e:
+                logger.error(f"Fehler beim Speichern des Trades: {e}")
+                return False
     
     def load_trades(self) -> List[Dict]:
         """
-        Lädt alle Trades aus trades.json
+        Lädt alle Trades aus dem Storage Backend
         
         Returns:
             List[Dict]: Liste aller Trades
         """
         try:
-            with open(self.trades_file, 'r') as f:
-                return json.load(f)
+            return list(self.iter_trades())
         except Exception as e:
             logger.error(f"Fehler beim Laden der Trades: {e}")
             return []
     
-    def _save_trades(self, trades: List[Dict]):
-        """Speichert Trades in Datei"""
-        with open(self.trades_file, 'w') as f:
-            json.dump(trades, f, indent=2)
+    def iter_trades(self) -> Iterator[Dict]:
+        """
+        Streamt alle Trades ohne die Historie komplett zu laden
+        
+        Yields:
+            Dict: Trade-Eintrag
+        """
+        return self.storage.iter_trades()
+    
+    def get_recent_trades(self, limit: int = 50) -> List[Dict]:
+        """
+        Lädt die letzten N Trades (älteste zuerst)
+        
+        Args:
+            limit: Max Anzahl Trades
+            
+        Returns:
+            List[Dict]: Liste der letzten Trades
+        """
+        try:
+            return self.storage.recent_trades(limit)
+        except Exception as e:
+            logger.error(f"Fehler beim Laden der letzten Trades: {e}")
+            return []
+    
+    def compact_trades(self) -> int:
+        """
+        Fasst versiegelte Journal-Segmente zusammen (nur JSON Backend)
+        
+        Returns:
+            int: Anzahl zusammengefasster Segmente
+        """
+        with self._lock:
+            return self.storage.compact()
     
     def get_trade_stats(self) -> Dict:
         """
-        Berechnet Statistiken aus Trade-Historie
+        Liefert Statistiken aus den laufenden Aggregaten (O(1))
         
         Returns:
             Dict: Performance-Metriken
         """
-        trades = self.load_trades()
-        
-        if not trades:
-            return {
-                'total_trades': 0,
-                'successful_trades': 0,
-                'failed_trades': 0,
-                'total_profit_sol': 0,
-                'total_profit_percent': 0,
-                'win_rate': 0,
-                'wins': 0,
-                'losses': 0
-            }
+        return self.get_stats().summary()
+    
+    def get_stats(self) -> TradeStats:
+        """
+        Liefert die laufenden Aggregate
         
-        successful = [t for t in trades if t.get('status') == 'SUCCESS']
-        failed = [t for t in trades if t.get('status') == 'FAILED']
+        Prozesse die selbst keine Trades schreiben (Monitoring) laden
+        trade_stats.json nur neu, wenn der Bot sie aktualisiert hat.
         
-        # Nur Trades mit Exit (vollständig)
-        completed = [t for t in successful if t.get('exit_price') is not None]
+        Returns:
+            TradeStats: Aktuelle Statistiken
+        """
+        with self._lock:
+            if self.stats_file.has_changed():
+                stats = self.stats_file.load()
+                if stats is not None:
+                    self.stats = stats
+            
+            return self.stats
+    
+    def rebuild_stats(self) -> Dict:
+        """
+        Berechnet die Aggregate komplett aus der Trade-Historie neu (Verifikation)
         
-        wins = [t for t in completed if (t.get('profit_percent') or 0) > 0]
-        losses = [t for t in completed if (t.get('profit_percent') or 0) < 0]
+        Returns:
+            Dict: {'previous': alte Aggregate, 'rebuilt': neu berechnete Aggregate}
+        """
+        with self._lock:
+            previous = self.get_stats().to_dict()
+            
+            self.stats = TradeStats.rebuild(self.iter_trades())
+            # Lücken in der ID-Sequenz (z.B. nach Crash) nicht als Abweichung werten
+            self.stats.last_trade_id = self.storage.last_trade_id()
+            self.stats_file.save(self.stats)
+            
+            return {'previous': previous, 'rebuilt': self.stats.to_dict()}
+    
+    def _load_stats(self) -> TradeStats:
+        """Lädt die Aggregate, baut sie neu auf wenn sie fehlen oder veraltet sind"""
+        stats = self.stats_file.load()
         
-        total_profit_sol = sum(t.get('profit_sol', 0) for t in completed)
-        avg_profit_percent = sum(t.get('profit_percent', 0) for t in completed) / len(completed) if completed else 0
+        if stats is not None and stats.last_trade_id == self.storage.last_trade_id():
+            return stats
         
-        return {
-            'total_trades': len(trades),
-            'successful_trades': len(successful),
-            'failed_trades': len(failed),
-            'completed_trades': len(completed),
-            'wins': len(wins),
-            'losses': len(losses),
-            'total_profit_sol': round(total_profit_sol, 6),
-            'avg_profit_percent': round(avg_profit_percent, 2),
-            'win_rate': round((len(wins) / len(completed) * 100) if completed else 0, 1)
-        }
+        logger.info("Trade-Statistiken fehlen oder sind veraltet - berechne neu...")
+        self.stats = TradeStats()
+        self.rebuild_stats()
+        return self.stats
+    
+    def _update_stats(self, trade_entry: Dict):
+        """Schreibt die Aggregate mit einem neuen Trade fort"""
+        try:
+            self.stats.apply(trade_entry)
+            self.stats_file.save(self.stats)
+        except Exception as e:
+            logger.error(f"Fehler beim Aktualisieren der Trade-Statistiken: {e}")
     
     # ========================================================================
     # POSITIONS
@@ -196,32 +304,34 @@ class TradeManager:
         Returns:
             bool: True wenn erfolgreich
         """
-        try:
-            positions = self.load_positions()
-            
-            token_address = position_data['token_address']
-            
-            position = {
-                'token_address': token_address,
-                'symbol': position_data.get('symbol'),
-                'entry_timestamp': datetime.now().isoformat(),
-                'entry_price': position_data.get('entry_price'),
-                'amount_sol': position_data.get('amount_sol'),
-                'amount_tokens': position_data.get('amount_tokens'),
-                'signature': position_data.get('signature'),
-                'confidence': position_data.get('confidence'),
-                'risk_score': position_data.get('risk_score')
-            }
-            
-            positions[token_address] = position
-            self._save_positions(positions)
-            
-            logger.info(f"Position hinzugefügt: {position['symbol']} ({token_address[:8]}...)")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Fehler beim Hinzufügen der Position: {e}")
-            return False
+        with self._lock:
+            try:
+                token_address = position_data['token_address']
+                
+                position = {
+                    'token_address': token_address,
+                    'symbol': position_data.get('symbol'),
+                    'entry_timestamp': datetime.now().isoformat(),
+                    'entry_price': position_data.get('entry_price'),
+                    'amount_sol': position_data.get('amount_sol'),
+                    'amount_tokens': position_data.get('amount_tokens'),  # raw (kleinste Einheit)
+                    'token_decimals': position_data.get('token_decimals'),
+                    'signature': position_data.get('signature'),
+                    'confidence': position_data.get('confidence'),
+                    'risk_score': position_data.get('risk_score')
+                }
+                
+                self._positions[token_address] = position
+                
+                # Entry sofort persistieren
+                self.flush_positions(force=True)
+                
+                logger.info(f"Position hinzugefügt: {position['symbol']} ({token_address[:8]}...)")
+                return True
+                
+            except Exception as e:
+                logger.error(f"Fehler beim Hinzufügen der Position: {e}")
+                return False
     
     def remove_position(self, token_address: str) -> bool:
         """
@@ -233,61 +343,119 @@ class TradeManager:
         Returns:
             bool: True wenn erfolgreich
         """
-        try:
-            positions = self.load_positions()
-            
-            if token_address in positions:
-                del positions[token_address]
-                self._save_positions(positions)
-                logger.info(f"Position entfernt: {token_address[:8]}...")
-                return True
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"Fehler beim Entfernen der Position: {e}")
-            return False
+        with self._lock:
+            try:
+                if self._positions.pop(token_address, None) is not None:
+                    # Exit sofort persistieren
+                    self.flush_positions(force=True)
+                    logger.info(f"Position entfernt: {token_address[:8]}...")
+                    return True
+                
+                return False
+                
+            except Exception as e:
+                logger.error(f"Fehler beim Entfernen der Position: {e}")
+                return False
     
     def load_positions(self) -> Dict:
         """
-        Lädt alle offenen Positionen
+        Lädt alle offenen Positionen vom Storage (Monitoring / Leser-Prozesse)
         
         Returns:
             Dict: {token_address: position_data}
         """
         try:
-            with open(self.positions_file, 'r') as f:
-                return json.load(f)
+            return self.storage.load_positions()
         except Exception as e:
             logger.error(f"Fehler beim Laden der Positionen: {e}")
             return {}
     
-    def _save_positions(self, positions: Dict):
-        """Speichert Positionen in Datei"""
-        with open(self.positions_file, 'w') as f:
-            json.dump(positions, f, indent=2)
+    def get_positions(self) -> Dict:
+        """
+        Liefert die In-Memory Positions-Tabelle des Bots (ohne Disk-Zugriff)
+        
+        Returns:
+            Dict: {token_address: position_data}
+        """
+        with self._lock:
+            return {address: dict(position) for address, position in self._positions.items()}
     
     def update_position_pnl(self, token_address: str, current_price: float, pnl_percent: float):
         """
-        Aktualisiert PnL einer Position
+        Aktualisiert PnL einer Position (nur im Speicher, Write-Behind)
         
         Args:
             token_address: Token Address
             current_price: Aktueller Preis
             pnl_percent: Profit/Loss in Prozent
         """
-        try:
-            positions = self.load_positions()
+        with self._lock:
+            try:
+                position = self._positions.get(token_address)
+                
+                if position:
+                    position['current_price'] = current_price
+                    position['pnl_percent'] = pnl_percent
+                    position['last_update'] = datetime.now().isoformat()
+                    self._positions_dirty = True
+                    
+                    self.flush_positions()
+                    
+            except Exception as e:
+                logger.error(f"Fehler beim Update der Position PnL: {e}")
+    
+    def flush_positions(self, force: bool = False) -> bool:
+        """
+        Schreibt die Positions-Tabelle auf Disk
+        
+        Ohne force nur, wenn Änderungen vorliegen und POSITION_FLUSH_INTERVAL
+        seit dem letzten Flush vergangen ist.
+        
+        Args:
+            force: Sofort schreiben (Entry, Exit, Shutdown)
             
-            if token_address in positions:
-                positions[token_address]['current_price'] = current_price
-                positions[token_address]['pnl_percent'] = pnl_percent
-                positions[token_address]['last_update'] = datetime.now().isoformat()
-                self._save_positions(positions)
+        Returns:
+            bool: True wenn geschrieben wurde
+        """
+        with self._lock:
+            if not force:
+                if not self._positions_dirty:
+                    return False
+                if time.monotonic() - self._last_positions_flush < self.position_flush_interval:
+                    return False
+            
+            try:
+                self.storage.save_positions(self._positions)
+                self._positions_dirty = False
+                self._last_positions_flush = time.monotonic()
+                logger.debug(f"Positionen gespeichert ({len(self._positions)} offen)")
+                return True
                 
-        except Exception as e:
-            logger.error(f"Fehler beim Update der Position PnL: {e}")
+            except Exception as e:
+                logger.error(f"Fehler beim Speichern der Positionen: {e}")
+                return False
+    
+    def close(self):
+        """Schreibt ausstehende Positions-Updates beim Shutdown"""
+        with self._lock:
+            if self._positions_dirty:
+                self.flush_positions(force=True)
+
+
+# Singleton Instance des Bots - erst beim ersten Zugriff erstellt, damit Leser
+# (Monitoring), die nur TradeManager importieren, keine Read-Write Instanz erzeugen
+_trade_manager: Optional[TradeManager] = None
+_trade_manager_lock = threading.Lock()
 
 
-# Singleton Instance
-trade_manager = TradeManager()
+def __getattr__(name: str):
+    global _trade_manager
+    
+    if name != 'trade_manager':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    with _trade_manager_lock:
+        if _trade_manager is None:
+            _trade_manager = TradeManager()
+    
+    return _trade_manager
@@ -0,0 +1,232 @@
+"""
+MEMERO Trading Bot - Trade Statistiken
+Laufende Aggregate, die bei jedem save_trade() fortgeschrieben werden
+
+Statt bei jedem /api/stats Call die komplette Historie zu durchlaufen,
+werden Zähler, Summen, Best/Worst Trade und PnL pro Tag inkrementell
+gepflegt und atomar in trade_stats.json neben dem Trade-Speicher abgelegt.
+
+Neuberechnung zur Verifikation:
+    python -m modules.maintenance rebuild-stats
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from modules.storage import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+
+class TradeStats:
+    """
+    Inkrementell gepflegte Trade-Statistiken
+    """
+    
+    FIELDS = (
+        'last_trade_id',
+        'total_trades',
+        'successful_trades',
+        'failed_trades',
+        'completed_trades',
+        'wins',
+        'losses',
+        'total_profit_sol',
+        'total_profit_percent',
+        'sell_trades',
+        'best_trade',
+        'worst_trade'
+    )
+    
+    def __init__(self):
+        self.last_trade_id = 0
+        self.total_trades = 0
+        self.successful_trades = 0
+        self.failed_trades = 0
+        
+        # Trades mit Exit (SUCCESS + exit_price)
+        self.completed_trades = 0
+        self.wins = 0
+        self.losses = 0
+        self.total_profit_sol = 0.0
+        self.total_profit_percent = 0.0
+        
+        # Erfolgreiche SELL-Trades (Best/Worst, PnL pro Tag)
+        self.sell_trades = 0
+        self.best_trade: Optional[float] = None
+        self.worst_trade: Optional[float] = None
+        self.daily_pnl: Dict[str, float] = {}  # 'YYYY-MM-DD' -> profit_sol
+    
+    def apply(self, trade: Dict):
+        """
+        Schreibt die Aggregate mit einem neuen Trade fort (O(1))
+        
+        Args:
+            trade: Gespeicherter Trade-Eintrag
+        """
+        self.last_trade_id = max(self.last_trade_id, int(trade.get('id') or 0))
+        self.total_trades += 1
+        
+        status = trade.get('status')
+        
+        if status == 'FAILED':
+            self.failed_trades += 1
+            return
+            
+        if status != 'SUCCESS':
+            return
+            
+        self.successful_trades += 1
+        
+        profit_sol = trade.get('profit_sol') or 0
+        profit_percent = trade.get('profit_percent') or 0
+        
+        if trade.get('exit_price') is not None:
+            self.completed_trades += 1
+            self.total_profit_sol += profit_sol
+            self.total_profit_percent += profit_percent
+            
+            if profit_percent > 0:
+                self.wins += 1
+            elif profit_percent < 0:
+                self.losses += 1
+                
+        if trade.get('type') == 'SELL':
+            self.sell_trades += 1
+            
+            if self.best_trade is None or profit_percent > self.best_trade:
+                self.best_trade = profit_percent
+            if self.worst_trade is None or profit_percent < self.worst_trade:
+                self.worst_trade = profit_percent
+                
+            day = (trade.get('timestamp') or '')[:10]
+            if day:
+                self.daily_pnl[day] = self.daily_pnl.get(day, 0) + profit_sol
+    
+    def get_daily_pnl(self, day: str) -> float:
+        """
+        Args:
+            day: Datum im Format 'YYYY-MM-DD'
+            
+        Returns:
+            float: Summe profit_sol der erfolgreichen SELL-Trades an diesem Tag
+        """
+        return self.daily_pnl.get(day, 0)
+    
+    def summary(self) -> Dict:
+        """
+        Returns:
+            Dict: Performance-Metriken im Format von TradeManager.get_trade_stats()
+        """
+        if not self.total_trades:
+            return {
+                'total_trades': 0,
+                'successful_trades': 0,
+                'failed_trades': 0,
+                'total_profit_sol': 0,
+                'total_profit_percent': 0,
+                'win_rate': 0,
+                'wins': 0,
+                'losses': 0
+            }
+            
+        completed = self.completed_trades
+        avg_profit_percent = self.total_profit_percent / completed if completed else 0
+        
+        return {
+            'total_trades': self.total_trades,
+            'successful_trades': self.successful_trades,
+            'failed_trades': self.failed_trades,
+            'completed_trades': completed,
+            'wins': self.wins,
+            'losses': self.losses,
+            'total_profit_sol': round(self.total_profit_sol, 6),
+            'avg_profit_percent': round(avg_profit_percent, 2),
+            'win_rate': round((self.wins / completed * 100) if completed else 0, 1)
+        }
+    
+    def to_dict(self) -> Dict:
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        data['daily_pnl'] = self.daily_pnl
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TradeStats':
+        stats = cls()
+        
+        for field in cls.FIELDS:
+            if field in data:
+                setattr(stats, field, data[field])
+                
+        stats.daily_pnl = dict(data.get('daily_pnl') or {})
+        return stats
+    
+    @classmethod
+    def rebuild(cls, trades: Iterable[Dict]) -> 'TradeStats':
+        """
+        Berechnet alle Aggregate komplett neu
+        
+        Args:
+            trades: Alle Trades (Stream)
+            
+        Returns:
+            TradeStats: Neu berechnete Statistiken
+        """
+        stats = cls()
+        
+        for trade in trades:
+            stats.apply(trade)
+            
+        return stats
+
+
+class TradeStatsFile:
+    """
+    Persistenz der Statistiken (atomar via Temp-Datei + Rename)
+    
+    Leser (Monitoring) laden die Datei nur neu, wenn sich mtime/Größe geändert haben.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._signature = None
+    
+    def _file_signature(self):
+        try:
+            stat = self.path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+    
+    def has_changed(self) -> bool:
+        """
+        Returns:
+            bool: True wenn die Datei seit dem letzten load()/save() geändert wurde
+        """
+        return self._file_signature() != self._signature
+    
+    def load(self) -> Optional[TradeStats]:
+        """
+        Returns:
+            Optional[TradeStats]: Gespeicherte Statistiken oder None
+        """
+        try:
+            signature = self._file_signature()
+            
+            with open(self.path, 'r') as f:
+                stats = TradeStats.from_dict(json.load(f))
+                
+            self._signature = signature
+            return stats
+            
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Fehler beim Laden von {self.path.name}: {e}")
+            return None
+    
+    def save(self, stats: TradeStats):
+        atomic_write_json(self.path, stats.to_dict())
+        self._signature = self._file_signature()
@@ -4,9 +4,11 @@ Führt Security Checks durch und executed Trades via Jupiter Aggregator
 """
 
 import logging
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import base58
 import requests
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from solana.rpc.api import Client
 from solders.pubkey import Pubkey
 from solders.keypair import Keypair
@@ -14,10 +16,27 @@ from solders.transaction import VersionedTransaction
 from solders.message import MessageV0
 from solders.signature import Signature
 import config
+from modules.broadcaster import TransactionBroadcaster
+from modules.confirmation import ConfirmationTracker
+from modules.holdings import WalletHoldings, sol_change_from_meta, token_fill_from_meta
+from modules.http_client import http_client
+from modules.mint_registry import mint_registry
+from modules.pair import Decision, Pair
+from modules.priority_fees import PriorityFeeEstimator, route_accounts
+from modules.quote_cache import QuoteCache
+from modules.rpc_pool import RpcPool
+from modules.security import SecurityChecker
 from modules.trade_manager import trade_manager
 
 logger = logging.getLogger(__name__)
 
+# getTransaction liefert direkt nach 'confirmed' teils noch nichts -> kurz erneut versuchen
+FILL_LOOKUP_ATTEMPTS = 5
+FILL_LOOKUP_DELAY = 0.4
+
+# Zusätzliche Wartezeit über CONFIRMATION_TIMEOUT hinaus (langsame RPC-Calls im Tracker)
+CONFIRMATION_WAIT_GRACE = 30
+
 
 class Trader:
     """
@@ -28,9 +47,33 @@ class Trader:
     """
     
     def __init__(self):
-        self.rpc_client = Client(config.SOLANA_RPC_URL)
+        # Gleiches Interface wie solana.rpc.api.Client, verteilt auf SOLANA_RPC_URLS
+        self.rpc_client = RpcPool(
+            config.SOLANA_RPC_URLS,
+            health_check_interval=config.RPC_HEALTH_CHECK_INTERVAL,
+            hedge_reads=config.RPC_HEDGE_READS
+        )
         self.jupiter_api = config.JUPITER_API_URL
         
+        # Batch Security Checks (main.py filtert damit alle Kandidaten vor dem Analyst)
+        # Verdicts landen in der Mint Registry -> der Check vor dem Kauf braucht keinen RPC-Call
+        self.security_checker = SecurityChecker(self.rpc_client, registry=mint_registry)
+        
+        # Gebündeltes Confirmation Polling für alle Buys und Sells (auch aus dem Watcher)
+        self.confirmation_tracker = ConfirmationTracker(
+            self.rpc_client,
+            poll_interval=config.CONFIRMATION_POLL_INTERVAL,
+            timeout=config.CONFIRMATION_TIMEOUT
+        )
+        
+        # Wiederholter Send bis zur Confirmation, optional zusätzlich an BROADCAST_RPC_URLS
+        self.broadcaster = TransactionBroadcaster(
+            self.rpc_client,
+            self.confirmation_tracker,
+            extra_clients=[Client(url) for url in config.BROADCAST_RPC_URLS],
+            rebroadcast_interval=config.REBROADCAST_INTERVAL
+        )
+        
         # SECURITY: Private Key wird NUR aus Environment Variable geladen
         if not config.SOLANA_PRIVATE_KEY:
             raise ValueError("SOLANA_PRIVATE_KEY nicht in .env gesetzt!")
@@ -45,18 +88,46 @@ class Trader:
         
         self.trade_amount_sol = config.TRADE_AMOUNT_SOL
         
-    def execute_trade(self, pair: Dict) -> Optional[Dict]:
+        # Compute Unit Price pro Trade-Art statt Jupiter 'auto' (auch für Sells des Watchers)
+        self.fee_estimator = PriorityFeeEstimator(
+            self.rpc_client,
+            config.PRIORITY_FEE_PERCENTILES,
+            cache_ttl=config.PRIORITY_FEE_CACHE_TTL,
+            max_micro_lamports=config.PRIORITY_FEE_MAX_MICRO_LAMPORTS
+        )
+        
+        # Token-Bestände aus bestätigten Fills (Exit braucht keinen Balance-Read)
+        self.holdings = WalletHoldings()
+        
+        # Quotes der Top-Kandidaten werden während des LLM-Calls vorab geholt
+        self.quote_cache = QuoteCache(self._fetch_quote, ttl=config.QUOTE_TTL)
+        
+    def prefetch_quotes(self, pairs: List[Pair]):
+        """
+        Fordert Jupiter Quotes für die Top-Kandidaten im Hintergrund an (blockiert nicht)
+        
+        Args:
+            pairs: Kandidaten in der Reihenfolge, in der sie der Analyst bekommt
+        """
+        if config.QUOTE_PREFETCH_COUNT <= 0:
+            return
+            
+        self.quote_cache.prefetch([p.contract_address for p in pairs[:config.QUOTE_PREFETCH_COUNT]])
+        
+    def execute_trade(self, pair: Pair, decision: Optional[Decision] = None) -> Optional[Dict]:
         """
         Führt einen Trade aus - MIT SECURITY CHECKS!
         
         Args:
             pair: Das zu tradende Pair vom Analyst
+            decision: Entscheidung des Analysts (Confidence, Risk Score, Begründung)
             
         Returns:
             Optional[Dict]: Trade Informationen oder None bei Fehler
         """
-        contract_address = pair.get('contract_address')
-        symbol = pair.get('symbol')
+        contract_address = pair.contract_address
+        symbol = pair.symbol
+        decision_fields = decision.to_trade_fields() if decision else {}
         
         logger.info(f"=== TRADE EXECUTION START: {symbol} ({contract_address}) ===")
         
@@ -71,9 +142,7 @@ class Trader:
                 'token_address': contract_address,
                 'symbol': symbol,
                 'error_message': 'Security Check Failed',
-                'confidence': pair.get('confidence'),
-                'risk_score': pair.get('risk_score'),
-                'reasoning': pair.get('reasoning')
+                **decision_fields
             })
             
             return None
@@ -96,10 +165,9 @@ class Trader:
                 'signature': trade_result.get('signature'),
                 'amount_sol': trade_result.get('amount_sol'),
                 'amount_tokens': trade_result.get('amount_tokens'),
+                'token_decimals': trade_result.get('token_decimals'),
                 'entry_price': trade_result.get('entry_price'),
-                'confidence': pair.get('confidence'),
-                'risk_score': pair.get('risk_score'),
-                'reasoning': pair.get('reasoning')
+                **decision_fields
             })
             
             # Füge offene Position hinzu
@@ -109,9 +177,10 @@ class Trader:
                 'entry_price': trade_result.get('entry_price'),
                 'amount_sol': trade_result.get('amount_sol'),
                 'amount_tokens': trade_result.get('amount_tokens'),
+                'token_decimals': trade_result.get('token_decimals'),
                 'signature': trade_result.get('signature'),
-                'confidence': pair.get('confidence'),
-                'risk_score': pair.get('risk_score')
+                'confidence': decision_fields.get('confidence'),
+                'risk_score': decision_fields.get('risk_score')
             })
             
             return trade_result
@@ -125,9 +194,7 @@ class Trader:
                 'token_address': contract_address,
                 'symbol': symbol,
                 'error_message': 'Jupiter Swap Failed',
-                'confidence': pair.get('confidence'),
-                'risk_score': pair.get('risk_score'),
-                'reasoning': pair.get('reasoning')
+                **decision_fields
             })
             
             return None
@@ -150,55 +217,27 @@ class Trader:
         try:
             logger.info(f"Starte Security Checks für {token_address}...")
             
-            # Konvertiere zu Pubkey
-            token_pubkey = Pubkey.from_string(token_address)
-            
-            # Hole Mint Account Info via RPC
-            response = self.rpc_client.get_account_info(token_pubkey)
+            # Mint Account laden und dekodieren (gemeinsamer Decoder, siehe modules/security.py)
+            result = self.security_checker.check_token(token_address)
+            mint = result['mint']
             
-            if not response.value:
-                logger.error("❌ Token Account nicht gefunden - möglicherweise ungültige Adresse")
-                return False
-            
-            account_data = response.value.data
-            
-            # Parse Mint Account Data
-            # Solana Mint Account Structure:
-            # Bytes 0-3: mint_authority_option (0 = None, 1 = Some)
-            # Bytes 4-35: mint_authority (wenn vorhanden)
-            # Bytes 36-43: supply
-            # Bytes 44: decimals
-            # Bytes 45: is_initialized
-            # Bytes 46-49: freeze_authority_option (0 = None, 1 = Some)
-            # Bytes 50-81: freeze_authority (wenn vorhanden)
-            
-            if len(account_data) < 82:
-                logger.error("❌ Ungültige Mint Account Daten - zu kurz")
+            if mint is None:
+                logger.error(f"❌ {result['reason']} - möglicherweise ungültige Adresse")
                 return False
             
             # CHECK 1: Mint Authority
-            mint_authority_option = int.from_bytes(account_data[0:4], 'little')
-            
-            if mint_authority_option == 0:
+            if mint['mint_authority'] is None:
                 logger.info("✓ Mint Authority: DEAKTIVIERT (None)")
-                mint_authority_check = True
             else:
-                mint_authority = base58.b58encode(account_data[4:36]).decode('ascii')
-                logger.error(f"❌ Mint Authority: AKTIV ({mint_authority})")
+                logger.error(f"❌ Mint Authority: AKTIV ({mint['mint_authority']})")
                 logger.error("   RISIKO: Token-Supply kann beliebig erhöht werden!")
-                mint_authority_check = False
             
             # CHECK 2: Freeze Authority
-            freeze_authority_option = int.from_bytes(account_data[46:50], 'little')
-            
-            if freeze_authority_option == 0:
+            if mint['freeze_authority'] is None:
                 logger.info("✓ Freeze Authority: DEAKTIVIERT (None)")
-                freeze_authority_check = True
             else:
-                freeze_authority = base58.b58encode(account_data[50:82]).decode('ascii')
-                logger.error(f"❌ Freeze Authority: AKTIV ({freeze_authority})")
+                logger.error(f"❌ Freeze Authority: AKTIV ({mint['freeze_authority']})")
                 logger.error("   RISIKO: Token können eingefroren werden!")
-                freeze_authority_check = False
             
             # CHECK 3: Optional - Burned Liquidity Check
             # Dies ist komplexer und würde den Raydium Pool Contract prüfen
@@ -207,7 +246,7 @@ class Trader:
             logger.info("⚠ Burned Liquidity Check: Nicht implementiert (optional)")
             
             # Endresultat
-            all_checks_passed = mint_authority_check and freeze_authority_check
+            all_checks_passed = result['safe']
             
             if all_checks_passed:
                 logger.info("✅ ALLE SECURITY CHECKS BESTANDEN")
@@ -220,7 +259,104 @@ class Trader:
             logger.error(f"Fehler bei Security Checks: {e}", exc_info=True)
             return False
     
-    def _execute_jupiter_swap(self, token_address: str, symbol: str, pair: Dict = None) -> Optional[Dict]:
+    def _jupiter_headers(self) -> Dict:
+        """
+        Returns:
+            Dict: API Key Header (required by Jupiter API v1)
+        """
+        headers = {}
+        if config.JUPITER_API_KEY:
+            headers['x-api-key'] = config.JUPITER_API_KEY
+        else:
+            logger.warning("⚠️ JUPITER_API_KEY nicht gesetzt - API könnte fehlschlagen!")
+            logger.warning("   Hol dir einen API Key von: https://portal.jup.ag")
+            
+        return headers
+    
+    def _fetch_quote(self, token_address: str) -> Optional[Dict]:
+        """
+        Holt einen Jupiter Quote für TRADE_AMOUNT_SOL -> Token
+        
+        Wird vom Buy-Pfad und vom Quote Prefetch (QuoteCache) verwendet.
+        
+        Args:
+            token_address: Output Token Address
+            
+        Returns:
+            Optional[Dict]: Jupiter Quote oder None
+            
+        Raises:
+            requests.exceptions.RequestException: Bei Netzwerk-/HTTP-Fehlern
+        """
+        # SOL Mint Address (wrapped SOL)
+        sol_mint = "So11111111111111111111111111111111111111112"
+        
+        # Konvertiere SOL zu Lamports (1 SOL = 1_000_000_000 Lamports)
+        amount_lamports = int(self.trade_amount_sol * 1_000_000_000)
+        
+        # Quote von Jupiter (API v1 requires API key)
+        quote_url = f"{self.jupiter_api}/quote"
+        quote_params = {
+            'inputMint': sol_mint,
+            'outputMint': token_address,
+            'amount': amount_lamports,
+            'slippageBps': 50  # 0.5% Slippage
+        }
+        
+        # API Key Header (required by Jupiter API v1)
+        headers = self._jupiter_headers()
+        
+        # WORKAROUND: SSL Verification deaktiviert für Jupiter API
+        # Grund: Server-seitige DNS/Certificate Probleme mit API
+        # Jupiter ist eine bekannte, sichere API - verify=False ist hier akzeptabel
+        quote_response = http_client.get(
+            quote_url, 
+            params=quote_params,
+            headers=headers,
+            verify=False  # SSL Verification deaktiviert (siehe Kommentar oben)
+        )
+        
+        # DEBUG: Zeige HTTP Status und Response
+        logger.info(f"Jupiter Quote Response Status: {quote_response.status_code}")
+        logger.debug(f"Jupiter Quote Response Headers: {quote_response.headers}")
+        
+        # Prüfe ob Response leer ist
+        if not quote_response.text or quote_response.text.strip() == '':
+            logger.error("Jupiter API returned empty response")
+            logger.error(f"Request URL: {quote_url}")
+            logger.error(f"Request Params: {quote_params}")
+            return None
+        
+        # Prüfe ob Response HTML ist (Fehler-Seite)
+        if quote_response.text.strip().startswith('<!doctype html>') or quote_response.text.strip().startswith('<html'):
+            logger.error("Jupiter API returned HTML instead of JSON (API down or wrong URL)")
+            logger.error(f"Request URL: {quote_url}")
+            logger.error(f"Possible reasons:")
+            logger.error("  1. Jupiter API endpoint changed or is down")
+            logger.error("  2. DNS redirect/man-in-the-middle")
+            logger.error("  3. Rate limiting or IP ban")
+            logger.error(f"HTML snippet: {quote_response.text[:200]}...")
+            return None
+        
+        logger.debug(f"Jupiter Quote Raw Response (first 200 chars): {quote_response.text[:200]}")
+        
+        try:
+            quote_data = quote_response.json()
+        except ValueError as e:
+            logger.error(f"Jupiter API Response is not valid JSON: {e}")
+            logger.error(f"Response content type: {quote_response.headers.get('content-type', 'unknown')}")
+            logger.error(f"Raw Response (first 500 chars): {quote_response.text[:500]}")
+            return None
+        
+        quote_response.raise_for_status()
+        
+        if 'error' in quote_data:
+            logger.error(f"Jupiter Quote Error: {quote_data['error']}")
+            return None
+        
+        return quote_data
+    
+    def _execute_jupiter_swap(self, token_address: str, symbol: str, pair: Optional[Pair] = None) -> Optional[Dict]:
         """
         Führt einen Swap über Jupiter Aggregator aus
         
@@ -232,104 +368,51 @@ class Trader:
             Optional[Dict]: Swap Informationen oder None
         """
         try:
-            logger.info(f"Hole Jupiter Quote für {self.trade_amount_sol} SOL -> {symbol}...")
-            
-            # SOL Mint Address (wrapped SOL)
-            sol_mint = "So11111111111111111111111111111111111111112"
-            
-            # Konvertiere SOL zu Lamports (1 SOL = 1_000_000_000 Lamports)
-            amount_lamports = int(self.trade_amount_sol * 1_000_000_000)
-            
-            # Schritt 1: Hole Quote von Jupiter (API v1 requires API key)
-            quote_url = f"{self.jupiter_api}/quote"
-            quote_params = {
-                'inputMint': sol_mint,
-                'outputMint': token_address,
-                'amount': amount_lamports,
-                'slippageBps': 50  # 0.5% Slippage
-            }
-            
-            # API Key Header (required by Jupiter API v1)
-            headers = {}
-            if config.JUPITER_API_KEY:
-                headers['x-api-key'] = config.JUPITER_API_KEY
-            else:
-                logger.warning("⚠️ JUPITER_API_KEY nicht gesetzt - API könnte fehlschlagen!")
-                logger.warning("   Hol dir einen API Key von: https://portal.jup.ag")
-            
-            # WORKAROUND: SSL Verification deaktiviert für Jupiter API
-            # Grund: Server-seitige DNS/Certificate Probleme mit API
-            # Jupiter ist eine bekannte, sichere API - verify=False ist hier akzeptabel
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            
-            quote_response = requests.get(
-                quote_url, 
-                params=quote_params,
-                headers=headers,
-                timeout=30,
-                verify=False  # SSL Verification deaktiviert (siehe Kommentar oben)
-            )
-            
-            # DEBUG: Zeige HTTP Status und Response
-            logger.info(f"Jupiter Quote Response Status: {quote_response.status_code}")
-            logger.debug(f"Jupiter Quote Response Headers: {quote_response.headers}")
-            
-            # Prüfe ob Response leer ist
-            if not quote_response.text or quote_response.text.strip() == '':
-                logger.error("Jupiter API returned empty response")
-                logger.error(f"Request URL: {quote_url}")
-                logger.error(f"Request Params: {quote_params}")
-                return None
-            
-            # Prüfe ob Response HTML ist (Fehler-Seite)
-            if quote_response.text.strip().startswith('<!doctype html>') or quote_response.text.strip().startswith('<html'):
-                logger.error("Jupiter API returned HTML instead of JSON (API down or wrong URL)")
-                logger.error(f"Request URL: {quote_url}")
-                logger.error(f"Possible reasons:")
-                logger.error("  1. Jupiter API endpoint changed or is down")
-                logger.error("  2. DNS redirect/man-in-the-middle")
-                logger.error("  3. Rate limiting or IP ban")
-                logger.error(f"HTML snippet: {quote_response.text[:200]}...")
-                return None
-            
-            logger.debug(f"Jupiter Quote Raw Response (first 200 chars): {quote_response.text[:200]}")
-            
-            try:
-                quote_data = quote_response.json()
-            except ValueError as e:
-                logger.error(f"Jupiter API Response is not valid JSON: {e}")
-                logger.error(f"Response content type: {quote_response.headers.get('content-type', 'unknown')}")
-                logger.error(f"Raw Response (first 500 chars): {quote_response.text[:500]}")
-                return None
+            # Decision-to-Send Latenz (ohne Quote Round Trip, wenn der Prefetch greift)
+            started_at = time.monotonic()
+            headers = self._jupiter_headers()
             
-            quote_response.raise_for_status()
+            # Schritt 1: Quote - vorab während des LLM-Calls geholt oder jetzt
+            quote_data = self.quote_cache.take(token_address)
             
-            if 'error' in quote_data:
-                logger.error(f"Jupiter Quote Error: {quote_data['error']}")
+            if quote_data is None:
+                logger.info(f"Hole Jupiter Quote für {self.trade_amount_sol} SOL -> {symbol}...")
+                quote_data = self._fetch_quote(token_address)
+                
+            if quote_data is None:
                 return None
             
             out_amount = int(quote_data.get('outAmount', 0))
-            logger.info(f"Quote erhalten: {out_amount} {symbol} für {self.trade_amount_sol} SOL")
+            decimals = mint_registry.get_decimals(token_address)
+            
+            if decimals is not None:
+                logger.info(
+                    f"Quote erhalten: {out_amount / 10 ** decimals:,.2f} {symbol} "
+                    f"({out_amount} raw) für {self.trade_amount_sol} SOL"
+                )
+            else:
+                logger.info(f"Quote erhalten: {out_amount} {symbol} für {self.trade_amount_sol} SOL")
             
             # Schritt 2: Hole Swap Transaction
+            # Fee-Kurve der Pools, die der Swap write-lockt (Route, sonst das gescoutete Pair)
+            fee_accounts = route_accounts(quote_data) or ([pair.pair_address] if pair and pair.pair_address else [])
+            fee_params = self.fee_estimator.swap_fee_params(fee_accounts, 'buy')
             swap_url = f"{self.jupiter_api}/swap"
             swap_payload = {
                 'quoteResponse': quote_data,
                 'userPublicKey': str(self.wallet.pubkey()),
                 'wrapAndUnwrapSol': True,
                 'dynamicComputeUnitLimit': True,
-                'prioritizationFeeLamports': 'auto',
+                **fee_params,
                 'dynamicSlippage': {
                     'maxBps': 300  # 3% max slippage (300 basis points)
                 }
             }
             
-            swap_response = requests.post(
+            swap_response = http_client.post(
                 swap_url, 
                 json=swap_payload,
                 headers=headers,  # API Key auch für Swap Request
-                timeout=30,
                 verify=False  # SSL Verification deaktiviert (siehe oben)
             )
             swap_response.raise_for_status()
@@ -352,40 +435,69 @@ class Trader:
             # Der VersionedTransaction Constructor signiert automatisch!
             signed_tx = VersionedTransaction(transaction.message, [self.wallet])
             
-            # Sende Transaction mit skipPreflight für schnellere Execution
+            # Sende Transaction (skipPreflight, Rebroadcast bis Confirmation oder Blockhash-Ablauf)
             logger.info(f"Sende Swap Transaction für {symbol}...")
-            from solana.rpc.types import TxOpts
-            tx_opts = TxOpts(
-                skip_preflight=True,  # Überspringt Simulation - schneller aber risikoreicher
-                preflight_commitment="confirmed"
+            confirmation_future = self.broadcaster.send(
+                signed_tx,
+                last_valid_block_height=swap_data.get('lastValidBlockHeight')
             )
-            tx_response = self.rpc_client.send_transaction(signed_tx, opts=tx_opts)
             
-            # tx_response.value ist bereits ein Signature Objekt
-            signature = tx_response.value
-            logger.info(f"Transaction gesendet: {signature}")
+            signature = signed_tx.signatures[0]
+            logger.info(
+                f"Transaction gesendet: {signature} "
+                f"(Decision-to-Send {(time.monotonic() - started_at) * 1000:.0f} ms)"
+            )
             
-            # Warte auf Confirmation
+            # Warte auf Confirmation (gebündeltes Polling, Sells des Watchers laufen parallel weiter)
             logger.info("Warte auf Transaction Confirmation...")
-            confirmation = self.rpc_client.confirm_transaction(signature, commitment="confirmed")
             
-            if confirmation.value:
-                logger.info(f"✅ Transaction bestätigt: {signature}")
+            try:
+                confirmation = confirmation_future.result(timeout=config.CONFIRMATION_TIMEOUT + CONFIRMATION_WAIT_GRACE)
+            except FutureTimeoutError:
+                # Main Loop nicht blockieren - Ergebnis unbekannt, Signatur für manuelle Prüfung loggen
+                logger.error(f"❌ Keine Confirmation für {signature} innerhalb des Timeouts - Trade nicht gebucht")
+                return None
+                
+            self.fee_estimator.record('buy', fee_params, confirmation)
+            
+            if confirmation['confirmed']:
+                logger.info(
+                    f"✅ Transaction bestätigt: {signature} ({confirmation['latency_ms']:.0f} ms, "
+                    f"{confirmation['attempts']} Sends, Slot {confirmation['slot']})"
+                )
                 
+                # Tatsächlich gelandete Menge statt Quote outAmount
+                fill = self.resolve_fill(signature, token_address)
+                
+                if fill and fill['amount'] > 0:
+                    amount_tokens = fill['amount']
+                    decimals = fill['decimals']
+                    
+                    if amount_tokens != out_amount:
+                        logger.info(f"Fill weicht vom Quote ab: {amount_tokens} raw statt {out_amount} raw")
+                else:
+                    logger.warning("Fill nicht aus der Transaction lesbar - verwende Quote outAmount")
+                    amount_tokens = out_amount
+                    decimals = mint_registry.get_decimals(token_address)
+                    
                 # Berechne Entry Price
-                entry_price = self.trade_amount_sol / out_amount if out_amount > 0 else 0
+                entry_price = self.trade_amount_sol / amount_tokens if amount_tokens > 0 else 0
                 
                 return {
                     'signature': str(signature),
                     'token_address': token_address,
                     'symbol': symbol,
                     'amount_sol': self.trade_amount_sol,
-                    'amount_tokens': out_amount,
+                    'amount_tokens': amount_tokens,
+                    'token_decimals': decimals,
                     'entry_price': entry_price,
                     'success': True
                 }
             else:
-                logger.error(f"❌ Transaction nicht bestätigt: {signature}")
+                logger.error(
+                    f"❌ Transaction nicht bestätigt: {signature} "
+                    f"({confirmation['status']}: {confirmation['error']}, {confirmation['attempts']} Sends)"
+                )
                 return None
             
         except requests.exceptions.Timeout:
@@ -398,15 +510,98 @@ class Trader:
             logger.error(f"Fehler beim Swap Execution: {e}", exc_info=True)
             return None
     
-    def get_token_balance(self, token_address: str) -> float:
+    def resolve_fill(self, signature, token_address: str) -> Optional[Dict]:
         """
-        Holt den aktuellen Token Balance
+        Liest die Token-Bewegung des Wallets aus der bestätigten Transaction
+        (pre/postTokenBalances) und aktualisiert den Holdings-Index
         
         Args:
+            signature: Signature (solders) oder Base58 String
             token_address: Token Mint Address
             
         Returns:
-            float: Token Balance
+            Optional[Dict]: amount (raw Delta), decimals, post_amount und
+                            lamports (SOL-Delta des Wallets aus pre/postBalances,
+                            netto nach Fee, None wenn nicht lesbar) oder None
+        """
+        if isinstance(signature, str):
+            signature = Signature.from_string(signature)
+            
+        for attempt in range(FILL_LOOKUP_ATTEMPTS):
+            try:
+                response = self.rpc_client.get_transaction(
+                    signature,
+                    encoding="json",
+                    commitment="confirmed",
+                    max_supported_transaction_version=0
+                )
+                
+                if response.value is not None and response.value.transaction.meta is not None:
+                    meta = response.value.transaction.meta
+                    fill = token_fill_from_meta(meta, str(self.wallet.pubkey()), token_address)
+                    
+                    if fill is None:
+                        return None
+                        
+                    # Wallet signiert als Fee Payer -> Account Index 0
+                    fill['lamports'] = sol_change_from_meta(meta)
+                    
+                    self.holdings.set(token_address, fill['post_amount'], fill['decimals'])
+                    mint_registry.record_decimals(token_address, fill['decimals'])
+                    return fill
+                    
+            except Exception as e:
+                logger.warning(f"getTransaction für {signature} fehlgeschlagen: {e}")
+                
+            time.sleep(FILL_LOOKUP_DELAY)
+            
+        return None
+    
+    def get_holding(self, token_address: str) -> Dict:
+        """
+        Token-Bestand aus dem Holdings-Index, RPC-Read nur wenn unbekannt
+        
+        Args:
+            token_address: Token Mint Address
+            
+        Returns:
+            Dict: amount (int, raw), ui_amount (float), decimals (int oder None)
+        """
+        holding = self.holdings.get(token_address)
+        
+        if holding is not None:
+            return holding
+            
+        return self.get_token_amount(token_address)
+    
+    def get_token_decimals(self, token_address: str) -> Optional[int]:
+        """
+        Holt die Decimals eines Tokens (aus der Mint Registry, sonst via RPC)
+        
+        Args:
+            token_address: Token Mint Address
+            
+        Returns:
+            Optional[int]: Decimals oder None wenn der Mint nicht lesbar ist
+        """
+        decimals = mint_registry.get_decimals(token_address)
+        
+        if decimals is not None:
+            return decimals
+            
+        # check_token() schreibt das Ergebnis in die Registry
+        mint = self.security_checker.check_token(token_address)['mint']
+        return mint['decimals'] if mint else None
+    
+    def get_token_amount(self, token_address: str) -> Dict:
+        """
+        Holt den aktuellen Token Balance in der kleinsten Einheit
+        
+        Args:
+            token_address: Token Mint Address
+            
+        Returns:
+            Dict: amount (int, raw), ui_amount (float), decimals (int oder None)
         """
         try:
             from solana.rpc.types import TokenAccountOpts
@@ -424,12 +619,34 @@ class Trader:
                 # Parse Token Amount aus jsonParsed data
                 token_account = response.value[0]
                 parsed_data = token_account.account.data.parsed
-                amount = parsed_data['info']['tokenAmount']['uiAmount']
-                return float(amount) if amount is not None else 0.0
+                token_amount = parsed_data['info']['tokenAmount']
+                
+                # Decimals sind unveränderlich -> für Sell-Pfad und Logging merken
+                mint_registry.record_decimals(token_address, token_amount['decimals'])
+                self.holdings.set(token_address, int(token_amount['amount']), token_amount['decimals'])
+                
+                return {
+                    'amount': int(token_amount['amount']),
+                    'ui_amount': float(token_amount['uiAmount'] or 0.0),
+                    'decimals': token_amount['decimals']
+                }
             
-            return 0.0
+            self.holdings.set(token_address, 0, 0)
+            return {'amount': 0, 'ui_amount': 0.0, 'decimals': mint_registry.get_decimals(token_address)}
             
         except Exception as e:
             logger.error(f"Fehler beim Abrufen der Token Balance: {e}")
             logger.exception("Token Balance Error Details:")
-            return 0.0
+            return {'amount': 0, 'ui_amount': 0.0, 'decimals': None}
+    
+    def get_token_balance(self, token_address: str) -> float:
+        """
+        Holt den aktuellen Token Balance
+        
+        Args:
+            token_address: Token Mint Address
+            
+        Returns:
+            float: Token Balance
+        """
+        return self.get_token_amount(token_address)['ui_amount']
@@ -3,17 +3,29 @@ Modul D: Der Wächter (Limit Order Manager)
 Überwacht offene Positionen und führt Stop-Loss/Take-Profit aus
 """
 
+import base64
 import logging
+import threading
 import time
-import requests
-from typing import Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
 from datetime import datetime
+from solders.message import MessageV0
+from solders.transaction import VersionedTransaction
 import config
+from modules.http_client import http_client
+from modules.priority_fees import route_accounts
 from modules.trader import Trader
 from modules.trade_manager import trade_manager
 
 logger = logging.getLogger(__name__)
 
+# DexScreener erlaubt max. 30 Token Addresses pro /dex/tokens Request
+DEXSCREENER_BATCH_SIZE = 30
+
+# Slippage der Sell Quote - ein vorbereiteter Exit gilt nur, solange der Preis innerhalb davon liegt
+SELL_SLIPPAGE_BPS = 100
+
 
 class Watcher:
     """
@@ -32,6 +44,22 @@ class Watcher:
         
         self.active_positions = {}  # contract_address -> position_info
         
+        # Portfolio Mode: Watcher läuft als eigener Thread parallel zum Scout
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        
+        # Vorbereitete Exits: Balance, Sell Quote und unsignierte Swap Transaction pro Position
+        # Werden im Hintergrund aufgefrischt, sobald der Preis sich SL/TP nähert
+        self.prepare_zone_percent = config.EXIT_PREPARE_ZONE_PERCENT
+        self.prepare_refresh = config.EXIT_PREPARE_REFRESH
+        self._prepared_exits: Dict[str, Dict] = {}
+        self._preparing = set()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='watcher-bg')
+        # Buchung bestätigter Exits mit eigenem Worker (getTransaction soll den ConfirmationTracker
+        # nicht blockieren und nie hinter spekulativen Prepares warten)
+        self._booking_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='watcher-booking')
+        
     def add_position(self, trade_result: Dict):
         """
         Fügt eine neue Position zum Monitoring hinzu
@@ -41,21 +69,24 @@ class Watcher:
         """
         try:
             token_address = trade_result['token_address']
-            pair = trade_result.get('pair', {})
+            pair = trade_result.get('pair')
+            entry_price = pair.price_usd if pair else 0
             
             position = {
                 'token_address': token_address,
                 'symbol': trade_result['symbol'],
-                'entry_price': pair.get('price_usd', 0),
+                'entry_price': entry_price,
                 'amount_sol': trade_result['amount_sol'],
-                'amount_tokens': trade_result['amount_tokens'],
+                'amount_tokens': trade_result['amount_tokens'],  # raw (kleinste Einheit)
+                'token_decimals': trade_result.get('token_decimals'),
                 'entry_time': datetime.now(),
                 'signature': trade_result['signature'],
-                'highest_price': pair.get('price_usd', 0),  # Für Trailing Stop
+                'highest_price': entry_price,  # Für Trailing Stop
                 'status': 'active'
             }
             
-            self.active_positions[token_address] = position
+            with self._lock:
+                self.active_positions[token_address] = position
             
             logger.info(
                 f"Position hinzugefügt: {position['symbol']} | "
@@ -76,17 +107,62 @@ class Watcher:
         except Exception as e:
             logger.error(f"Fehler beim Hinzufügen der Position: {e}", exc_info=True)
     
-    def monitor_positions(self):
+    def start_background(self):
+        """
+        Startet das Position Monitoring als Hintergrund-Thread (Portfolio Mode)
+        Der Thread läuft weiter, auch wenn zwischenzeitlich keine Positionen offen sind
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self.monitor_positions,
+            kwargs={'run_forever': True},
+            name='Watcher',
+            daemon=True
+        )
+        self._thread.start()
+        logger.info("Wächter läuft im Hintergrund (Portfolio Mode)")
+    
+    def stop(self, timeout: float = 10):
+        """
+        Stoppt den Hintergrund-Thread des Wächters
+        
+        Args:
+            timeout: Max. Wartezeit in Sekunden
+        """
+        self._stop_event.set()
+        
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        
+        self._executor.shutdown(wait=False)
+        self._booking_executor.shutdown(wait=False)
+    
+    def monitor_positions(self, run_forever: bool = False):
         """
         Überwacht alle aktiven Positionen
         Läuft in einer Loop bis alle Positionen geschlossen sind
+        
+        Args:
+            run_forever: True = läuft bis stop() aufgerufen wird (Portfolio Mode)
         """
         logger.info("Wächter startet Position Monitoring...")
         
-        while self.active_positions:
+        while (run_forever or self.active_positions) and not self._stop_event.is_set():
             try:
                 # Prüfe jede Position
-                positions_to_check = list(self.active_positions.keys())
+                with self._lock:
+                    positions_to_check = list(self.active_positions.keys())
+                
+                if not positions_to_check:
+                    self._stop_event.wait(self.check_interval)
+                    continue
+                
+                # Ein gebündelter DexScreener Request für alle Positionen pro Tick
+                current_prices = self._get_current_prices(positions_to_check)
                 
                 for token_address in positions_to_check:
                     position = self.active_positions.get(token_address)
@@ -94,8 +170,8 @@ class Watcher:
                     if not position or position['status'] != 'active':
                         continue
                     
-                    # Hole aktuellen Preis
-                    current_price = self._get_current_price(token_address)
+                    # Aktueller Preis aus dem Batch
+                    current_price = current_prices.get(token_address)
                     
                     if current_price is None:
                         logger.warning(f"Konnte Preis für {position['symbol']} nicht abrufen")
@@ -134,22 +210,28 @@ class Watcher:
                         )
                         self._execute_exit(token_address, current_price, "TAKE_PROFIT")
                         continue
+                    
+                    # Nahe an SL/TP: Exit Transaction im Hintergrund bereithalten
+                    self._maybe_prepare_exit(token_address, position, current_price, price_change_percent)
                 
                 # Warte vor nächster Prüfung
-                time.sleep(self.check_interval)
+                self._stop_event.wait(self.check_interval)
                 
             except KeyboardInterrupt:
                 logger.info("Wächter wurde manuell gestoppt")
                 break
             except Exception as e:
                 logger.error(f"Fehler im Wächter Loop: {e}", exc_info=True)
-                time.sleep(self.check_interval)
+                self._stop_event.wait(self.check_interval)
         
-        logger.info("Wächter beendet - Keine aktiven Positionen mehr")
+        if self._stop_event.is_set():
+            logger.info("Wächter beendet - Stop angefordert")
+        else:
+            logger.info("Wächter beendet - Keine aktiven Positionen mehr")
     
     def _get_current_price(self, token_address: str) -> Optional[float]:
         """
-        Holt den aktuellen Preis des Tokens von DexScreener
+        Holt den aktuellen Preis eines einzelnen Tokens von DexScreener
         
         Args:
             token_address: Token Contract Address
@@ -157,30 +239,94 @@ class Watcher:
         Returns:
             Optional[float]: Aktueller Preis in USD oder None
         """
-        try:
-            url = f"{config.DEXSCREENER_API_URL}/dex/tokens/{token_address}"
-            
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+        return self._get_current_prices([token_address]).get(token_address)
+    
+    def _get_current_prices(self, token_addresses: List[str]) -> Dict[str, float]:
+        """
+        Holt die aktuellen Preise mehrerer Tokens gebündelt von DexScreener
+        
+        DexScreener akzeptiert bis zu 30 komma-separierte Adressen pro Request,
+        daher bleibt die Latenz pro Tick konstant, unabhängig von der Anzahl
+        offener Positionen.
+        
+        Args:
+            token_addresses: Liste von Token Contract Addresses
             
-            if 'pairs' in data and len(data['pairs']) > 0:
-                # Nehme das erste Pair (meist das mit höchster Liquidität)
-                pair = data['pairs'][0]
-                price_usd = float(pair.get('priceUsd', 0))
-                return price_usd
+        Returns:
+            Dict[str, float]: token_address -> Preis in USD (fehlende Tokens nicht enthalten)
+        """
+        prices = {}
+        
+        for i in range(0, len(token_addresses), DEXSCREENER_BATCH_SIZE):
+            batch = token_addresses[i:i + DEXSCREENER_BATCH_SIZE]
             
-            return None
+            try:
+                url = f"{config.DEXSCREENER_API_URL}/dex/tokens/{','.join(batch)}"
+                
+                response = http_client.get(url)
+                response.raise_for_status()
+                
+                data = response.json()
+                
+                prices.update(self._select_prices(data.get('pairs') or [], batch))
+                
+            except Exception as e:
+                logger.error(f"Fehler beim Abrufen der Preise ({len(batch)} Tokens): {e}")
+        
+        return prices
+    
+    @staticmethod
+    def _select_prices(pairs: List[Dict], token_addresses: List[str]) -> Dict[str, float]:
+        """
+        Wählt pro Token deterministisch das Pair mit der höchsten Liquidität
+        
+        Args:
+            pairs: Pairs aus der DexScreener Response
+            token_addresses: Angefragte Token Addresses
             
-        except Exception as e:
-            logger.error(f"Fehler beim Abrufen des Preises: {e}")
-            return None
+        Returns:
+            Dict[str, float]: token_address -> Preis in USD
+        """
+        wanted = {address.lower(): address for address in token_addresses}
+        best = {}  # token_address -> (liquidity_usd, price_usd)
+        
+        for pair in pairs:
+            try:
+                # Nur Pairs in denen der Token Base Token ist (priceUsd bezieht sich auf Base)
+                base_address = (pair.get('baseToken') or {}).get('address', '')
+                token_address = wanted.get(base_address.lower())
+                
+                if not token_address:
+                    continue
+                
+                price_usd = float(pair.get('priceUsd') or 0)
+                
+                if price_usd <= 0:
+                    continue
+                
+                liquidity_usd = float((pair.get('liquidity') or {}).get('usd') or 0)
+                
+                current = best.get(token_address)
+                if current is None or liquidity_usd > current[0]:
+                    best[token_address] = (liquidity_usd, price_usd)
+                    
+            except (KeyError, ValueError, TypeError, AttributeError) as e:
+                logger.debug(f"Fehler beim Parsen eines Preis-Pairs: {e}")
+                continue
+        
+        return {address: price for address, (_, price) in best.items()}
     
     def _execute_exit(self, token_address: str, exit_price: float, reason: str):
         """
         Führt einen Exit (Verkauf) der Position aus
         
+        Liegt eine vorbereitete Exit Transaction bereit, braucht der Trigger nur
+        noch einen frischen Blockhash, die Signatur und den Send.
+        
+        Die Sell Transaction wird nur gesendet - die Buchung erfolgt in
+        _on_exit_confirmed(), sobald der ConfirmationTracker sie bestätigt.
+        Der Wächter prüft währenddessen die übrigen Positionen weiter.
+        
         Args:
             token_address: Token Contract Address
             exit_price: Aktueller Exit Preis
@@ -191,95 +337,369 @@ class Watcher:
         if not position:
             return
         
+        # Trigger-to-Send Latenz: vom Auslösen bis die Sell Transaction raus ist
+        triggered_at = time.monotonic()
+        
         try:
             logger.info(f"=== EXIT EXECUTION START: {position['symbol']} ({reason}) ===")
             
-            # Hole aktuellen Token Balance
-            token_balance = self.trader.get_token_balance(token_address)
-            
-            if token_balance <= 0:
-                logger.warning(f"Keine Tokens zum Verkaufen für {position['symbol']}")
-                position['status'] = 'closed'
-                return
+            urgency = 'stop_loss' if reason == 'STOP_LOSS' else 'sell'
             
-            # Führe Verkauf via Jupiter aus
-            exit_result = self._execute_jupiter_sell(token_address, position['symbol'], token_balance)
+            # Vorbereiteter Exit -> nur noch frischer Blockhash, Signatur und Send
+            sell_tx = self._take_prepared_exit(token_address, exit_price, urgency)
             
-            if exit_result:
-                # Berechne Profit/Loss in SOL
-                entry_sol = position.get('amount_sol', 0)
-                exit_sol = exit_result.get('amount_sol', 0)
-                pnl_sol = exit_sol - entry_sol
-                pnl_percent = ((exit_price - position['entry_price']) / position['entry_price']) * 100
+            if sell_tx is None:
+                # Token-Bestand aus dem Holdings-Index (raw), RPC-Read nur wenn unbekannt
+                balance = self.trader.get_holding(token_address)
                 
-                logger.info(
-                    f"✅ EXIT ERFOLGREICH: {position['symbol']} | "
-                    f"Reason: {reason} | "
-                    f"PnL: {pnl_sol:.6f} SOL ({pnl_percent:+.2f}%) | "
-                    f"Entry: ${position['entry_price']:.8f} | "
-                    f"Exit: ${exit_price:.8f}"
+                if balance['amount'] <= 0:
+                    logger.warning(f"Keine Tokens zum Verkaufen für {position['symbol']}")
+                    position['status'] = 'closed'
+                    return
+                    
+                sell_tx = self._build_sell_transaction(
+                    token_address, position['symbol'], balance['amount'], balance['ui_amount'], urgency=urgency
                 )
                 
-                # Speichere Exit-Trade in trade_manager
-                trade_manager.save_trade({
-                    'type': 'SELL',
-                    'status': 'SUCCESS',
-                    'token_address': token_address,
-                    'symbol': position['symbol'],
-                    'signature': exit_result.get('signature'),
-                    'amount_sol': exit_sol,
-                    'amount_tokens': token_balance,
-                    'exit_price': exit_price,
-                    'profit_sol': pnl_sol,
-                    'profit_percent': pnl_percent,
-                    'exit_reason': reason
-                })
-                
-                # Entferne Position aus trade_manager
-                trade_manager.remove_position(token_address)
+            # Sende Verkauf via Jupiter
+            sell_result = self._send_sell_transaction(position['symbol'], sell_tx) if sell_tx else None
+            
+            if not sell_result:
+                self._record_failed_exit(token_address, position, reason, 'Jupiter Sell Failed')
+                return
                 
-                # Update lokale Position
-                position['exit_price'] = exit_price
-                position['exit_time'] = datetime.now()
-                position['exit_reason'] = reason
-                position['pnl_sol'] = pnl_sol
-                position['pnl_percent'] = pnl_percent
-                position['status'] = 'closed'
-                position['exit_signature'] = exit_result.get('signature')
+            logger.info(
+                f"Trigger-to-Send {position['symbol']}: {(time.monotonic() - triggered_at) * 1000:.0f} ms "
+                f"({'vorbereitet' if sell_tx['prepared'] else 'ohne Vorbereitung'})"
+            )
+            
+            # Bis zur Confirmation keine weiteren Exits für diese Position
+            position['status'] = 'exiting'
+            
+            sell_result['confirmation'].add_done_callback(
+                lambda future: self._dispatch_exit_confirmation(token_address, exit_price, reason, sell_result, future)
+            )
+            
+        except Exception as e:
+            logger.error(f"Fehler beim Exit Execution: {e}", exc_info=True)
+    
+    def _dispatch_exit_confirmation(
+        self,
+        token_address: str,
+        exit_price: float,
+        reason: str,
+        sell_result: Dict,
+        future: Future
+    ):
+        """
+        Done-Callback des Broadcasters: übergibt die Buchung an den Hintergrund-Executor
+        
+        Läuft im Thread des ConfirmationTrackers. Nach stop() ist der Executor
+        heruntergefahren - dann wird direkt in diesem Thread gebucht, damit kein
+        bestätigter Exit verloren geht.
+        """
+        try:
+            confirmation = future.result()
+        except Exception as e:
+            # Ergebnis unbekannt -> wie nicht bestätigt behandeln, Position wird wieder freigegeben
+            logger.error(f"Confirmation für {sell_result['signature']} fehlgeschlagen: {e}")
+            confirmation = {
+                'signature': sell_result['signature'],
+                'status': 'error',
+                'confirmed': False,
+                'error': str(e),
+                'slot': None,
+                'latency_ms': 0.0,
+                'attempts': None
+            }
+            
+        args = (token_address, exit_price, reason, sell_result, confirmation)
+        
+        try:
+            self._booking_executor.submit(self._on_exit_confirmed, *args)
+        except RuntimeError:
+            # Executor nach stop() heruntergefahren
+            self._on_exit_confirmed(*args)
+    
+    def _on_exit_confirmed(
+        self,
+        token_address: str,
+        exit_price: float,
+        reason: str,
+        sell_result: Dict,
+        confirmation: Dict
+    ):
+        """
+        Bucht einen Exit nach der Confirmation (läuft im Hintergrund-Executor des Wächters)
+        
+        Args:
+            token_address: Token Contract Address
+            exit_price: Exit Preis beim Auslösen
+            reason: Grund für Exit (STOP_LOSS oder TAKE_PROFIT)
+            sell_result: Ergebnis von _send_sell_transaction()
+            confirmation: Ergebnis des Broadcasters (inkl. attempts)
+        """
+        self.trader.fee_estimator.record(sell_result['urgency'], sell_result['fee_params'], confirmation)
+        
+        position = self.active_positions.get(token_address)
+        
+        if not position:
+            return
+            
+        if not confirmation['confirmed']:
+            logger.error(
+                f"❌ Sell Transaction nicht bestätigt: {confirmation['signature']} "
+                f"({confirmation['status']}: {confirmation['error']})"
+            )
+            
+            # Position wieder freigeben -> nächster Tick versucht den Exit erneut
+            position['status'] = 'active'
+            self._record_failed_exit(
+                token_address, position, reason, f"Sell {confirmation['status']}: {confirmation['error']}"
+            )
+            return
+            
+        logger.info(
+            f"✅ Sell Transaction bestätigt: {confirmation['signature']} "
+            f"({confirmation['latency_ms']:.0f} ms, {confirmation['attempts']} Sends, Slot {confirmation['slot']})"
+        )
+        
+        # Verkaufte Menge aus der Transaction (aktualisiert auch den Holdings-Index)
+        fill = self.trader.resolve_fill(confirmation['signature'], token_address)
+        amount_sold = -fill['amount'] if fill else sell_result.get('amount_sold')
+        
+        if fill is None:
+            # Bestand unbekannt -> nächster Zugriff liest wieder per RPC
+            self.trader.holdings.set(token_address, 0, 0)
+        
+        # Berechne Profit/Loss in SOL: tatsächlicher Erlös aus der Transaction, Quote nur als Fallback
+        entry_sol = position.get('amount_sol', 0)
+        
+        if fill and fill.get('lamports') is not None:
+            exit_sol = fill['lamports'] / 1_000_000_000
+        else:
+            exit_sol = sell_result.get('amount_sol_received', 0)
+            logger.warning(f"SOL-Erlös nicht aus der Transaction lesbar - verwende Quote ({exit_sol} SOL)")
+            
+        pnl_sol = exit_sol - entry_sol
+        
+        if entry_sol:
+            pnl_percent = pnl_sol / entry_sol * 100
+        else:
+            pnl_percent = ((exit_price - position['entry_price']) / position['entry_price']) * 100
+        
+        logger.info(
+            f"✅ EXIT ERFOLGREICH: {position['symbol']} | "
+            f"Reason: {reason} | "
+            f"PnL: {pnl_sol:.6f} SOL ({pnl_percent:+.2f}%) | "
+            f"Entry: ${position['entry_price']:.8f} | "
+            f"Exit: ${exit_price:.8f}"
+        )
+        
+        # Speichere Exit-Trade in trade_manager
+        trade_manager.save_trade({
+            'type': 'SELL',
+            'status': 'SUCCESS',
+            'token_address': token_address,
+            'symbol': position['symbol'],
+            'signature': sell_result.get('signature'),
+            'amount_sol': exit_sol,
+            'amount_tokens': amount_sold,
+            'token_decimals': fill['decimals'] if fill else position.get('token_decimals'),
+            'exit_price': exit_price,
+            'profit_sol': pnl_sol,
+            'profit_percent': pnl_percent,
+            'exit_reason': reason
+        })
+        
+        # Entferne Position aus trade_manager
+        trade_manager.remove_position(token_address)
+        
+        # Update lokale Position
+        position['exit_price'] = exit_price
+        position['exit_time'] = datetime.now()
+        position['exit_reason'] = reason
+        position['pnl_sol'] = pnl_sol
+        position['pnl_percent'] = pnl_percent
+        position['status'] = 'closed'
+        position['exit_signature'] = sell_result.get('signature')
+        
+        # Entferne aus aktiven Positionen
+        with self._lock:
+            self.active_positions.pop(token_address, None)
+            self._prepared_exits.pop(token_address, None)
+    
+    def _record_failed_exit(self, token_address: str, position: Dict, reason: str, error_message: str):
+        logger.error(f"❌ EXIT FEHLGESCHLAGEN für {position['symbol']}")
+        
+        # Speichere fehlgeschlagenen Exit
+        trade_manager.save_trade({
+            'type': 'SELL',
+            'status': 'FAILED',
+            'token_address': token_address,
+            'symbol': position['symbol'],
+            'error_message': error_message,
+            'exit_reason': reason
+        })
+    
+    # ========================================================================
+    # EXIT VORBEREITUNG
+    # ========================================================================
+    
+    def _maybe_prepare_exit(
+        self,
+        token_address: str,
+        position: Dict,
+        current_price: float,
+        price_change_percent: float
+    ):
+        """
+        Baut die Exit Transaction im Hintergrund (neu), wenn der Preis innerhalb
+        von EXIT_PREPARE_ZONE_PERCENT vor Stop-Loss oder Take-Profit liegt
+        
+        Args:
+            token_address: Token Contract Address
+            position: Position Info
+            current_price: Aktueller Preis (USD), zu dem die Sell Quote geholt wird
+            price_change_percent: Aktuelle Performance der Position
+        """
+        if self.prepare_refresh <= 0:
+            return
+            
+        near_stop_loss = price_change_percent <= -self.stop_loss_percent + self.prepare_zone_percent
+        near_take_profit = price_change_percent >= self.take_profit_percent - self.prepare_zone_percent
+        
+        if not (near_stop_loss or near_take_profit):
+            return
+            
+        urgency = 'stop_loss' if near_stop_loss else 'sell'
+        
+        with self._lock:
+            prepared = self._prepared_exits.get(token_address)
+            
+            if token_address in self._preparing:
+                return
                 
-                # Entferne aus aktiven Positionen
-                del self.active_positions[token_address]
+            # Frisch und für dieselbe Seite (SL/TP) vorbereitet -> nichts zu tun
+            if (
+                prepared
+                and prepared['urgency'] == urgency
+                and time.monotonic() - prepared['built_at'] < self.prepare_refresh
+            ):
+                return
                 
-            else:
-                logger.error(f"❌ EXIT FEHLGESCHLAGEN für {position['symbol']}")
+            self._preparing.add(token_address)
+            
+        self._executor.submit(self._prepare_exit, token_address, position['symbol'], urgency, current_price)
+    
+    def _prepare_exit(self, token_address: str, symbol: str, urgency: str, quote_price: float):
+        try:
+            balance = self.trader.get_holding(token_address)
+            
+            if balance['amount'] <= 0:
+                return
                 
-                # Speichere fehlgeschlagenen Exit
-                trade_manager.save_trade({
-                    'type': 'SELL',
-                    'status': 'FAILED',
-                    'token_address': token_address,
-                    'symbol': position['symbol'],
-                    'error_message': 'Jupiter Sell Failed',
-                    'exit_reason': reason
-                })
+            sell_tx = self._build_sell_transaction(
+                token_address, symbol, balance['amount'], balance['ui_amount'], urgency=urgency
+            )
+            
+            if sell_tx is None:
+                return
                 
+            sell_tx['prepared'] = True
+            # Marktpreis zum Zeitpunkt der Quote (Referenz für _take_prepared_exit)
+            sell_tx['quote_price'] = quote_price
+            
+            with self._lock:
+                # Position inzwischen geschlossen -> nicht mehr vorhalten
+                if token_address in self.active_positions:
+                    self._prepared_exits[token_address] = sell_tx
+                    
+            logger.debug(f"Exit Transaction für {symbol} vorbereitet ({sell_tx['out_sol']} SOL)")
+            
         except Exception as e:
-            logger.error(f"Fehler beim Exit Execution: {e}", exc_info=True)
+            logger.warning(f"Exit Vorbereitung für {symbol} fehlgeschlagen: {e}")
+            
+        finally:
+            with self._lock:
+                self._preparing.discard(token_address)
+    
+    def _take_prepared_exit(self, token_address: str, trigger_price: float, urgency: str) -> Optional[Dict]:
+        """
+        Liefert die vorbereitete Sell Transaction (einmalig), wenn sie
+        - höchstens EXIT_PREPARE_REFRESH alt ist,
+        - für dieselbe Dringlichkeit gebaut wurde (Stop-Loss vs. Take-Profit Fee) und
+        - der Trigger-Preis um nicht mehr als die Slippage vom Preis der Quote abweicht
+          (sonst wäre die minimale Ausgabe der Quote veraltet)
+        
+        Args:
+            token_address: Token Contract Address
+            trigger_price: Preis beim Auslösen des Exits (USD)
+            urgency: Dringlichkeit des Exits ('sell' oder 'stop_loss')
+            
+        Returns:
+            Optional[Dict]: Vorbereitete Sell Transaction oder None (-> neu bauen)
+        """
+        with self._lock:
+            sell_tx = self._prepared_exits.pop(token_address, None)
+            
+        if sell_tx is None:
+            return None
+            
+        age = time.monotonic() - sell_tx['built_at']
+        
+        if age > self.prepare_refresh:
+            logger.info(f"Vorbereiteter Exit zu alt ({age:.0f}s) - baue neu")
+            return None
+            
+        if sell_tx['urgency'] != urgency:
+            logger.info(f"Vorbereiteter Exit für '{sell_tx['urgency']}' statt '{urgency}' - baue neu")
+            return None
+            
+        quote_price = sell_tx.get('quote_price')
+        
+        if not quote_price:
+            return None
+            
+        deviation_bps = abs(trigger_price - quote_price) / quote_price * 10_000
+        
+        if deviation_bps > SELL_SLIPPAGE_BPS:
+            logger.info(
+                f"Preis seit vorbereiteter Quote um {deviation_bps / 100:.2f}% bewegt "
+                f"(Slippage {SELL_SLIPPAGE_BPS / 100:.2f}%) - baue neu"
+            )
+            return None
+            
+        return sell_tx
+    
+    # ========================================================================
+    # JUPITER SELL
+    # ========================================================================
     
-    def _execute_jupiter_sell(self, token_address: str, symbol: str, amount: float) -> Optional[Dict]:
+    def _build_sell_transaction(
+        self,
+        token_address: str,
+        symbol: str,
+        amount: int,
+        ui_amount: float,
+        urgency: str = 'sell'
+    ) -> Optional[Dict]:
         """
-        Verkauft Token via Jupiter (vereinfachte Version)
+        Holt Sell Quote und unsignierte Swap Transaction von Jupiter
         
         Args:
             token_address: Token zu verkaufen
             symbol: Token Symbol
-            amount: Anzahl Token
+            amount: Anzahl Token in der kleinsten Einheit (raw)
+            ui_amount: Anzahl Token (nur für Logging)
+            urgency: Dringlichkeit für die Priority Fee ('sell' oder 'stop_loss')
             
         Returns:
-            Optional[Dict]: Sell Result oder None
+            Optional[Dict]: message (unsigniert), amount, ui_amount, out_sol, urgency, fee_params,
+                            last_valid_block_height, built_at, prepared oder None
         """
         try:
-            logger.info(f"Verkaufe {amount} {symbol} via Jupiter...")
+            logger.info(f"Verkaufe {ui_amount} {symbol} ({amount} raw) via Jupiter...")
             
             # SOL Mint Address
             sol_mint = "So11111111111111111111111111111111111111112"
@@ -289,14 +709,13 @@ class Watcher:
             quote_params = {
                 'inputMint': token_address,
                 'outputMint': sol_mint,
-                'amount': int(amount),  # Ganzzahl der kleinsten Einheit
-                'slippageBps': 100  # 1% Slippage bei Verkauf
+                'amount': amount,  # Ganzzahl der kleinsten Einheit
+                'slippageBps': SELL_SLIPPAGE_BPS  # 1% Slippage bei Verkauf
             }
             
-            quote_response = requests.get(
+            quote_response = http_client.get(
                 quote_url, 
                 params=quote_params, 
-                timeout=30,
                 verify=False  # SSL Verification deaktiviert für Jupiter (siehe trader.py)
             )
             quote_response.raise_for_status()
@@ -308,22 +727,22 @@ class Watcher:
             
             out_amount = int(quote_data.get('outAmount', 0))
             out_sol = out_amount / 1_000_000_000
-            logger.info(f"Quote erhalten: {out_sol} SOL für {amount} {symbol}")
+            logger.info(f"Quote erhalten: {out_sol} SOL für {ui_amount} {symbol}")
             
             # Hole Swap Transaction
+            fee_params = self.trader.fee_estimator.swap_fee_params(route_accounts(quote_data), urgency)
             swap_url = f"{config.JUPITER_API_URL}/swap"
             swap_payload = {
                 'quoteResponse': quote_data,
                 'userPublicKey': str(self.trader.wallet.pubkey()),
                 'wrapAndUnwrapSol': True,
                 'dynamicComputeUnitLimit': True,
-                'prioritizationFeeLamports': 'auto'
+                **fee_params
             }
             
-            swap_response = requests.post(
+            swap_response = http_client.post(
                 swap_url, 
                 json=swap_payload, 
-                timeout=30,
                 verify=False  # SSL Verification deaktiviert für Jupiter (siehe trader.py)
             )
             swap_response.raise_for_status()
@@ -333,36 +752,76 @@ class Watcher:
                 logger.error("Keine Swap Transaction in Jupiter Response")
                 return None
             
-            # Decode, Sign und Send Transaction
-            import base64
-            from solders.transaction import VersionedTransaction
-            
-            swap_transaction_b64 = swap_data['swapTransaction']
-            transaction_bytes = base64.b64decode(swap_transaction_b64)
+            transaction_bytes = base64.b64decode(swap_data['swapTransaction'])
             transaction = VersionedTransaction.from_bytes(transaction_bytes)
             
-            transaction.sign([self.trader.wallet])
+            return {
+                'message': transaction.message,
+                'amount': amount,
+                'ui_amount': ui_amount,
+                'out_sol': out_sol,
+                'urgency': urgency,
+                'fee_params': fee_params,
+                'last_valid_block_height': swap_data.get('lastValidBlockHeight'),
+                'built_at': time.monotonic(),
+                'prepared': False
+            }
+            
+        except Exception as e:
+            logger.error(f"Fehler beim Sell Execution: {e}", exc_info=True)
+            return None
+    
+    def _send_sell_transaction(self, symbol: str, sell_tx: Dict) -> Optional[Dict]:
+        """
+        Signiert und sendet eine Sell Transaction von _build_sell_transaction()
+        
+        Vorbereitete Transactions bekommen vorher einen frischen Blockhash.
+        Rebroadcast und Confirmation laufen im Hintergrund.
+        
+        Args:
+            symbol: Token Symbol
+            sell_tx: Ergebnis von _build_sell_transaction()
+            
+        Returns:
+            Optional[Dict]: signature, amount_sold, amount_sol_received und
+                            confirmation (Future des Broadcasters) oder None
+        """
+        try:
+            message = sell_tx['message']
+            last_valid_block_height = sell_tx['last_valid_block_height']
+            
+            if sell_tx['prepared']:
+                latest = self.trader.rpc_client.get_latest_blockhash().value
+                message = MessageV0(
+                    message.header,
+                    message.account_keys,
+                    latest.blockhash,
+                    message.instructions,
+                    message.address_table_lookups
+                )
+                last_valid_block_height = latest.last_valid_block_height
+                
+            # VersionedTransaction hat kein sign() - neu erstellen signiert (wie im Trader)
+            signed_tx = VersionedTransaction(message, [self.trader.wallet])
             
             logger.info(f"Sende Sell Transaction für {symbol}...")
-            tx_response = self.trader.rpc_client.send_transaction(transaction)
+            confirmation_future = self.trader.broadcaster.send(
+                signed_tx,
+                last_valid_block_height=last_valid_block_height
+            )
             
-            signature = str(tx_response.value)
+            signature = str(signed_tx.signatures[0])
             logger.info(f"Transaction gesendet: {signature}")
             
-            # Warte auf Confirmation
-            confirmation = self.trader.rpc_client.confirm_transaction(signature, commitment="confirmed")
-            
-            if confirmation.value:
-                logger.info(f"✅ Sell Transaction bestätigt: {signature}")
-                return {
-                    'signature': signature,
-                    'amount_sold': amount,
-                    'amount_sol_received': out_sol,
-                    'success': True
-                }
-            else:
-                logger.error(f"❌ Sell Transaction nicht bestätigt: {signature}")
-                return None
+            return {
+                'signature': signature,
+                'amount_sold': sell_tx['amount'],
+                'amount_sol_received': sell_tx['out_sol'],
+                'urgency': sell_tx['urgency'],
+                'fee_params': sell_tx['fee_params'],
+                'confirmation': confirmation_future,
+                'success': True
+            }
             
         except Exception as e:
             logger.error(f"Fehler beim Sell Execution: {e}", exc_info=True)
@@ -373,4 +832,16 @@ class Watcher:
         Returns:
             int: Anzahl aktiver Positionen
         """
-        return len(self.active_positions)
+        with self._lock:
+            return len(self.active_positions)
+    
+    def has_position(self, token_address: str) -> bool:
+        """
+        Args:
+            token_address: Token Contract Address
+            
+        Returns:
+            bool: True wenn für den Token bereits eine Position offen ist
+        """
+        with self._lock:
+            return token_address in self.active_positions
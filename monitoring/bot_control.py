@@ -9,12 +9,12 @@ import subprocess
 import psutil
 import signal
 import os
-import re
 from typing import Dict, Optional
 from pathlib import Path
 import time
 
 from monitoring.config import BOT_START_SCRIPT, BOT_MAIN_FILE, BASE_DIR
+from monitoring.log_tail import bot_log_tailer, TIMESTAMP_PATTERN
 
 
 class BotController:
@@ -297,21 +297,17 @@ class BotController:
             ISO-Timestamp oder None
         """
         try:
-            log_file = BASE_DIR / 'bot.log'
-            if not log_file.exists():
+            if not bot_log_tailer.exists():
                 return None
             
-            # Lese letzte 100 Zeilen rückwärts
-            with open(log_file, 'r') as f:
-                lines = f.readlines()[-100:]
+            # Suche nach "LOOP #" Pattern von hinten in den letzten 100 Zeilen
+            line = bot_log_tailer.find_last(('LOOP #', 'Trade-Scan'), max_lines=100)
             
-            # Suche nach "LOOP #" Pattern von hinten
-            for line in reversed(lines):
-                if 'LOOP #' in line or 'Trade-Scan' in line:
-                    # Extrahiere Timestamp (Format: 2024-01-15 14:30:45)
-                    match = re.search(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                    if match:
-                        return match.group(1)
+            if line:
+                # Extrahiere Timestamp (Format: 2024-01-15 14:30:45)
+                match = TIMESTAMP_PATTERN.search(line)
+                if match:
+                    return match.group(1)
             
             return None
             
@@ -44,6 +44,9 @@ BOT_LOG_FILE = BASE_DIR / 'bot.log'
 # Solana RPC Endpoint (nur für Balance-Abfragen, kein Wallet-Zugriff)
 SOLANA_RPC_URL = os.getenv('SOLANA_RPC_URL', 'https://api.mainnet-beta.solana.com')
 
+# Optional mehrere Endpoints (kommagetrennt) - Balance-Abfrage mit Failover
+SOLANA_RPC_URLS = [url.strip() for url in os.getenv('SOLANA_RPC_URLS', SOLANA_RPC_URL).split(',') if url.strip()]
+
 # Wallet Public Key (NUR für Balance-Abfrage, KEIN Private Key!)
 # Wird aus .env geladen - WICHTIG: Nicht SOLANA_PRIVATE_KEY!
 WALLET_PUBLIC_KEY = os.getenv('WALLET_PUBLIC_KEY', None)
@@ -55,7 +58,7 @@ else:
     print("⚠️  WALLET_PUBLIC_KEY nicht in .env gefunden!")
 
 # Optional: Trades-Datenbank (falls Bot später Trades persistiert)
-TRADES_DB_FILE = BASE_DIR / 'trades.json'
+TRADES_DB_FILE = BASE_DIR / 'trades.jsonl'
 
 # ============================================================================
 # BOT-STEUERUNG (Prozess-Kontrolle)
@@ -77,6 +80,23 @@ MAX_LOG_LINES = 500
 # Update-Intervall für Auto-Refresh (Sekunden)
 AUTO_REFRESH_INTERVAL = 10
 
+# Push-Kanal (/api/stream): Wie oft der Publisher die Datenquellen prüft (Sekunden)
+STREAM_PUBLISH_INTERVAL = 2
+
+# Wallet-Balance kostet einen RPC-Call -> seltener abfragen
+STREAM_WALLET_INTERVAL = 30
+
+# Kommentar-Zeile an alle Clients, damit Proxies die Verbindung offen halten
+STREAM_HEARTBEAT_INTERVAL = 15
+
+# Health Sampler: Mess-Intervall (Sekunden) und Länge der Historie
+# 360 x 5s = letzte 30 Minuten für Sparklines (/api/health/history)
+HEALTH_SAMPLE_INTERVAL = 5
+HEALTH_HISTORY_SIZE = 360
+
+# Bot-PID Suche scannt alle Prozesse -> nur alle X Sekunden neu suchen
+BOT_PID_REFRESH_INTERVAL = 30
+
 # Zeitzone für Anzeige
 TIMEZONE = 'Europe/Berlin'
 
@@ -93,7 +113,7 @@ print(f"""
 
 🌐 Host: {MONITOR_HOST}:{MONITOR_PORT}
 📂 Log-Datei: {BOT_LOG_FILE}
-🔗 Solana RPC: {SOLANA_RPC_URL}
+🔗 Solana RPC: {', '.join(SOLANA_RPC_URLS)}
 👤 Admin User: {ADMIN_USERNAME}
 🔐 Secret Key: {'***' + SECRET_KEY[-8:]}
 
@@ -10,27 +10,28 @@ WICHTIG: Dieser Code hat NUR LESE-ZUGRIFF!
 """
 
 import json
-import re
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-import requests
-import psutil
 import pytz
 import sys
 
 # Füge Parent-Directory zum Path hinzu für trade_manager Import
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from modules.trade_manager import trade_manager
+from modules.rpc_pool import RpcPool
+from modules.trade_manager import TradeManager
+from solders.pubkey import Pubkey
 
 from monitoring.config import (
     BOT_LOG_FILE,
-    SOLANA_RPC_URL,
+    SOLANA_RPC_URLS,
     WALLET_PUBLIC_KEY,
     TRADES_DB_FILE,
     MAX_LOG_LINES,
     TIMEZONE
 )
+from monitoring.log_tail import bot_log_tailer
+from monitoring.health_sampler import health_sampler
 
 
 class DataReader:
@@ -40,6 +41,12 @@ class DataReader:
     
     def __init__(self):
         self.timezone = pytz.timezone(TIMEZONE)
+        
+        # Gleicher Endpoint Pool wie im Bot (schnellster gesunder Endpoint, Failover)
+        self.rpc_client = RpcPool(SOLANA_RPC_URLS)
+        
+        # Trade-Speicher nur lesend öffnen (keine Migration, kein Schreiben)
+        self.trade_manager = TradeManager(read_only=True)
     
     # ========================================================================
     # SERVER HEALTH
@@ -47,26 +54,21 @@ class DataReader:
     
     def get_server_health(self) -> Dict:
         """
-        Liest Server-Ressourcen (CPU, RAM, Disk)
+        Liefert den letzten Messwert der Server-Ressourcen (CPU, RAM, Disk)
         
         Returns:
-            Dict mit cpu_percent, ram_percent, disk_percent, etc.
+            Dict mit cpu_percent, ram_percent, disk_percent, bot_rss_mb, bot_cpu_percent, etc.
         """
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            ram = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            # Messwerte kommen vom Hintergrund-Sampler (blockiert nicht)
+            health_sampler.ensure_running()
+            sample = health_sampler.latest(timeout=1)
+            
+            if sample is None:
+                return {'error': 'Noch keine Messung vorhanden', 'status': 'warning'}
+                
+            return sample
             
-            return {
-                'cpu_percent': round(cpu_percent, 1),
-                'ram_percent': round(ram.percent, 1),
-                'ram_used_gb': round(ram.used / (1024**3), 2),
-                'ram_total_gb': round(ram.total / (1024**3), 2),
-                'disk_percent': round(disk.percent, 1),
-                'disk_used_gb': round(disk.used / (1024**3), 2),
-                'disk_total_gb': round(disk.total / (1024**3), 2),
-                'status': 'healthy' if cpu_percent < 80 and ram.percent < 90 else 'warning'
-            }
         except Exception as e:
             return {'error': str(e), 'status': 'error'}
     
@@ -90,35 +92,33 @@ class DataReader:
             
             lines = min(lines, MAX_LOG_LINES)
             
-            with open(BOT_LOG_FILE, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                last_lines = all_lines[-lines:]
-            
-            # Parse Log-Zeilen (Format: "2026-01-07 18:28:05 | INFO | ...")
-            parsed_logs = []
-            log_pattern = r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\s*\|\s*(\w+)\s*\|\s*(.+)$'
+            # Liest nur die letzten Blöcke vom Dateiende (gecacht bis bot.log sich ändert)
+            return bot_log_tailer.tail(lines)
             
-            for line in last_lines:
-                match = re.match(log_pattern, line.strip())
-                if match:
-                    timestamp, level, message = match.groups()
-                    parsed_logs.append({
-                        'timestamp': timestamp,
-                        'level': level,
-                        'message': message
-                    })
-                else:
-                    # Zeile ohne Standard-Format (z.B. Multiline)
-                    parsed_logs.append({
-                        'timestamp': '',
-                        'level': 'DEBUG',
-                        'message': line.strip()
-                    })
+        except Exception as e:
+            return [{'timestamp': 'ERROR', 'level': 'ERROR', 'message': f'Fehler beim Log-Lesen: {e}'}]
+    
+    def get_logs_since(self, cursor: int, inode: Optional[int] = None) -> Dict:
+        """
+        Liest nur die seit dem Cursor neu geschriebenen Log-Zeilen
+        
+        Args:
+            cursor: Byte-Offset aus der letzten Antwort (0 beim ersten Aufruf)
+            inode: Inode aus der letzten Antwort (erkennt Log-Rotation)
             
-            return parsed_logs
+        Returns:
+            Dict mit logs, cursor, inode, reset
+        """
+        try:
+            return bot_log_tailer.read_since(cursor, inode, MAX_LOG_LINES)
             
         except Exception as e:
-            return [{'timestamp': 'ERROR', 'level': 'ERROR', 'message': f'Fehler beim Log-Lesen: {e}'}]
+            return {
+                'logs': [{'timestamp': 'ERROR', 'level': 'ERROR', 'message': f'Fehler beim Log-Lesen: {e}'}],
+                'cursor': cursor,
+                'inode': inode,
+                'reset': False
+            }
     
     # ========================================================================
     # WALLET BALANCE
@@ -140,19 +140,10 @@ class DataReader:
                 }
             
             # Solana RPC Call: getBalance
-            payload = {
-                'jsonrpc': '2.0',
-                'id': 1,
-                'method': 'getBalance',
-                'params': [WALLET_PUBLIC_KEY]
-            }
-            
-            response = requests.post(SOLANA_RPC_URL, json=payload, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            response = self.rpc_client.get_balance(Pubkey.from_string(WALLET_PUBLIC_KEY))
             
-            if 'result' in data and 'value' in data['result']:
-                lamports = data['result']['value']
+            if response.value is not None:
+                lamports = response.value
                 balance_sol = lamports / 1_000_000_000
                 
                 # Geschätzter USD-Wert (würde in Produktion SOL/USD-Preis abfragen)
@@ -176,7 +167,7 @@ class DataReader:
     
     def get_trades(self, limit: int = 50) -> List[Dict]:
         """
-        Liest Trade-Historie aus trades.json via trade_manager
+        Liest Trade-Historie via trade_manager (JSON Journal oder SQLite)
         
         Args:
             limit: Max Anzahl Trades
@@ -185,50 +176,48 @@ class DataReader:
             List von Trade-Objekten
         """
         try:
-            # Lade Trades aus trade_manager (nutzt trades.json)
-            all_trades = trade_manager.load_trades()
-            return all_trades[-limit:] if all_trades else []
+            # Backend liefert nur die letzten N Trades (SQLite: Index-Scan, JSON: Stream)
+            return self.trade_manager.get_recent_trades(limit)
             
         except Exception as e:
             return [{'error': f'Fehler beim Trade-Lesen: {e}'}]
     
+    def get_positions(self) -> List[Dict]:
+        """
+        Liest offene Positionen aus dem Trade-Speicher des Bots
+        
+        Returns:
+            List von Positionen (Dashboard erwartet eine Liste)
+        """
+        return list(self.trade_manager.load_positions().values())
+    
     # ========================================================================
     # STATISTICS & PERFORMANCE
     # ========================================================================
     
     def get_statistics(self) -> Dict:
         """
-        Berechnet Performance-Statistiken aus echten Trade-Daten via trade_manager
+        Liefert Performance-Statistiken aus den laufenden Aggregaten von trade_manager
         
         Returns:
             Dict mit total_trades, win_rate, total_pnl, avg_profit, etc.
         """
         try:
-            # Nutze trade_manager für echte Performance-Daten
-            stats = trade_manager.get_trade_stats()
-            all_trades = trade_manager.load_trades()
-            
-            # Berechne zusätzliche Metriken
-            completed_trades = [
-                t for t in all_trades 
-                if t.get('type') == 'SELL' and t.get('status') == 'SUCCESS'
-            ]
+            # Laufende Aggregate aus trade_manager (O(1), kein Scan der Historie)
+            aggregates = self.trade_manager.get_stats()
+            stats = aggregates.summary()
             
-            # Best/Worst Trade aus profit_percent
-            profits = [t.get('profit_percent', 0) for t in completed_trades]
-            best_trade = max(profits) if profits else 0
-            worst_trade = min(profits) if profits else 0
+            # Best/Worst Trade aus profit_percent der erfolgreichen SELL-Trades
+            best_trade = aggregates.best_trade or 0
+            worst_trade = aggregates.worst_trade or 0
             
             # Durchschnitt nur von completed trades
-            avg_profit = (stats['total_profit_sol'] / len(completed_trades)) if completed_trades else 0
+            sell_trades = aggregates.sell_trades
+            avg_profit = (stats['total_profit_sol'] / sell_trades) if sell_trades else 0
             
-            # Heute's PnL (Filter nach Datum)
+            # Heute's PnL aus dem Tages-Bucket
             today = datetime.now(self.timezone).date()
-            today_trades = [
-                t for t in completed_trades
-                if t.get('timestamp', '').startswith(str(today))
-            ]
-            today_pnl = sum(t.get('profit_sol', 0) for t in today_trades)
+            today_pnl = aggregates.get_daily_pnl(str(today))
             
             return {
                 'total_trades': stats['total_trades'],
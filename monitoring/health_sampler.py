@@ -0,0 +1,221 @@
+"""
+MEMERO Monitoring - Health Sampler
+Sammelt System- und Bot-Prozess-Metriken im Hintergrund
+
+Statt bei jedem /api/status Call psutil.cpu_percent(interval=1) eine Sekunde
+zu blockieren, misst ein Thread in festem Intervall CPU, RAM, Disk sowie
+RSS und CPU des Bot-Prozesses und legt die Werte in einem Ringpuffer ab.
+API-Calls lesen nur den letzten Messwert bzw. die kurze Historie.
+
+WICHTIG: NUR LESE-ZUGRIFF!
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+import psutil
+
+from monitoring.bot_control import bot_controller
+from monitoring.config import (
+    HEALTH_SAMPLE_INTERVAL,
+    HEALTH_HISTORY_SIZE,
+    BOT_PID_REFRESH_INTERVAL
+)
+
+logger = logging.getLogger(__name__)
+
+
+class HealthSampler:
+    """
+    Hintergrund-Thread mit Ringpuffer der letzten Messwerte
+    """
+    
+    def __init__(
+        self,
+        interval: float,
+        history_size: int,
+        pid_provider: Callable[[], Optional[int]],
+        pid_refresh_interval: float
+    ):
+        """
+        Args:
+            interval: Mess-Intervall in Sekunden
+            history_size: Anzahl Messwerte im Ringpuffer
+            pid_provider: Liefert die PID des Bot-Prozesses (teuer: Prozess-Scan)
+            pid_refresh_interval: Wie oft die Bot-PID neu gesucht wird (Sekunden)
+        """
+        self.interval = interval
+        self.pid_provider = pid_provider
+        self.pid_refresh_interval = pid_refresh_interval
+        
+        self._samples = deque(maxlen=history_size)
+        self._has_sample = threading.Event()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        
+        # Gecachter Bot-Prozess (cpu_percent() misst seit dem letzten Aufruf)
+        self._bot_process: Optional[psutil.Process] = None
+        self._last_pid_lookup = float('-inf')
+        
+    # ========================================================================
+    # LIFECYCLE
+    # ========================================================================
+    
+    def ensure_running(self):
+        """Startet den Sampler beim ersten Zugriff"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+                
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='health-sampler', daemon=True)
+            self._thread.start()
+    
+    def stop(self, timeout: float = 5):
+        self._stop_event.set()
+        
+        if self._thread is not None:
+            self._thread.join(timeout)
+    
+    def _run(self):
+        # Erste Messung mit kurzem Fenster, damit /api/status sofort Werte hat
+        cpu_percent = psutil.cpu_percent(interval=0.2)
+        
+        while not self._stop_event.is_set():
+            try:
+                sample = self._sample(cpu_percent)
+                cpu_percent = None
+                
+                with self._lock:
+                    self._samples.append(sample)
+                    
+                self._has_sample.set()
+                
+            except Exception as e:
+                logger.error(f"Health Sampler Fehler: {e}")
+                
+            self._stop_event.wait(self.interval)
+            
+    # ========================================================================
+    # LESEN
+    # ========================================================================
+    
+    def latest(self, timeout: float = 0) -> Optional[Dict]:
+        """
+        Args:
+            timeout: Maximale Wartezeit auf die allererste Messung (Sekunden)
+            
+        Returns:
+            Optional[Dict]: Letzter Messwert oder None (noch keine Messung)
+        """
+        if timeout > 0:
+            self._has_sample.wait(timeout)
+            
+        with self._lock:
+            return self._samples[-1] if self._samples else None
+    
+    def history(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Args:
+            limit: Nur die letzten N Messwerte
+            
+        Returns:
+            List[Dict]: Messwerte, älteste zuerst
+        """
+        with self._lock:
+            samples = list(self._samples)
+            
+        if limit is not None and limit > 0:
+            samples = samples[-limit:]
+            
+        return samples
+        
+    # ========================================================================
+    # MESSUNG
+    # ========================================================================
+    
+    def _sample(self, cpu_percent: Optional[float] = None) -> Dict:
+        if cpu_percent is None:
+            # interval=None: Auslastung seit dem letzten Aufruf, blockiert nicht
+            cpu_percent = psutil.cpu_percent(interval=None)
+            
+        ram = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        
+        sample = {
+            'timestamp': time.time(),
+            'cpu_percent': round(cpu_percent, 1),
+            'ram_percent': round(ram.percent, 1),
+            'ram_used_gb': round(ram.used / (1024**3), 2),
+            'ram_total_gb': round(ram.total / (1024**3), 2),
+            'disk_percent': round(disk.percent, 1),
+            'disk_used_gb': round(disk.used / (1024**3), 2),
+            'disk_total_gb': round(disk.total / (1024**3), 2),
+            'status': 'healthy' if cpu_percent < 80 and ram.percent < 90 else 'warning'
+        }
+        sample.update(self._sample_bot_process())
+        
+        return sample
+    
+    def _sample_bot_process(self) -> Dict:
+        """RSS und CPU des Bot-Prozesses (PID wird nur periodisch neu gesucht)"""
+        proc = self._get_bot_process()
+        
+        if proc is None:
+            return {'bot_pid': None, 'bot_rss_mb': 0, 'bot_cpu_percent': 0}
+            
+        try:
+            with proc.oneshot():
+                rss = proc.memory_info().rss
+                cpu = proc.cpu_percent(interval=None)
+                
+            return {
+                'bot_pid': proc.pid,
+                'bot_rss_mb': round(rss / (1024 * 1024), 2),
+                'bot_cpu_percent': round(cpu, 1)
+            }
+            
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            # Bot beendet -> beim nächsten Sample neu suchen
+            self._bot_process = None
+            self._last_pid_lookup = float('-inf')
+            return {'bot_pid': None, 'bot_rss_mb': 0, 'bot_cpu_percent': 0}
+    
+    def _get_bot_process(self) -> Optional[psutil.Process]:
+        if self._bot_process is not None and self._bot_process.is_running():
+            return self._bot_process
+            
+        now = time.monotonic()
+        if now - self._last_pid_lookup < self.pid_refresh_interval:
+            return None
+            
+        self._last_pid_lookup = now
+        pid = self.pid_provider()
+        
+        if pid is None:
+            self._bot_process = None
+            return None
+            
+        try:
+            self._bot_process = psutil.Process(pid)
+            
+            # Erster Aufruf liefert immer 0.0 und setzt nur den Referenzpunkt
+            self._bot_process.cpu_percent(interval=None)
+            
+        except psutil.NoSuchProcess:
+            self._bot_process = None
+            
+        return self._bot_process
+
+
+# Singleton Instance (startet beim ersten Zugriff)
+health_sampler = HealthSampler(
+    interval=HEALTH_SAMPLE_INTERVAL,
+    history_size=HEALTH_HISTORY_SIZE,
+    pid_provider=bot_controller.get_bot_pid,
+    pid_refresh_interval=BOT_PID_REFRESH_INTERVAL
+)
@@ -0,0 +1,259 @@
+"""
+MEMERO Monitoring - Log Tail Reader
+Liest die letzten N Zeilen von bot.log rückwärts in Blöcken vom Dateiende
+
+Aufwand hängt nur von der Anzahl angefragter Zeilen ab, nicht von der
+Dateigröße. Ergebnisse werden pro (inode, Größe, mtime) gecacht, solange
+der Bot nichts Neues geschrieben hat, wird die Datei gar nicht gelesen.
+
+read_since() liefert für das Dashboard nur die seit einem Byte-Cursor
+angehängten Zeilen (inkl. Erkennung von Rotation/Truncation).
+
+WICHTIG: NUR LESE-ZUGRIFF!
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from monitoring.config import BOT_LOG_FILE
+
+# Log-Format: "2026-01-07 18:28:05 | INFO     | modules.scout   | Nachricht"
+LOG_LINE_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\s*\|\s*(\w+)\s*\|\s*(.+)$')
+TIMESTAMP_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+
+# Größerer Rückstand eines Clients wird wie ein Reset behandelt (nur Tail liefern)
+MAX_DELTA_BYTES = 1024 * 1024
+
+
+def parse_log_line(line: str) -> Dict:
+    """
+    Parsed eine Log-Zeile in timestamp, level, message
+    
+    Args:
+        line: Rohe Log-Zeile
+        
+    Returns:
+        Dict mit timestamp, level, message
+    """
+    line = line.strip()
+    match = LOG_LINE_PATTERN.match(line)
+    
+    if match:
+        timestamp, level, message = match.groups()
+        return {
+            'timestamp': timestamp,
+            'level': level,
+            'message': message
+        }
+        
+    # Zeile ohne Standard-Format (z.B. Multiline)
+    return {
+        'timestamp': '',
+        'level': 'DEBUG',
+        'message': line
+    }
+
+
+class LogTailer:
+    """
+    Tail-Reader mit Seek vom Dateiende und Cache auf Datei-Signatur
+    """
+    
+    def __init__(self, path: Path, block_size: int = 8192):
+        self.path = Path(path)
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        
+        # Cache: Signatur der Datei + größte bisher gelesene Tail-Länge
+        self._cache_signature = None
+        self._cache_lines: List[str] = []
+        self._cache_requested = 0
+    
+    def _signature(self) -> Optional[tuple]:
+        try:
+            stat = self.path.stat()
+            return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        except FileNotFoundError:
+            return None
+    
+    def exists(self) -> bool:
+        return self.path.exists()
+    
+    def tail_lines(self, lines: int) -> List[str]:
+        """
+        Liefert die letzten N Rohzeilen (ohne Zeilenumbruch)
+        
+        Args:
+            lines: Anzahl Zeilen
+            
+        Returns:
+            List[str]: Letzte Zeilen, älteste zuerst
+        """
+        if lines <= 0:
+            return []
+            
+        with self._lock:
+            signature = self._signature()
+            
+            if signature is None:
+                return []
+                
+            if signature == self._cache_signature and lines <= self._cache_requested:
+                return self._cache_lines[-lines:]
+                
+            result = self._read_tail(lines)
+            
+            self._cache_signature = signature
+            self._cache_lines = result
+            self._cache_requested = lines
+            
+            return result
+    
+    def tail(self, lines: int) -> List[Dict]:
+        """
+        Liefert die letzten N Zeilen geparsed
+        
+        Args:
+            lines: Anzahl Zeilen
+            
+        Returns:
+            List von Log-Einträgen mit timestamp, level, message
+        """
+        return [parse_log_line(line) for line in self.tail_lines(lines)]
+    
+    def find_last(self, needles: tuple, max_lines: int = 100) -> Optional[str]:
+        """
+        Sucht von hinten die letzte Zeile, die einen der Suchbegriffe enthält
+        
+        Args:
+            needles: Suchbegriffe
+            max_lines: Wie viele Zeilen vom Ende durchsucht werden
+            
+        Returns:
+            Optional[str]: Gefundene Zeile oder None
+        """
+        for line in reversed(self.tail_lines(max_lines)):
+            if any(needle in line for needle in needles):
+                return line
+        return None
+    
+    def read_since(self, cursor: int, inode: Optional[int], max_lines: int) -> Dict:
+        """
+        Liefert nur die seit dem Cursor angehängten Zeilen (inkrementelles Polling)
+        
+        Der Cursor ist ein Byte-Offset hinter der letzten vollständigen Zeile.
+        Bei Rotation (neuer Inode), Truncation (Cursor hinter Dateiende) oder zu
+        großem Rückstand wird 'reset' gesetzt und die letzten max_lines Zeilen
+        geliefert - der Client ersetzt dann seine Anzeige.
+        
+        Args:
+            cursor: Byte-Offset aus der letzten Antwort (0 beim ersten Aufruf)
+            inode: Inode aus der letzten Antwort (None beim ersten Aufruf)
+            max_lines: Maximale Anzahl gelieferter Zeilen
+            
+        Returns:
+            Dict mit logs, cursor, inode, reset
+        """
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return {'logs': [], 'cursor': 0, 'inode': None, 'reset': inode is not None}
+            
+        size = stat.st_size
+        
+        # Nichts Neues geschrieben -> Datei nicht öffnen
+        if inode == stat.st_ino and cursor == size:
+            return {'logs': [], 'cursor': cursor, 'inode': inode, 'reset': False}
+            
+        reset = (
+            inode != stat.st_ino
+            or cursor < 0
+            or cursor > size
+            or size - cursor > MAX_DELTA_BYTES
+        )
+        
+        with open(self.path, 'rb') as f:
+            start = self._tail_offset(f, size, max_lines) if reset else cursor
+            lines, end = self._read_complete_lines(f, start, size)
+            
+        if len(lines) > max_lines:
+            lines = lines[-max_lines:]
+            reset = True
+            
+        return {
+            'logs': [parse_log_line(line) for line in lines],
+            'cursor': end,
+            'inode': stat.st_ino,
+            'reset': reset
+        }
+    
+    def _read_tail(self, lines: int) -> List[str]:
+        """Liest ab dem Beginn der letzten N Zeilen bis Dateiende"""
+        with open(self.path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            start = self._tail_offset(f, size, lines)
+            
+            f.seek(start)
+            data = f.read(size - start)
+            
+        return data.decode('utf-8', errors='replace').splitlines()[-lines:]
+    
+    def _tail_offset(self, f, size: int, lines: int) -> int:
+        """
+        Sucht rückwärts in Blöcken den Byte-Offset, an dem die letzten N Zeilen beginnen
+        
+        Returns:
+            int: Offset (0 wenn die Datei weniger Zeilen hat)
+        """
+        if size == 0:
+            return 0
+            
+        # Das Newline der letzten Zeile zählt nicht als Trenner
+        f.seek(size - 1)
+        position = size - 1 if f.read(1) == b'\n' else size
+        remaining = lines
+        
+        while position > 0:
+            read_size = min(self.block_size, position)
+            position -= read_size
+            f.seek(position)
+            
+            block = f.read(read_size)
+            count = block.count(b'\n')
+            
+            if count >= remaining:
+                index = len(block)
+                for _ in range(remaining):
+                    index = block.rindex(b'\n', 0, index)
+                return position + index + 1
+                
+            remaining -= count
+            
+        return 0
+    
+    def _read_complete_lines(self, f, start: int, size: int) -> Tuple[List[str], int]:
+        """
+        Liest ab start alle vollständigen Zeilen (eine halb geschriebene letzte Zeile
+        bleibt für den nächsten Aufruf liegen)
+        
+        Returns:
+            Tuple[List[str], int]: Zeilen und Offset hinter der letzten vollständigen Zeile
+        """
+        f.seek(start)
+        data = f.read(size - start)
+        
+        last_newline = data.rfind(b'\n')
+        if last_newline < 0:
+            return [], start
+            
+        data = data[:last_newline + 1]
+        lines = data.decode('utf-8', errors='replace').splitlines()
+        
+        return lines, start + len(data)
+
+
+# Singleton Instance
+bot_log_tailer = LogTailer(BOT_LOG_FILE)
@@ -8,7 +8,7 @@ WICHTIG: Dieses Modul ist KOMPLETT ISOLIERT vom Trading-Bot!
 - Nur Lese-Zugriff auf Logs und öffentliche Blockchain-Daten
 """
 
-from flask import Flask, render_template, jsonify, request, session, redirect, url_for
+from flask import Flask, Response, render_template, jsonify, request, session, redirect, url_for, stream_with_context
 from werkzeug.security import generate_password_hash, check_password_hash
 from functools import wraps
 import os
@@ -20,10 +20,18 @@ from monitoring.config import (
     ADMIN_USERNAME,
     ADMIN_PASSWORD,
     BOT_CONTROL_PASSWORD,
+    MAX_LOG_LINES,
+    STREAM_PUBLISH_INTERVAL,
+    STREAM_WALLET_INTERVAL,
+    STREAM_HEARTBEAT_INTERVAL,
+    HEALTH_SAMPLE_INTERVAL,
     DEBUG
 )
 from monitoring.data_reader import data_reader
 from monitoring.bot_control import bot_controller
+from monitoring.log_tail import bot_log_tailer
+from monitoring.health_sampler import health_sampler
+from monitoring.publisher import dashboard_publisher
 
 
 # ============================================================================
@@ -103,6 +111,66 @@ def dashboard():
     return render_template('dashboard.html')
 
 
+# ============================================================================
+# PAYLOADS (gemeinsam für REST-Endpunkte und Push-Kanal)
+# ============================================================================
+
+def status_payload() -> dict:
+    """Server Health + Bot-Aktivität"""
+    return {
+        'server': data_reader.get_server_health(),
+        'bot': data_reader.get_bot_status()
+    }
+
+
+def trades_payload(limit: int) -> dict:
+    """Letzte N Trades"""
+    trades = data_reader.get_trades(limit=limit)
+    
+    return {
+        'trades': trades,
+        'total': len(trades)
+    }
+
+
+def positions_payload() -> dict:
+    """Offene Positionen aus dem Trade-Speicher"""
+    positions = data_reader.get_positions()
+    
+    return {
+        'positions': positions,
+        'total': len(positions)
+    }
+
+
+def bot_status_payload() -> dict:
+    """Prozess-Status + Sleep-Timer (prüft dabei auch den Auto-Stop)"""
+    # Nutze erweiterte get_bot_status() Methode
+    status = bot_controller.get_bot_status()
+    timer_status = bot_controller.check_timer()
+    
+    return {
+        'is_running': status['running'],
+        'pid': status.get('pid'),
+        'uptime': status.get('uptime', 0),
+        'uptime_formatted': status.get('uptime_formatted', '0m'),
+        'last_activity': status.get('last_activity'),
+        'memory_mb': status.get('memory_mb', 0),
+        'timer': timer_status
+    }
+
+
+# Datenquellen des Push-Kanals: jede wird einmal pro Intervall berechnet,
+# Änderungen gehen an alle verbundenen Tabs
+dashboard_publisher.add_topic('status', status_payload, STREAM_PUBLISH_INTERVAL)
+dashboard_publisher.add_topic('wallet', data_reader.get_wallet_balance, STREAM_WALLET_INTERVAL)
+dashboard_publisher.add_topic('stats', data_reader.get_statistics, STREAM_PUBLISH_INTERVAL)
+dashboard_publisher.add_topic('trades', lambda: trades_payload(20), STREAM_PUBLISH_INTERVAL)
+dashboard_publisher.add_topic('positions', positions_payload, STREAM_PUBLISH_INTERVAL)
+dashboard_publisher.add_topic('bot_status', bot_status_payload, STREAM_PUBLISH_INTERVAL)
+dashboard_publisher.add_log_topic('logs', bot_log_tailer, MAX_LOG_LINES, STREAM_PUBLISH_INTERVAL)
+
+
 # ============================================================================
 # API ENDPOINTS (alle erfordern Login!)
 # ============================================================================
@@ -113,12 +181,22 @@ def api_status():
     """
     Server Health Status (CPU, RAM, Disk)
     """
-    health = data_reader.get_server_health()
-    bot_status = data_reader.get_bot_status()
+    return jsonify(status_payload())
+
+
+@app.route('/api/health/history')
+@login_required
+def api_health_history():
+    """
+    Kurze Historie der Server- und Bot-Metriken (für Sparklines)
+    """
+    limit = request.args.get('limit', None, type=int)
+    samples = health_sampler.history(limit=limit)
     
     return jsonify({
-        'server': health,
-        'bot': bot_status
+        'samples': samples,
+        'interval': HEALTH_SAMPLE_INTERVAL,
+        'total': len(samples)
     })
 
 
@@ -127,7 +205,18 @@ def api_status():
 def api_logs():
     """
     Bot Logs (letzte N Zeilen)
+    
+    Mit ?since=<cursor>&inode=<inode> nur die seit dem letzten Abruf neuen Zeilen.
     """
+    if 'since' in request.args:
+        result = data_reader.get_logs_since(
+            cursor=request.args.get('since', 0, type=int),
+            inode=request.args.get('inode', None, type=int)
+        )
+        result['total'] = len(result['logs'])
+        
+        return jsonify(result)
+        
     lines = request.args.get('lines', 100, type=int)
     logs = data_reader.get_logs(lines=lines)
     
@@ -155,12 +244,8 @@ def api_trades():
     Trade Historie
     """
     limit = request.args.get('limit', 50, type=int)
-    trades = data_reader.get_trades(limit=limit)
     
-    return jsonify({
-        'trades': trades,
-        'total': len(trades)
-    })
+    return jsonify(trades_payload(limit))
 
 
 @app.route('/api/stats')
@@ -181,18 +266,7 @@ def api_positions():
     Aktuelle offene Positionen
     """
     try:
-        # Import trade_manager direkt (ist bereits in data_reader importiert)
-        import sys
-        from pathlib import Path
-        sys.path.insert(0, str(Path(__file__).parent.parent))
-        from modules.trade_manager import trade_manager
-        
-        positions = trade_manager.load_positions()
-        
-        return jsonify({
-            'positions': positions,
-            'total': len(positions)
-        })
+        return jsonify(positions_payload())
     except Exception as e:
         return jsonify({
             'error': str(e),
@@ -201,6 +275,43 @@ def api_positions():
         }), 500
 
 
+@app.route('/api/stream')
+@login_required
+def api_stream():
+    """
+    Push-Kanal (Server-Sent Events): alle Dashboard-Daten, nur bei Änderungen
+    
+    Beim Verbinden kommt zuerst der aktuelle Stand jeder Datenquelle.
+    Das Dashboard fällt auf Polling zurück, wenn der Stream nicht verfügbar ist.
+    """
+    subscriber = dashboard_publisher.subscribe()
+    
+    def generate():
+        try:
+            yield 'retry: 5000\n\n'
+            
+            while True:
+                events = dashboard_publisher.next_events(subscriber, timeout=STREAM_HEARTBEAT_INTERVAL)
+                
+                if not events:
+                    yield ': heartbeat\n\n'
+                    continue
+                    
+                for event, data in events:
+                    yield f'event: {event}\ndata: {data}\n\n'
+        finally:
+            dashboard_publisher.unsubscribe(subscriber)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # nginx: nicht puffern
+        }
+    )
+
+
 # ============================================================================
 # API ENDPOINTS: BOT CONTROL (2-stufige Auth!)
 # ============================================================================
@@ -211,19 +322,7 @@ def api_bot_status():
     """
     Bot-Status mit Live-Metriken (uptime, last_activity, memory)
     """
-    # Nutze erweiterte get_bot_status() Methode
-    status = bot_controller.get_bot_status()
-    timer_status = bot_controller.check_timer()
-    
-    return jsonify({
-        'is_running': status['running'],
-        'pid': status.get('pid'),
-        'uptime': status.get('uptime', 0),
-        'uptime_formatted': status.get('uptime_formatted', '0m'),
-        'last_activity': status.get('last_activity'),
-        'memory_mb': status.get('memory_mb', 0),
-        'timer': timer_status
-    })
+    return jsonify(bot_status_payload())
 
 
 @app.route('/api/bot/start', methods=['POST'])
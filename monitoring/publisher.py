@@ -0,0 +1,290 @@
+"""
+MEMERO Monitoring - Dashboard Publisher
+Server-seitiger Push-Kanal für das Dashboard (Server-Sent Events)
+
+Ein Hintergrund-Thread berechnet jede Datenquelle (Status, Wallet, Stats,
+Trades, Positionen, Bot-Status, Logs) EINMAL pro Intervall und verteilt nur
+Änderungen an alle verbundenen Browser-Tabs. Die Serverlast hängt damit nicht
+mehr von der Anzahl der Zuschauer ab.
+
+Ohne verbundene Clients ruht der Thread.
+
+WICHTIG: NUR LESE-ZUGRIFF!
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from monitoring.log_tail import LogTailer
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotTopic:
+    """
+    Datenquelle, deren kompletter Zustand bei jeder Änderung verteilt wird
+    """
+    
+    def __init__(self, name: str, producer: Callable[[], Dict], interval: float):
+        self.name = name
+        self.producer = producer
+        self.interval = interval
+        self.next_run = 0.0
+        self._data: Optional[str] = None
+    
+    def poll(self) -> Optional[str]:
+        """
+        Berechnet die Datenquelle neu
+        
+        Returns:
+            Optional[str]: Serialisierte Daten wenn sich etwas geändert hat, sonst None
+        """
+        data = json.dumps(self.producer(), sort_keys=True, default=str)
+        return data if data != self._data else None
+    
+    def commit(self, data: str):
+        """Übernimmt verteilte Daten als aktuellen Stand (unter Publisher-Lock)"""
+        self._data = data
+    
+    def snapshot(self) -> Optional[str]:
+        return self._data
+
+
+class LogTopic:
+    """
+    Log-Feed: verteilt nur neue Zeilen, neue Clients erhalten die letzten N Zeilen
+    """
+    
+    def __init__(self, name: str, tailer: LogTailer, max_lines: int, interval: float):
+        self.name = name
+        self.tailer = tailer
+        self.max_lines = max_lines
+        self.interval = interval
+        self.next_run = 0.0
+        
+        # Lese-Position (nur Publisher-Thread)
+        self._cursor = 0
+        self._inode = None
+        
+        # Verteilter Stand für neue Clients
+        self._lines = deque(maxlen=max_lines)
+        self._committed: Optional[Dict] = None
+    
+    def poll(self) -> Optional[str]:
+        result = self.tailer.read_since(self._cursor, self._inode, self.max_lines)
+        
+        self._cursor = result['cursor']
+        self._inode = result['inode']
+        
+        if not result['logs'] and not result['reset']:
+            return None
+            
+        return json.dumps(result)
+    
+    def commit(self, data: str):
+        result = json.loads(data)
+        
+        if result['reset']:
+            self._lines.clear()
+        self._lines.extend(result['logs'])
+        
+        self._committed = {'cursor': result['cursor'], 'inode': result['inode']}
+    
+    def snapshot(self) -> Optional[str]:
+        if self._committed is None:
+            return None
+            
+        return json.dumps({
+            'logs': list(self._lines),
+            'cursor': self._committed['cursor'],
+            'inode': self._committed['inode'],
+            'reset': True
+        })
+
+
+class Subscriber:
+    """
+    Verbundener Client mit eigener, begrenzter Event-Queue
+    """
+    
+    def __init__(self, max_pending: int):
+        self.queue = queue.Queue(maxsize=max_pending)
+        
+        # Zu langsamer Client: Queue wird verworfen und mit Snapshots neu befüllt
+        self.overflowed = False
+
+
+class DashboardPublisher:
+    """
+    Berechnet Datenquellen einmal pro Änderung und verteilt sie an alle Subscriber
+    """
+    
+    def __init__(self, max_pending: int = 100):
+        self.max_pending = max_pending
+        self.topics = []
+        
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def add_topic(self, name: str, producer: Callable[[], Dict], interval: float):
+        """
+        Registriert eine Datenquelle
+        
+        Args:
+            name: Event-Name im SSE-Stream
+            producer: Liefert den aktuellen Zustand (JSON-serialisierbar)
+            interval: Abfrage-Intervall in Sekunden
+        """
+        self.topics.append(SnapshotTopic(name, producer, interval))
+    
+    def add_log_topic(self, name: str, tailer: LogTailer, max_lines: int, interval: float):
+        """
+        Registriert einen Log-Feed (nur neue Zeilen werden verteilt)
+        """
+        self.topics.append(LogTopic(name, tailer, max_lines, interval))
+        
+    # ========================================================================
+    # SUBSCRIBER
+    # ========================================================================
+    
+    def subscribe(self) -> Subscriber:
+        """
+        Meldet einen Client an, er erhält zuerst den aktuellen Stand aller Datenquellen
+        
+        Returns:
+            Subscriber: Handle für next_events() / unsubscribe()
+        """
+        subscriber = Subscriber(self.max_pending)
+        
+        with self._lock:
+            self._push_snapshots(subscriber)
+            self._subscribers.append(subscriber)
+            
+        self._ensure_running()
+        self._wakeup.set()
+        
+        return subscriber
+    
+    def unsubscribe(self, subscriber: Subscriber):
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+    
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+    
+    def next_events(self, subscriber: Subscriber, timeout: float) -> List[Tuple[str, str]]:
+        """
+        Wartet auf Events für einen Client
+        
+        Args:
+            subscriber: Angemeldeter Client
+            timeout: Maximale Wartezeit in Sekunden (danach leere Liste -> Heartbeat)
+            
+        Returns:
+            List[Tuple[str, str]]: (Event-Name, JSON-Daten)
+        """
+        if subscriber.overflowed:
+            with self._lock:
+                self._drain(subscriber)
+                subscriber.overflowed = False
+                self._push_snapshots(subscriber)
+                
+        try:
+            events = [subscriber.queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+            
+        # Alles was bereits wartet in einem Rutsch mitnehmen
+        while True:
+            try:
+                events.append(subscriber.queue.get_nowait())
+            except queue.Empty:
+                return events
+    
+    def _push_snapshots(self, subscriber: Subscriber):
+        for topic in self.topics:
+            data = topic.snapshot()
+            if data is not None:
+                self._put(subscriber, topic.name, data)
+    
+    def _broadcast(self, topic, data: str):
+        # Commit + Verteilen atomar: neue Clients sehen jede Änderung genau einmal
+        with self._lock:
+            topic.commit(data)
+            
+            for subscriber in self._subscribers:
+                self._put(subscriber, topic.name, data)
+    
+    @staticmethod
+    def _put(subscriber: Subscriber, event: str, data: str):
+        try:
+            subscriber.queue.put_nowait((event, data))
+        except queue.Full:
+            subscriber.overflowed = True
+    
+    @staticmethod
+    def _drain(subscriber: Subscriber):
+        while True:
+            try:
+                subscriber.queue.get_nowait()
+            except queue.Empty:
+                return
+                
+    # ========================================================================
+    # PUBLISHER THREAD
+    # ========================================================================
+    
+    def _ensure_running(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+                
+            self._thread = threading.Thread(
+                target=self._run,
+                name='dashboard-publisher',
+                daemon=True
+            )
+            self._thread.start()
+    
+    def _run(self):
+        while True:
+            if not self.subscriber_count():
+                # Niemand schaut zu -> nichts berechnen
+                self._wakeup.clear()
+                if not self.subscriber_count():
+                    self._wakeup.wait()
+                continue
+                
+            now = time.monotonic()
+            
+            for topic in self.topics:
+                if now < topic.next_run:
+                    continue
+                    
+                topic.next_run = now + topic.interval
+                
+                try:
+                    data = topic.poll()
+                except Exception as e:
+                    logger.error(f"Publisher: Fehler bei '{topic.name}': {e}")
+                    continue
+                    
+                if data is not None:
+                    self._broadcast(topic, data)
+                    
+            next_run = min((topic.next_run for topic in self.topics), default=now + 1)
+            self._wakeup.wait(max(0.0, next_run - time.monotonic()))
+            self._wakeup.clear()
+
+
+# Singleton Instance (Datenquellen werden in monitor.py registriert)
+dashboard_publisher = DashboardPublisher()
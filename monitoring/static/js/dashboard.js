@@ -7,14 +7,20 @@
 let performanceChart = null;
 let winlossChart = null;
 
-// Auto-Refresh Interval (10 Sekunden)
+// Auto-Refresh Interval (10 Sekunden, nur ohne Push-Kanal)
 const REFRESH_INTERVAL = 10000;
+let pollingTimer = null;
 
 // Trade Interval (300 Sekunden = 5 Minuten)
 const TRADE_INTERVAL = 300;
 let lastTradeTime = null;
 let countdownInterval = null;
 
+// Log-Panel: Cursor für inkrementelles Laden (/api/logs?since=...)
+const LOG_PANEL_MAX_LINES = 500;
+let logCursor = 0;
+let logInode = null;
+
 // ============================================================================
 // INITIALIZATION
 // ============================================================================
@@ -22,9 +28,6 @@ let countdownInterval = null;
 document.addEventListener('DOMContentLoaded', function() {
     console.log('MEMERO Dashboard geladen');
     
-    // Initiale Daten laden
-    loadAllData();
-    
     // Charts initialisieren
     initCharts();
     
@@ -34,10 +37,69 @@ document.addEventListener('DOMContentLoaded', function() {
     // Countdown starten
     startTradeCountdown();
     
-    // Auto-Refresh starten
-    setInterval(loadAllData, REFRESH_INTERVAL);
+    // Live-Updates per Push-Kanal, Polling nur als Fallback
+    startLiveUpdates();
 });
 
+// ============================================================================
+// LIVE UPDATES (Server-Sent Events mit Polling-Fallback)
+// ============================================================================
+
+const STREAM_HANDLERS = {
+    status: renderStatus,
+    wallet: renderWallet,
+    stats: renderStats,
+    trades: renderTrades,
+    positions: renderPositions,
+    bot_status: renderBotStatus,
+    logs: renderLogs
+};
+
+function startLiveUpdates() {
+    // Der Stream liefert beim Verbinden den aktuellen Stand aller Datenquellen
+    if (!window.EventSource) {
+        startPolling();
+        return;
+    }
+    
+    const source = new EventSource('/api/stream');
+    
+    Object.entries(STREAM_HANDLERS).forEach(([event, render]) => {
+        source.addEventListener(event, function(e) {
+            try {
+                render(JSON.parse(e.data));
+            } catch (error) {
+                console.error(`Fehler beim Verarbeiten von '${event}':`, error);
+            }
+        });
+    });
+    
+    source.onopen = function() {
+        console.log('Push-Kanal verbunden');
+        stopPolling();
+    };
+    
+    // EventSource verbindet sich selbst neu, bis dahin wird gepollt
+    source.onerror = function() {
+        console.warn('Push-Kanal getrennt - Polling aktiv');
+        startPolling();
+    };
+}
+
+function startPolling() {
+    if (pollingTimer === null) {
+        loadAllData();
+        pollingTimer = setInterval(loadAllData, REFRESH_INTERVAL);
+    }
+}
+
+function stopPolling() {
+    if (pollingTimer !== null) {
+        clearInterval(pollingTimer);
+        pollingTimer = null;
+    }
+}
+
 // ============================================================================
 // DATA LOADING
 // ============================================================================
@@ -55,244 +117,268 @@ function loadAllData() {
 async function loadStatus() {
     try {
         const response = await fetch('/api/status');
-        const data = await response.json();
-        
-        // Bot Status
-        const botStatus = data.bot;
-        const botIndicator = document.getElementById('bot-indicator');
-        const botRunning = document.getElementById('bot-running');
-        const botActivity = document.getElementById('bot-last-activity');
-        
-        if (botStatus.is_running) {
-            botIndicator.textContent = '🟢';
-            botRunning.textContent = 'Läuft';
-            botRunning.style.color = 'var(--success-color)';
-        } else {
-            botIndicator.textContent = '🔴';
-            botRunning.textContent = 'Gestoppt';
-            botRunning.style.color = 'var(--danger-color)';
-        }
-        
-        botActivity.textContent = `Letzte Aktivität: ${botStatus.last_activity || 'N/A'}`;
-        
-        // Update Countdown mit Bot-Status
-        updateCountdownFromBotStatus(botStatus);
-        
-        // Server Health
-        const serverStatus = data.server;
-        const serverIndicator = document.getElementById('server-indicator');
-        
-        if (serverStatus.status === 'healthy') {
-            serverIndicator.textContent = '🟢';
-        } else if (serverStatus.status === 'warning') {
-            serverIndicator.textContent = '🟡';
-        } else {
-            serverIndicator.textContent = '🔴';
-        }
-        
-        document.getElementById('cpu-usage').textContent = `${serverStatus.cpu_percent}%`;
-        document.getElementById('ram-usage').textContent = `${serverStatus.ram_percent}%`;
-        document.getElementById('disk-usage').textContent = `${serverStatus.disk_percent}%`;
-        
-        // Färbung basierend auf Auslastung
-        setMetricColor('cpu-usage', serverStatus.cpu_percent);
-        setMetricColor('ram-usage', serverStatus.ram_percent);
-        setMetricColor('disk-usage', serverStatus.disk_percent);
-        
+        renderStatus(await response.json());
     } catch (error) {
         console.error('Fehler beim Laden des Status:', error);
     }
 }
 
+function renderStatus(data) {
+    // Bot Status
+    const botStatus = data.bot;
+    const botIndicator = document.getElementById('bot-indicator');
+    const botRunning = document.getElementById('bot-running');
+    const botActivity = document.getElementById('bot-last-activity');
+    
+    if (botStatus.is_running) {
+        botIndicator.textContent = '🟢';
+        botRunning.textContent = 'Läuft';
+        botRunning.style.color = 'var(--success-color)';
+    } else {
+        botIndicator.textContent = '🔴';
+        botRunning.textContent = 'Gestoppt';
+        botRunning.style.color = 'var(--danger-color)';
+    }
+    
+    botActivity.textContent = `Letzte Aktivität: ${botStatus.last_activity || 'N/A'}`;
+    
+    // Update Countdown mit Bot-Status
+    updateCountdownFromBotStatus(botStatus);
+    
+    // Server Health
+    const serverStatus = data.server;
+    const serverIndicator = document.getElementById('server-indicator');
+    
+    if (serverStatus.status === 'healthy') {
+        serverIndicator.textContent = '🟢';
+    } else if (serverStatus.status === 'warning') {
+        serverIndicator.textContent = '🟡';
+    } else {
+        serverIndicator.textContent = '🔴';
+    }
+    
+    document.getElementById('cpu-usage').textContent = `${serverStatus.cpu_percent}%`;
+    document.getElementById('ram-usage').textContent = `${serverStatus.ram_percent}%`;
+    document.getElementById('disk-usage').textContent = `${serverStatus.disk_percent}%`;
+    
+    // Färbung basierend auf Auslastung
+    setMetricColor('cpu-usage', serverStatus.cpu_percent);
+    setMetricColor('ram-usage', serverStatus.ram_percent);
+    setMetricColor('disk-usage', serverStatus.disk_percent);
+}
+
 async function loadWallet() {
     try {
         const response = await fetch('/api/wallet');
-        const data = await response.json();
-        
-        if (data.error) {
-            document.getElementById('balance-sol').textContent = 'Fehler';
-            document.getElementById('balance-usd').textContent = data.error;
-            document.getElementById('wallet-address').textContent = data.address || 'N/A';
-        } else {
-            document.getElementById('balance-sol').textContent = `${data.balance_sol} SOL`;
-            document.getElementById('balance-usd').textContent = `$${data.balance_usd}`;
-            document.getElementById('wallet-address').textContent = data.address;
-        }
-        
+        renderWallet(await response.json());
     } catch (error) {
         console.error('Fehler beim Laden der Wallet-Daten:', error);
     }
 }
 
+function renderWallet(data) {
+    if (data.error) {
+        document.getElementById('balance-sol').textContent = 'Fehler';
+        document.getElementById('balance-usd').textContent = data.error;
+        document.getElementById('wallet-address').textContent = data.address || 'N/A';
+    } else {
+        document.getElementById('balance-sol').textContent = `${data.balance_sol} SOL`;
+        document.getElementById('balance-usd').textContent = `$${data.balance_usd}`;
+        document.getElementById('wallet-address').textContent = data.address;
+    }
+}
+
 async function loadStats() {
     try {
         const response = await fetch('/api/stats');
-        const stats = await response.json();
-        
-        if (stats.error) {
-            console.error('Stats Error:', stats.error);
-            return;
-        }
-        
-        // Performance Card
-        const todayPnl = stats.today_pnl || 0;
-        const totalPnl = stats.total_pnl || 0;
-        const winRate = stats.win_rate || 0;
-        
-        const todayPnlEl = document.getElementById('today-pnl');
-        todayPnlEl.textContent = `${todayPnl >= 0 ? '+' : ''}${todayPnl.toFixed(6)} SOL`;
-        todayPnlEl.className = 'pnl-value ' + (todayPnl >= 0 ? 'positive' : 'negative');
-        
-        const totalPnlEl = document.getElementById('total-pnl');
-        totalPnlEl.textContent = `${totalPnl >= 0 ? '+' : ''}${totalPnl.toFixed(6)} SOL`;
-        totalPnlEl.className = 'pnl-value ' + (totalPnl >= 0 ? 'positive' : 'negative');
-        
-        document.getElementById('win-rate').textContent = `${winRate.toFixed(1)}%`;
-        
-        // Update Charts
-        updateCharts(stats);
-        
-        // Update Performance Chart mit Trade-Historie
-        await updatePerformanceChart();
-        
+        renderStats(await response.json());
     } catch (error) {
         console.error('Fehler beim Laden der Statistiken:', error);
     }
 }
 
+function renderStats(stats) {
+    if (stats.error) {
+        console.error('Stats Error:', stats.error);
+        return;
+    }
+    
+    // Performance Card
+    const todayPnl = stats.today_pnl || 0;
+    const totalPnl = stats.total_pnl || 0;
+    const winRate = stats.win_rate || 0;
+    
+    const todayPnlEl = document.getElementById('today-pnl');
+    todayPnlEl.textContent = `${todayPnl >= 0 ? '+' : ''}${todayPnl.toFixed(6)} SOL`;
+    todayPnlEl.className = 'pnl-value ' + (todayPnl >= 0 ? 'positive' : 'negative');
+    
+    const totalPnlEl = document.getElementById('total-pnl');
+    totalPnlEl.textContent = `${totalPnl >= 0 ? '+' : ''}${totalPnl.toFixed(6)} SOL`;
+    totalPnlEl.className = 'pnl-value ' + (totalPnl >= 0 ? 'positive' : 'negative');
+    
+    document.getElementById('win-rate').textContent = `${winRate.toFixed(1)}%`;
+    
+    // Update Charts
+    updateCharts(stats);
+    
+    // Update Performance Chart mit Trade-Historie
+    updatePerformanceChart();
+}
+
 async function loadTrades() {
     try {
         const response = await fetch('/api/trades?limit=20');
-        const data = await response.json();
-        
-        const tbody = document.getElementById('trades-tbody');
-        
-        if (data.trades.length === 0) {
-            tbody.innerHTML = '<tr><td colspan="5" class="loading">Keine Trades vorhanden</td></tr>';
-            return;
-        }
-        
-        tbody.innerHTML = '';
-        
-        data.trades.forEach(trade => {
-            const row = document.createElement('tr');
-            
-            // Status Badge
-            let statusClass = 'pending';
-            if (trade.status === 'success') statusClass = 'success';
-            if (trade.status === 'failed') statusClass = 'failed';
-            
-            row.innerHTML = `
-                <td>${trade.timestamp || 'N/A'}</td>
-                <td>${trade.symbol || 'N/A'}</td>
-                <td style="font-family: monospace; font-size: 11px;">${trade.address ? trade.address.substring(0, 8) + '...' : 'N/A'}</td>
-                <td>${trade.type || 'N/A'}</td>
-                <td><span class="status-badge ${statusClass}">${trade.status || 'pending'}</span></td>
-            `;
-            
-            tbody.appendChild(row);
-        });
-        
+        renderTrades(await response.json());
     } catch (error) {
         console.error('Fehler beim Laden der Trades:', error);
     }
 }
 
+function renderTrades(data) {
+    const tbody = document.getElementById('trades-tbody');
+    
+    if (data.trades.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="5" class="loading">Keine Trades vorhanden</td></tr>';
+        return;
+    }
+    
+    tbody.innerHTML = '';
+    
+    data.trades.forEach(trade => {
+        const row = document.createElement('tr');
+        
+        // Status Badge
+        let statusClass = 'pending';
+        if (trade.status === 'success') statusClass = 'success';
+        if (trade.status === 'failed') statusClass = 'failed';
+        
+        row.innerHTML = `
+            <td>${trade.timestamp || 'N/A'}</td>
+            <td>${trade.symbol || 'N/A'}</td>
+            <td style="font-family: monospace; font-size: 11px;">${trade.address ? trade.address.substring(0, 8) + '...' : 'N/A'}</td>
+            <td>${trade.type || 'N/A'}</td>
+            <td><span class="status-badge ${statusClass}">${trade.status || 'pending'}</span></td>
+        `;
+        
+        tbody.appendChild(row);
+    });
+}
+
 async function loadPositions() {
     try {
         const response = await fetch('/api/positions');
-        const data = await response.json();
-        
-        const container = document.getElementById('positions-container');
-        
-        if (!container) {
-            // Container noch nicht im HTML, erstmal überspringen
-            return;
-        }
-        
-        if (data.positions.length === 0) {
-            container.innerHTML = '<div class="no-positions">Keine offenen Positionen</div>';
-            return;
-        }
-        
-        container.innerHTML = '';
-        
-        data.positions.forEach(pos => {
-            const card = document.createElement('div');
-            card.className = 'position-card';
-            
-            const pnlClass = pos.pnl_percent >= 0 ? 'positive' : 'negative';
-            const pnlSign = pos.pnl_percent >= 0 ? '+' : '';
-            
-            card.innerHTML = `
-                <div class="position-header">
-                    <h4>${pos.symbol}</h4>
-                    <span class="pnl-badge ${pnlClass}">${pnlSign}${pos.pnl_percent.toFixed(2)}%</span>
-                </div>
-                <div class="position-details">
-                    <div class="position-row">
-                        <span class="label">Entry:</span>
-                        <span class="value">${pos.entry_price.toFixed(6)} SOL</span>
-                    </div>
-                    <div class="position-row">
-                        <span class="label">Current:</span>
-                        <span class="value">${pos.current_price.toFixed(6)} SOL</span>
-                    </div>
-                    <div class="position-row">
-                        <span class="label">Amount:</span>
-                        <span class="value">${pos.amount_tokens.toFixed(2)} Tokens</span>
-                    </div>
-                    <div class="position-row">
-                        <span class="label">CA:</span>
-                        <span class="value ca-text" title="${pos.token_address}">
-                            ${pos.token_address.substring(0, 8)}...
-                            <button class="copy-btn" onclick="copyToClipboard('${pos.token_address}')">📋</button>
-                        </span>
-                    </div>
-                </div>
-            `;
-            
-            container.appendChild(card);
-        });
-        
+        renderPositions(await response.json());
     } catch (error) {
         console.error('Fehler beim Laden der Positionen:', error);
     }
 }
 
+function renderPositions(data) {
+    const container = document.getElementById('positions-container');
+    
+    if (!container) {
+        // Container noch nicht im HTML, erstmal überspringen
+        return;
+    }
+    
+    if (data.positions.length === 0) {
+        container.innerHTML = '<div class="no-positions">Keine offenen Positionen</div>';
+        return;
+    }
+    
+    container.innerHTML = '';
+    
+    data.positions.forEach(pos => {
+        const card = document.createElement('div');
+        card.className = 'position-card';
+        
+        const pnlClass = pos.pnl_percent >= 0 ? 'positive' : 'negative';
+        const pnlSign = pos.pnl_percent >= 0 ? '+' : '';
+        
+        card.innerHTML = `
+            <div class="position-header">
+                <h4>${pos.symbol}</h4>
+                <span class="pnl-badge ${pnlClass}">${pnlSign}${pos.pnl_percent.toFixed(2)}%</span>
+            </div>
+            <div class="position-details">
+                <div class="position-row">
+                    <span class="label">Entry:</span>
+                    <span class="value">${pos.entry_price.toFixed(6)} SOL</span>
+                </div>
+                <div class="position-row">
+                    <span class="label">Current:</span>
+                    <span class="value">${pos.current_price.toFixed(6)} SOL</span>
+                </div>
+                <div class="position-row">
+                    <span class="label">Amount:</span>
+                    <span class="value">${(pos.token_decimals != null ? pos.amount_tokens / 10 ** pos.token_decimals : pos.amount_tokens).toFixed(2)} Tokens</span>
+                </div>
+                <div class="position-row">
+                    <span class="label">CA:</span>
+                    <span class="value ca-text" title="${pos.token_address}">
+                        ${pos.token_address.substring(0, 8)}...
+                        <button class="copy-btn" onclick="copyToClipboard('${pos.token_address}')">📋</button>
+                    </span>
+                </div>
+            </div>
+        `;
+        
+        container.appendChild(card);
+    });
+}
+
 async function loadLogs() {
     try {
-        const response = await fetch('/api/logs?lines=100');
-        const data = await response.json();
-        
-        const logsContainer = document.getElementById('logs-container');
-        
-        if (data.logs.length === 0) {
+        // Nur neue Zeilen seit dem letzten Abruf holen (Byte-Cursor + Inode)
+        const inodeParam = logInode === null ? '' : `&inode=${logInode}`;
+        const response = await fetch(`/api/logs?since=${logCursor}${inodeParam}`);
+        renderLogs(await response.json());
+    } catch (error) {
+        console.error('Fehler beim Laden der Logs:', error);
+    }
+}
+
+function renderLogs(data) {
+    const logsContainer = document.getElementById('logs-container');
+    
+    logCursor = data.cursor;
+    logInode = data.inode;
+    
+    // Rotation/Truncation oder erster Abruf: Anzeige komplett ersetzen
+    if (data.reset) {
+        logsContainer.innerHTML = '';
+    }
+    
+    if (data.logs.length === 0) {
+        if (logsContainer.querySelector('.log-entry') === null) {
             logsContainer.innerHTML = '<div class="loading">Keine Logs vorhanden</div>';
-            return;
         }
+        return;
+    }
+    
+    // Platzhalter ("Lade...", "Keine Logs vorhanden") entfernen
+    logsContainer.querySelectorAll('.loading').forEach(el => el.remove());
+    
+    data.logs.forEach(log => {
+        const logEntry = document.createElement('div');
+        logEntry.className = `log-entry ${log.level}`;
         
-        logsContainer.innerHTML = '';
-        
-        data.logs.forEach(log => {
-            const logEntry = document.createElement('div');
-            logEntry.className = `log-entry ${log.level}`;
-            
-            logEntry.innerHTML = `
-                <span class="log-timestamp">${log.timestamp}</span>
-                <span class="log-level">${log.level}</span>
-                <span class="log-message">${escapeHtml(log.message)}</span>
-            `;
-            
-            logsContainer.appendChild(logEntry);
-        });
-        
-        // Auto-scroll zu letztem Log
-        logsContainer.scrollTop = logsContainer.scrollHeight;
+        logEntry.innerHTML = `
+            <span class="log-timestamp">${log.timestamp}</span>
+            <span class="log-level">${log.level}</span>
+            <span class="log-message">${escapeHtml(log.message)}</span>
+        `;
         
-    } catch (error) {
-        console.error('Fehler beim Laden der Logs:', error);
+        logsContainer.appendChild(logEntry);
+    });
+    
+    // Älteste Einträge verwerfen
+    while (logsContainer.children.length > LOG_PANEL_MAX_LINES) {
+        logsContainer.removeChild(logsContainer.firstChild);
     }
+    
+    // Auto-scroll zu letztem Log
+    logsContainer.scrollTop = logsContainer.scrollHeight;
 }
 
 // ============================================================================
@@ -497,55 +583,56 @@ let currentBotAction = null;
 async function loadBotStatus() {
     try {
         const response = await fetch('/api/bot/status');
-        const data = await response.json();
-        
-        const dot = document.getElementById('bot-control-dot');
-        const status = document.getElementById('bot-control-status');
-        const startBtn = document.getElementById('btn-start-bot');
-        const stopBtn = document.getElementById('btn-stop-bot');
+        renderBotStatus(await response.json());
+    } catch (error) {
+        console.error('Fehler beim Laden des Bot-Status:', error);
+    }
+}
+
+function renderBotStatus(data) {
+    const dot = document.getElementById('bot-control-dot');
+    const status = document.getElementById('bot-control-status');
+    const startBtn = document.getElementById('btn-start-bot');
+    const stopBtn = document.getElementById('btn-stop-bot');
+    
+    if (data.is_running) {
+        dot.textContent = '🟢';
         
-        if (data.is_running) {
-            dot.textContent = '🟢';
-            
-            // Erweiterte Status-Info mit Uptime und Memory
-            let statusText = `Status: Läuft (PID: ${data.pid})`;
-            if (data.uptime_formatted) {
-                statusText += ` | Uptime: ${data.uptime_formatted}`;
-            }
-            if (data.memory_mb) {
-                statusText += ` | RAM: ${data.memory_mb} MB`;
-            }
-            if (data.last_activity) {
-                statusText += ` | Letzter Scan: ${data.last_activity}`;
-            }
-            
-            status.textContent = statusText;
-            startBtn.disabled = true;
-            stopBtn.disabled = false;
-        } else {
-            dot.textContent = '🔴';
-            status.textContent = 'Status: Gestoppt';
-            startBtn.disabled = false;
-            stopBtn.disabled = true;
+        // Erweiterte Status-Info mit Uptime und Memory
+        let statusText = `Status: Läuft (PID: ${data.pid})`;
+        if (data.uptime_formatted) {
+            statusText += ` | Uptime: ${data.uptime_formatted}`;
         }
-        
-        // Timer Status
-        const timerStatus = document.getElementById('timer-status');
-        if (data.timer && data.timer.timer_active) {
-            timerStatus.textContent = `⏰ Timer aktiv: ${data.timer.remaining_minutes} Min verbleibend`;
-            timerStatus.style.color = '#f59e0b';
-        } else {
-            timerStatus.textContent = 'Kein Timer aktiv';
-            timerStatus.style.color = 'var(--text-muted)';
+        if (data.memory_mb) {
+            statusText += ` | RAM: ${data.memory_mb} MB`;
         }
-        
-        // Auto-Stopped Notification
-        if (data.timer && data.timer.auto_stopped) {
-            alert('⏰ Timer abgelaufen - Bot wurde automatisch gestoppt!');
+        if (data.last_activity) {
+            statusText += ` | Letzter Scan: ${data.last_activity}`;
         }
         
-    } catch (error) {
-        console.error('Fehler beim Laden des Bot-Status:', error);
+        status.textContent = statusText;
+        startBtn.disabled = true;
+        stopBtn.disabled = false;
+    } else {
+        dot.textContent = '🔴';
+        status.textContent = 'Status: Gestoppt';
+        startBtn.disabled = false;
+        stopBtn.disabled = true;
+    }
+    
+    // Timer Status
+    const timerStatus = document.getElementById('timer-status');
+    if (data.timer && data.timer.timer_active) {
+        timerStatus.textContent = `⏰ Timer aktiv: ${data.timer.remaining_minutes} Min verbleibend`;
+        timerStatus.style.color = '#f59e0b';
+    } else {
+        timerStatus.textContent = 'Kein Timer aktiv';
+        timerStatus.style.color = 'var(--text-muted)';
+    }
+    
+    // Auto-Stopped Notification
+    if (data.timer && data.timer.auto_stopped) {
+        alert('⏰ Timer abgelaufen - Bot wurde automatisch gestoppt!');
     }
 }
 
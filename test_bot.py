@@ -62,7 +62,7 @@ def test_scout():
         
         if pairs:
             pair = pairs[0]
-            logger.info(f"  Beispiel Pair: {pair['symbol']} | Liq: ${pair['liquidity_usd']:,.0f}")
+            logger.info(f"  Beispiel Pair: {pair.symbol} | Liq: ${pair.liquidity_usd:,.0f}")
         
         logger.info("✅ Scout funktioniert\n")
         return True
@@ -80,6 +80,7 @@ def test_analyst():
     
     try:
         from modules.analyst import Analyst
+        from modules.pair import Pair
         
         # Prüfe ob API Key gesetzt
         import config
@@ -93,20 +94,20 @@ def test_analyst():
         logger.info(f"  Model: {analyst.model}")
         
         # Teste mit Mock Data
-        mock_pairs = [{
-            'contract_address': 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
-            'symbol': 'TEST',
-            'name': 'Test Token',
-            'liquidity_usd': 50000,
-            'volume_24h': 100000,
-            'price_usd': 0.001,
-            'price_change_24h': 5.0,
-            'market_cap': 1000000,
-            'pair_address': 'test',
-            'dex': 'raydium',
-            'created_at': None,
-            'url': ''
-        }]
+        mock_pairs = [Pair(
+            contract_address='EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',
+            symbol='TEST',
+            name='Test Token',
+            liquidity_usd=50000,
+            volume_24h=100000,
+            price_usd=0.001,
+            price_change_24h=5.0,
+            market_cap=1000000,
+            pair_address='test',
+            dex='raydium',
+            created_at=None,
+            url=''
+        )]
         
         logger.info("  Note: Echter LLM Call wird NICHT ausgeführt (spart API Kosten)")
         
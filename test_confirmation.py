@@ -0,0 +1,63 @@
+"""
+Tests für modules/confirmation.py
+Ablauf ausstehender Signaturen bei ausgefallenem RPC (Stub, ohne Netzwerk)
+
+    python -m pytest test_confirmation.py
+"""
+
+from types import SimpleNamespace
+
+from solders.signature import Signature
+
+from modules.confirmation import ConfirmationTracker
+
+
+class StatusesDownRpc:
+    """RPC-Stub: getSignatureStatuses schlägt immer fehl, die Block Height läuft weiter"""
+
+    def __init__(self, block_height: int = 1_000):
+        self.block_height = block_height
+        self.status_calls = 0
+
+    def get_signature_statuses(self, signatures):
+        self.status_calls += 1
+        raise ConnectionError('RPC nicht erreichbar')
+
+    def get_block_height(self):
+        return SimpleNamespace(value=self.block_height)
+
+
+def test_unavailable_status_still_expires_after_timeout():
+    rpc = StatusesDownRpc()
+    tracker = ConfirmationTracker(rpc, poll_interval=0.01, timeout=0.1)
+
+    try:
+        future = tracker.track(Signature.new_unique())
+        result = future.result(timeout=5)
+    finally:
+        tracker.stop()
+
+    assert result['status'] == 'expired'
+    assert result['confirmed'] is False
+    assert 'Timeout' in result['error']
+    assert rpc.status_calls > 0
+
+
+def test_unavailable_status_ignores_blockhash_expiry():
+    """Ohne Status darf eine überschrittene Block Height allein nicht zum Ablauf führen"""
+    rpc = StatusesDownRpc(block_height=1_000)
+    tracker = ConfirmationTracker(rpc, poll_interval=0.01, timeout=60)
+    future = tracker.track(Signature.new_unique(), last_valid_block_height=500)
+
+    try:
+        tracker._poll()
+        assert not future.done()
+        assert tracker.pending_count() == 1
+    finally:
+        tracker.stop()
+
+
+if __name__ == '__main__':
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, '-q']))
@@ -0,0 +1,139 @@
+"""
+Tests für modules/holdings.py
+Fills aus pre/postTokenBalances und der In-Memory Holdings-Index (ohne RPC)
+
+    python -m pytest test_holdings.py
+"""
+
+from types import SimpleNamespace
+
+from modules.holdings import WalletHoldings, sol_change_from_meta, token_fill_from_meta
+
+WALLET = 'Wa11et1111111111111111111111111111111111111'
+OTHER_OWNER = 'Poo1Vau1t111111111111111111111111111111111'
+MINT = 'M1nt111111111111111111111111111111111111111'
+OTHER_MINT = 'So11111111111111111111111111111111111111112'
+
+
+def token_balance(mint: str, owner: str, amount: int, decimals: int = 6):
+    """Nachbau von UiTransactionTokenBalance (nur die gelesenen Felder)"""
+    return SimpleNamespace(
+        mint=mint,
+        owner=owner,
+        ui_token_amount=SimpleNamespace(amount=str(amount), decimals=decimals)
+    )
+
+
+def transaction_meta(pre_token_balances=None, post_token_balances=None, pre_balances=None, post_balances=None):
+    """Nachbau von UiTransactionStatusMeta"""
+    return SimpleNamespace(
+        pre_token_balances=pre_token_balances or [],
+        post_token_balances=post_token_balances or [],
+        pre_balances=pre_balances or [],
+        post_balances=post_balances or []
+    )
+
+
+# ============================================================================
+# token_fill_from_meta
+# ============================================================================
+
+def test_buy_creates_token_account():
+    """Kauf mit neu angelegtem ATA: kein pre-Eintrag, gesamter post-Bestand ist der Fill"""
+    meta = transaction_meta(post_token_balances=[token_balance(MINT, WALLET, 1_500_000)])
+
+    fill = token_fill_from_meta(meta, WALLET, MINT)
+
+    assert fill == {'amount': 1_500_000, 'decimals': 6, 'post_amount': 1_500_000}
+
+
+def test_full_sell_closes_token_account():
+    """Voller Verkauf: ATA wird geschlossen, decimals kommen aus dem pre-Eintrag"""
+    meta = transaction_meta(pre_token_balances=[token_balance(MINT, WALLET, 2_000_000, decimals=9)])
+
+    fill = token_fill_from_meta(meta, WALLET, MINT)
+
+    assert fill == {'amount': -2_000_000, 'decimals': 9, 'post_amount': 0}
+
+
+def test_full_sell_keeps_empty_token_account():
+    """Voller Verkauf mit bestehendem (leerem) ATA"""
+    meta = transaction_meta(
+        pre_token_balances=[token_balance(MINT, WALLET, 2_000_000)],
+        post_token_balances=[token_balance(MINT, WALLET, 0)]
+    )
+
+    fill = token_fill_from_meta(meta, WALLET, MINT)
+
+    assert fill['amount'] == -2_000_000
+    assert fill['post_amount'] == 0
+
+
+def test_foreign_owner_on_same_mint_is_ignored():
+    """Pool Vault mit demselben Mint darf den Fill des Wallets nicht verfälschen"""
+    meta = transaction_meta(
+        pre_token_balances=[
+            token_balance(MINT, OTHER_OWNER, 900_000_000),
+            token_balance(OTHER_MINT, WALLET, 5_000_000_000, decimals=9)
+        ],
+        post_token_balances=[
+            token_balance(MINT, OTHER_OWNER, 898_500_000),
+            token_balance(MINT, WALLET, 1_500_000)
+        ]
+    )
+
+    fill = token_fill_from_meta(meta, WALLET, MINT)
+
+    assert fill == {'amount': 1_500_000, 'decimals': 6, 'post_amount': 1_500_000}
+
+
+def test_mint_not_in_transaction():
+    meta = transaction_meta(post_token_balances=[token_balance(MINT, OTHER_OWNER, 1)])
+
+    assert token_fill_from_meta(meta, WALLET, MINT) is None
+
+
+# ============================================================================
+# sol_change_from_meta
+# ============================================================================
+
+def test_sol_change_of_fee_payer():
+    """SOL-Erlös eines Verkaufs netto nach Fee (Account Index 0 = Wallet)"""
+    meta = transaction_meta(pre_balances=[1_000_000_000, 50], post_balances=[1_249_995_000, 50])
+
+    assert sol_change_from_meta(meta) == 249_995_000
+
+
+def test_sol_change_without_balances():
+    assert sol_change_from_meta(transaction_meta()) is None
+
+
+# ============================================================================
+# WalletHoldings
+# ============================================================================
+
+def test_holdings_set_and_get():
+    holdings = WalletHoldings()
+    holdings.set(MINT, 1_500_000, 6)
+
+    assert holdings.get(MINT) == {'amount': 1_500_000, 'ui_amount': 1.5, 'decimals': 6}
+    assert holdings.get(OTHER_MINT) is None
+
+
+def test_holdings_full_sell_removes_entry():
+    """post_amount 0 nach vollem Verkauf -> Bestand gilt als unbekannt, nicht als 0 gecacht"""
+    holdings = WalletHoldings()
+    holdings.set(MINT, 1_500_000, 6)
+
+    fill = token_fill_from_meta(
+        transaction_meta(pre_token_balances=[token_balance(MINT, WALLET, 1_500_000)]), WALLET, MINT
+    )
+    holdings.set(MINT, fill['post_amount'], fill['decimals'])
+
+    assert holdings.get(MINT) is None
+
+
+if __name__ == '__main__':
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, '-q']))
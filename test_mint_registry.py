@@ -0,0 +1,118 @@
+"""
+Tests für modules/mint_registry.py
+Dauerhafte Verdicts (Authorities deaktiviert) vs. TTL-Einträge (Authority aktiv)
+
+    python -m pytest test_mint_registry.py
+"""
+
+import json
+
+import modules.mint_registry as mint_registry_module
+from modules.mint_registry import MintRegistry
+
+SAFE_MINT = 'Safe111111111111111111111111111111111111111'
+RISKY_MINT = 'Risky11111111111111111111111111111111111111'
+AUTHORITY = 'Auth1111111111111111111111111111111111111111'
+TTL = 60
+
+
+def check_result(mint_authority=None, freeze_authority=None, decimals=6):
+    """Ergebnis wie von SecurityChecker.check_tokens() / evaluate_mint()"""
+    safe = mint_authority is None and freeze_authority is None
+
+    return {
+        'safe': safe,
+        'reason': None if safe else f"Mint Authority aktiv ({mint_authority})",
+        'mint': {
+            'mint_authority': mint_authority,
+            'freeze_authority': freeze_authority,
+            'supply': 1_000_000,
+            'decimals': decimals,
+            'is_initialized': True
+        }
+    }
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def registry_with_clock(tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(mint_registry_module.time, 'time', clock)
+    return MintRegistry(tmp_path / 'mint_registry.json', ttl=TTL), clock
+
+
+def test_revoked_authorities_are_permanent(tmp_path, monkeypatch):
+    registry, clock = registry_with_clock(tmp_path, monkeypatch)
+    registry.record_checks({SAFE_MINT: check_result()})
+
+    clock.now += TTL * 100
+
+    verdict = registry.get_verdict(SAFE_MINT)
+    assert verdict['safe'] is True
+    assert verdict['mint']['decimals'] == 6
+
+
+def test_active_authority_expires_after_ttl(tmp_path, monkeypatch):
+    registry, clock = registry_with_clock(tmp_path, monkeypatch)
+    registry.record_checks({RISKY_MINT: check_result(mint_authority=AUTHORITY)})
+
+    clock.now += TTL - 1
+    assert registry.get_verdict(RISKY_MINT)['safe'] is False
+
+    clock.now += 2
+    assert registry.get_verdict(RISKY_MINT) is None
+    # Decimals ändern sich nie und bleiben auch nach Ablauf des Verdicts gültig
+    assert registry.get_decimals(RISKY_MINT) == 6
+
+
+def test_revoke_after_recheck_becomes_permanent(tmp_path, monkeypatch):
+    registry, clock = registry_with_clock(tmp_path, monkeypatch)
+    registry.record_checks({RISKY_MINT: check_result(mint_authority=AUTHORITY)})
+
+    clock.now += TTL + 1
+    registry.record_checks({RISKY_MINT: check_result()})
+
+    clock.now += TTL * 100
+    assert registry.get_verdict(RISKY_MINT)['safe'] is True
+
+
+def test_failed_checks_are_not_cached(tmp_path, monkeypatch):
+    registry, _ = registry_with_clock(tmp_path, monkeypatch)
+    registry.record_checks({SAFE_MINT: {'safe': False, 'reason': 'RPC Fehler', 'mint': None}})
+
+    assert registry.get_verdict(SAFE_MINT) is None
+    assert not (tmp_path / 'mint_registry.json').exists()
+
+
+def test_entries_survive_restart(tmp_path, monkeypatch):
+    registry, _ = registry_with_clock(tmp_path, monkeypatch)
+    registry.record_checks({SAFE_MINT: check_result()})
+    registry.record_decimals(RISKY_MINT, 9)
+
+    reloaded = MintRegistry(tmp_path / 'mint_registry.json', ttl=TTL)
+
+    assert reloaded.get_verdict(SAFE_MINT)['safe'] is True
+    assert reloaded.get_decimals(RISKY_MINT) == 9
+    assert reloaded.get_verdict(RISKY_MINT) is None
+
+
+def test_unreadable_file_starts_empty(tmp_path):
+    path = tmp_path / 'mint_registry.json'
+    path.write_text('{kaputt')
+
+    assert MintRegistry(path, ttl=TTL).get(SAFE_MINT) is None
+
+    path.write_text(json.dumps({SAFE_MINT: {'decimals': 6}}))
+    assert MintRegistry(path, ttl=TTL).get_decimals(SAFE_MINT) == 6
+
+
+if __name__ == '__main__':
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, '-q']))
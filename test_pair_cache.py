@@ -0,0 +1,128 @@
+"""
+Tests für modules/pair_cache.py
+Schwellen, TTL und Urteile des PairChangeCache (ohne LLM)
+
+    python -m pytest test_pair_cache.py
+"""
+
+import modules.pair_cache as pair_cache_module
+from modules.pair import Pair
+from modules.pair_cache import PairChangeCache
+
+THRESHOLDS = {'liquidity': 10, 'volume': 25, 'price': 10}
+TTL = 1800
+
+
+def make_pair(address: str = 'Mint1', liquidity_usd: float = 50_000, volume_24h: float = 100_000, price_usd: float = 0.001) -> Pair:
+    return Pair(
+        contract_address=address,
+        symbol=address.upper(),
+        name=address,
+        liquidity_usd=liquidity_usd,
+        volume_24h=volume_24h,
+        price_usd=price_usd,
+        price_change_24h=0.0,
+        market_cap=1_000_000,
+        pair_address=f'{address}-pool',
+        dex='raydium',
+        created_at=None
+    )
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def cache_with_clock(monkeypatch, ttl: float = TTL):
+    clock = FakeClock()
+    monkeypatch.setattr(pair_cache_module.time, 'monotonic', clock)
+    return PairChangeCache(THRESHOLDS, ttl=ttl), clock
+
+
+def test_new_pairs_are_forwarded(monkeypatch):
+    cache, _ = cache_with_clock(monkeypatch)
+    pairs = [make_pair('a'), make_pair('b')]
+
+    assert cache.filter_changed(pairs) == pairs
+
+
+def test_unchanged_pass_is_skipped(monkeypatch):
+    cache, _ = cache_with_clock(monkeypatch)
+    pair = make_pair()
+    cache.record([pair])
+
+    assert cache.filter_changed([pair]) == []
+
+    stats = cache.get_stats()
+    assert stats['skipped'] == 1
+    assert stats['analyses_skipped'] == 1
+
+
+def test_moves_below_threshold_are_skipped(monkeypatch):
+    cache, _ = cache_with_clock(monkeypatch)
+    cache.record([make_pair()])
+
+    moved = make_pair(liquidity_usd=50_000 * 1.09, volume_24h=100_000 * 0.8, price_usd=0.001 * 1.05)
+
+    assert cache.filter_changed([moved]) == []
+
+
+def test_each_threshold_triggers_reanalysis(monkeypatch):
+    cache, _ = cache_with_clock(monkeypatch)
+    cache.record([make_pair()])
+
+    for moved in (
+        make_pair(liquidity_usd=55_000),
+        make_pair(volume_24h=75_000),
+        make_pair(price_usd=0.0009)
+    ):
+        assert cache.filter_changed([moved]) == [moved]
+
+
+def test_ttl_expires_pass(monkeypatch):
+    cache, clock = cache_with_clock(monkeypatch)
+    pair = make_pair()
+    cache.record([pair])
+
+    clock.now += TTL - 1
+    assert cache.filter_changed([pair]) == []
+
+    clock.now += 1
+    assert cache.filter_changed([pair]) == [pair]
+    assert cache.get_stats()['cached'] == 0
+
+
+def test_unrecorded_pairs_are_forwarded(monkeypatch):
+    """Nur Pairs aus einem PASS werden übersprungen - alle anderen gehen erneut an das LLM"""
+    cache, _ = cache_with_clock(monkeypatch)
+    passed, other = make_pair('a'), make_pair('b')
+    cache.record([passed])
+
+    assert cache.filter_changed([passed, other]) == [other]
+
+
+def test_zero_ttl_disables_cache(monkeypatch):
+    cache, _ = cache_with_clock(monkeypatch, ttl=0)
+    pair = make_pair()
+    cache.record([pair])
+
+    assert cache.filter_changed([pair]) == [pair]
+
+
+def test_zero_snapshot_metric_forces_reanalysis(monkeypatch):
+    """Ohne Basiswert (0) ist keine relative Änderung berechenbar"""
+    cache, _ = cache_with_clock(monkeypatch)
+    pair = make_pair(price_usd=0.0)
+    cache.record([pair])
+
+    assert cache.filter_changed([pair]) == [pair]
+
+
+if __name__ == '__main__':
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, '-q']))
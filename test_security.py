@@ -0,0 +1,118 @@
+"""
+Tests für modules/security.py
+Dekodierung und Bewertung von SPL Token Mint Accounts (82 Bytes, ohne RPC)
+
+    python -m pytest test_security.py
+"""
+
+import base58
+
+from modules.security import MINT_ACCOUNT_SIZE, decode_mint_account, evaluate_mint
+
+MINT_AUTHORITY = bytes(range(1, 33))
+FREEZE_AUTHORITY = bytes(range(101, 133))
+
+
+def mint_layout(
+    mint_authority: bytes = None,
+    freeze_authority: bytes = None,
+    supply: int = 1_000_000_000_000,
+    decimals: int = 6,
+    is_initialized: bool = True
+) -> bytes:
+    """Baut die Rohdaten eines SPL Token Mint Accounts (COption = u32 Tag + 32 Bytes Pubkey)"""
+    def coption(pubkey):
+        return (1 if pubkey else 0).to_bytes(4, 'little') + (pubkey or bytes(32))
+
+    data = (
+        coption(mint_authority)
+        + supply.to_bytes(8, 'little')
+        + bytes([decimals, int(is_initialized)])
+        + coption(freeze_authority)
+    )
+    assert len(data) == MINT_ACCOUNT_SIZE
+    return data
+
+
+# ============================================================================
+# decode_mint_account
+# ============================================================================
+
+def test_decode_without_authorities():
+    mint = decode_mint_account(mint_layout(supply=42, decimals=9))
+
+    assert mint == {
+        'mint_authority': None,
+        'supply': 42,
+        'decimals': 9,
+        'is_initialized': True,
+        'freeze_authority': None
+    }
+
+
+def test_decode_with_authorities():
+    mint = decode_mint_account(mint_layout(MINT_AUTHORITY, FREEZE_AUTHORITY))
+
+    assert mint['mint_authority'] == base58.b58encode(MINT_AUTHORITY).decode('ascii')
+    assert mint['freeze_authority'] == base58.b58encode(FREEZE_AUTHORITY).decode('ascii')
+
+
+def test_decode_ignores_stale_pubkey_bytes_when_option_is_none():
+    """Nach dem Revoke bleibt der alte Pubkey im Account stehen - nur das Option-Tag zählt"""
+    data = bytearray(mint_layout(MINT_AUTHORITY, FREEZE_AUTHORITY))
+    data[0:4] = bytes(4)
+    data[46:50] = bytes(4)
+
+    mint = decode_mint_account(bytes(data))
+
+    assert mint['mint_authority'] is None
+    assert mint['freeze_authority'] is None
+
+
+def test_decode_token_2022_mint_with_extensions():
+    """Token-2022 Mints sind länger, die ersten 82 Bytes haben dasselbe Layout"""
+    mint = decode_mint_account(mint_layout(decimals=2) + bytes(100))
+
+    assert mint['decimals'] == 2
+
+
+def test_decode_invalid_data():
+    assert decode_mint_account(None) is None
+    assert decode_mint_account(mint_layout()[:MINT_ACCOUNT_SIZE - 1]) is None
+
+
+# ============================================================================
+# evaluate_mint
+# ============================================================================
+
+def test_evaluate_revoked_authorities_is_safe():
+    result = evaluate_mint(decode_mint_account(mint_layout()))
+
+    assert result['safe'] is True
+    assert result['reason'] is None
+
+
+def test_evaluate_active_mint_authority():
+    result = evaluate_mint(decode_mint_account(mint_layout(mint_authority=MINT_AUTHORITY)))
+
+    assert result['safe'] is False
+    assert result['reason'].startswith('Mint Authority aktiv')
+
+
+def test_evaluate_active_freeze_authority():
+    result = evaluate_mint(decode_mint_account(mint_layout(freeze_authority=FREEZE_AUTHORITY)))
+
+    assert result['safe'] is False
+    assert result['reason'].startswith('Freeze Authority aktiv')
+
+
+def test_evaluate_missing_account():
+    result = evaluate_mint(None)
+
+    assert result == {'safe': False, 'reason': 'Kein gültiger Mint Account', 'mint': None}
+
+
+if __name__ == '__main__':
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, '-q']))
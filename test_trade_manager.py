@@ -0,0 +1,66 @@
+"""
+Tests für modules/trade_manager.py
+Konstruktion ohne Seiteneffekte und Read-Only Zugriff des Monitorings
+
+    python -m pytest test_trade_manager.py
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from modules.storage import create_storage
+from modules.trade_manager import TradeManager
+
+
+def test_read_only_manager_creates_no_database(tmp_path):
+    """Monitoring gegen eine (noch) fehlende memero.db darf keine Datei anlegen"""
+    manager = TradeManager(storage=create_storage('sqlite', tmp_path, read_only=True), read_only=True)
+
+    assert manager.get_recent_trades(10) == []
+    assert manager.load_positions() == {}
+    manager.get_stats()
+    manager.close()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_read_only_manager_reads_bot_database(tmp_path):
+    writer = create_storage('sqlite', tmp_path)
+    writer.append_trade({'timestamp': '2026-01-01T00:00:00', 'type': 'BUY', 'symbol': 'TEST'})
+
+    manager = TradeManager(storage=create_storage('sqlite', tmp_path, read_only=True), read_only=True)
+
+    assert [trade['symbol'] for trade in manager.get_recent_trades(10)] == ['TEST']
+
+
+def test_construction_opens_no_storage(tmp_path):
+    """Dateien entstehen erst mit prepare() bzw. dem ersten Trade"""
+    for backend in ('sqlite', 'json'):
+        TradeManager(storage=create_storage(backend, tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_import_builds_no_singleton():
+    """Der Import (z.B. durch monitoring/data_reader.py) erzeugt keine Read-Write Instanz"""
+    code = (
+        "import modules.trade_manager as tm\n"
+        "from modules.trade_manager import TradeManager\n"
+        "assert tm._trade_manager is None\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=Path(__file__).parent,
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+if __name__ == '__main__':
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, '-q']))